@@ -458,5 +458,37 @@ class TestApiClient(unittest.TestCase):
         mock_token_manager.load_token.assert_called_once()
         mock_post.assert_not_called() # Ensure no API call was attempted
 
+    @patch('librarian_assistant.api_client.requests.post')
+    def test_raw_response_not_formatted_unless_debug_logged(self, mock_post):
+        """
+        Tests that the raw response is only rendered to a string when DEBUG logging is on.
+        """
+        import logging
+        from librarian_assistant.api_client import ApiClient, logger as api_logger
+        from librarian_assistant.config_manager import ConfigManager
+
+        class CountingDict(dict):
+            renders = 0
+            def __repr__(self):
+                CountingDict.renders += 1
+                return super().__repr__()
+            __str__ = __repr__
+
+        mock_token_manager = MagicMock(spec=ConfigManager)
+        mock_token_manager.load_token.return_value = "Bearer test_bearer_token"
+        client = ApiClient(base_url="https://api.hardcover.app/v1/graphql", token_manager=mock_token_manager)
+        mock_response = MagicMock(spec=requests.Response)
+        mock_response.status_code = 200
+        mock_response.json.return_value = CountingDict(data={"books": [{"id": 1}]})
+        mock_post.return_value = mock_response
+
+        with patch.object(api_logger, 'isEnabledFor', return_value=False):
+            self.assertEqual(client.get_book_by_id(1), {"id": 1})
+        self.assertEqual(CountingDict.renders, 0)
+
+        with self.assertLogs(api_logger, level=logging.DEBUG):
+            client.get_book_by_id(1)
+        self.assertEqual(CountingDict.renders, 1)
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -3,9 +3,16 @@
 import unittest
 from unittest.mock import patch
 from PyQt5.QtWidgets import QApplication, QCheckBox, QLabel, QGroupBox
+from PyQt5.QtCore import QThreadPool
 from librarian_assistant.main import MainWindow
 
 
+def wait_for_fetch():
+    """Let a background book fetch finish and deliver its result to the window."""
+    QThreadPool.globalInstance().waitForDone()
+    QApplication.processEvents()
+
+
 class TestBookMappingsCheckbox(unittest.TestCase):
     """Test the book mappings checkbox functionality."""
     
@@ -61,6 +68,7 @@ class TestBookMappingsCheckbox(unittest.TestCase):
         with patch.object(self.window.api_client, 'get_book_by_id', return_value=self.mock_book_data):
             self.window.book_id_line_edit.setText("123")
             self.window._on_fetch_data_clicked()
+            wait_for_fetch()
         
         # Check that Select column is present
         headers = []
@@ -78,6 +86,7 @@ class TestBookMappingsCheckbox(unittest.TestCase):
         with patch.object(self.window.api_client, 'get_book_by_id', return_value=self.mock_book_data):
             self.window.book_id_line_edit.setText("123")
             self.window._on_fetch_data_clicked()
+            wait_for_fetch()
         
         # Check that each row has a checkbox widget
         for row in range(self.window.editions_table_widget.rowCount()):
@@ -94,6 +103,7 @@ class TestBookMappingsCheckbox(unittest.TestCase):
         with patch.object(self.window.api_client, 'get_book_by_id', return_value=self.mock_book_data):
             self.window.book_id_line_edit.setText("123")
             self.window._on_fetch_data_clicked()
+            wait_for_fetch()
         
         # Simulate clicking the Select header
         header = self.window.editions_table_widget.horizontalHeader()
@@ -151,6 +161,7 @@ class TestBookMappingsCheckbox(unittest.TestCase):
         with patch.object(self.window.api_client, 'get_book_by_id', return_value=self.mock_book_data):
             self.window.book_id_line_edit.setText("123")
             self.window._on_fetch_data_clicked()
+            wait_for_fetch()
         
         # Check the first edition
         widget = self.window.editions_table_widget.cellWidget(0, 0)
@@ -168,6 +179,7 @@ class TestBookMappingsCheckbox(unittest.TestCase):
         with patch.object(self.window.api_client, 'get_book_by_id', return_value=self.mock_book_data):
             self.window.book_id_line_edit.setText("123")
             self.window._on_fetch_data_clicked()
+            wait_for_fetch()
         
         # Check the first edition
         widget = self.window.editions_table_widget.cellWidget(0, 0)
@@ -212,6 +224,7 @@ class TestBookMappingsCheckbox(unittest.TestCase):
         with patch.object(self.window.api_client, 'get_book_by_id', return_value=self.mock_book_data):
             self.window.book_id_line_edit.setText("123")
             self.window._on_fetch_data_clicked()
+            wait_for_fetch()
         
         # Check the first edition
         widget = self.window.editions_table_widget.cellWidget(0, 0)
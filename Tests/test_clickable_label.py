@@ -1,7 +1,7 @@
 # ABOUTME: This file contains unit tests for the ClickableLabel widget.
 # ABOUTME: It tests clickable functionality, link activation, and non-clickable state handling.
 import unittest
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 from PyQt5.QtWidgets import QApplication
 from PyQt5.QtCore import Qt
 import sys
@@ -144,5 +144,26 @@ class TestClickableLabel(unittest.TestCase):
         self.assertEqual(self.label.toolTip(), "Open: https://example.com/book-3")
 
 
+    def test_set_content_escapes_html(self):
+        """Test that prefix, value and URL are HTML-escaped."""
+        self.label.setContent("A&B: ", "<b>x</b>", "https://example.com/?a=1&b='2'")
+
+        self.assertEqual(
+            self.label.text(),
+            "<span style='color:#999999;'>A&amp;B: </span>"
+            "<a href='https://example.com/?a=1&amp;b=&#x27;2&#x27;' "
+            "style='color:#9f7aea; text-decoration:underline;'>&lt;b&gt;x&lt;/b&gt;</a>"
+        )
+
+    def test_repeated_link_content_skips_cursor_updates(self):
+        """Test that the cursor is only set when the label switches between link and plain text."""
+        self.label.setContent("Slug: ", "book-1", "https://example.com/book-1")
+        with patch.object(self.label, 'setCursor') as mock_set_cursor:
+            self.label.setContent("Slug: ", "book-2", "https://example.com/book-2")
+            mock_set_cursor.assert_not_called()
+            self.label.setContent("Slug: ", "N/A", "")
+            mock_set_cursor.assert_called_once_with(Qt.ArrowCursor)
+        self.assertEqual(self.label.toolTip(), "")
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -93,4 +93,26 @@ def test_config_manager_save_none_as_token(mocker): # Name was test_config_manag
     # Simulate keyring.get_password returning the string "None" if set_password(..., None) did that
     mocked_keyring_module.get_password.return_value = "None" 
     assert config.load_token() is None, "load_token should convert string 'None' from keyring to Python None."
-    mocked_keyring_module.get_password.assert_called_with(SERVICE_NAME, USERNAME)
\ No newline at end of file
+    mocked_keyring_module.get_password.assert_called_with(SERVICE_NAME, USERNAME)
+def test_config_manager_load_token_cached(mocker):
+    """Tests that the keyring is read once and saved tokens are served from memory."""
+    mocked_keyring_module = mocker.patch('librarian_assistant.config_manager.keyring')
+    mocked_keyring_module.get_password.return_value = "stored_token"
+    config = ConfigManager()
+
+    assert config.load_token() == "stored_token"
+    assert config.load_token() == "stored_token"
+    mocked_keyring_module.get_password.assert_called_once_with(SERVICE_NAME, USERNAME)
+
+    config.save_token("new_token")
+    assert config.load_token() == "new_token"
+    mocked_keyring_module.get_password.assert_called_once()
+
+def test_config_manager_load_token_error_not_cached(mocker):
+    """Tests that a failed keyring read is retried on the next load."""
+    mocked_keyring_module = mocker.patch('librarian_assistant.config_manager.keyring')
+    mocked_keyring_module.get_password.side_effect = [RuntimeError("locked"), "stored_token"]
+    config = ConfigManager()
+
+    assert config.load_token() is None
+    assert config.load_token() == "stored_token"
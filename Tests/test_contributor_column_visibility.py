@@ -99,6 +99,31 @@ class TestContributorColumnVisibility(unittest.TestCase):
         self.assertEqual(max_contributors.get('Author', 0), 1)
         self.assertEqual(max_contributors.get('Cover Artist', 0), 1)
     
+    def test_unlisted_roles_counted_but_not_active(self):
+        """Test that roles outside the predefined list are counted but get no columns."""
+        test_editions = [
+            {
+                'id': 1,
+                'cached_contributors': [
+                    {'contribution': 'Producer', 'author': {'name': 'Producer 1'}},
+                    {'contribution': 'Producer', 'author': {'name': 'Producer 2'}},
+                    {'contribution': 'Narrator', 'author': {'name': 'Narrator 1'}}
+                ]
+            },
+            {
+                'id': 2,
+                'cached_contributors': [
+                    {'contribution': 'Producer', 'author': {'name': 'Producer 3'}}
+                ]
+            }
+        ]
+        
+        result = self.window._process_contributor_data(test_editions)
+        
+        self.assertEqual(result['active_roles'], ['Narrator'])
+        self.assertEqual(result['max_contributors_per_role'], {'Producer': 2, 'Narrator': 1})
+        self.assertEqual(result['contributors_by_edition'][2], {'Producer': ['Producer 3']})
+    
     def tearDown(self):
         """Clean up after tests."""
         self.window.close()
@@ -1,10 +1,16 @@
 # ABOUTME: Tests for the enhanced stylesheet implementation in Phase 8
 # ABOUTME: Verifies that enhanced dark theme is properly applied to all widgets
 
+import os
 import pytest
+from unittest.mock import patch
+from collections.abc import Mapping
 from PyQt5.QtWidgets import QApplication, QPushButton, QLabel, QLineEdit, QTableWidget, QGroupBox
 from PyQt5.QtCore import Qt
-from librarian_assistant.enhanced_stylesheet import ENHANCED_DARK_THEME, SPACING, ELEVATION_SHADOWS
+from librarian_assistant.enhanced_stylesheet import (
+    ENHANCED_DARK_THEME, SPACING, SPACING_MD, ELEVATION_SHADOWS, apply_theme
+)
+from librarian_assistant import enhanced_stylesheet
 
 
 class TestEnhancedStylesheet:
@@ -19,7 +25,7 @@ class TestEnhancedStylesheet:
     def test_spacing_constants_defined(self):
         """Test that spacing constants are properly defined"""
         assert SPACING is not None
-        assert isinstance(SPACING, dict)
+        assert isinstance(SPACING, Mapping)
         assert 'xs' in SPACING
         assert 'sm' in SPACING
         assert 'md' in SPACING
@@ -31,7 +37,7 @@ class TestEnhancedStylesheet:
     def test_elevation_shadows_defined(self):
         """Test that elevation shadow styles are defined"""
         assert ELEVATION_SHADOWS is not None
-        assert isinstance(ELEVATION_SHADOWS, dict)
+        assert isinstance(ELEVATION_SHADOWS, Mapping)
         assert 1 in ELEVATION_SHADOWS
         assert 2 in ELEVATION_SHADOWS
         assert 3 in ELEVATION_SHADOWS
@@ -116,6 +122,30 @@ class TestEnhancedStylesheet:
         assert '.success' in ENHANCED_DARK_THEME
         assert '.clickable-link' in ENHANCED_DARK_THEME
 
+    def test_lookup_tables_read_only(self):
+        """Test that spacing and elevation tables cannot be mutated"""
+        with pytest.raises(TypeError):
+            SPACING['xs'] = 0
+        with pytest.raises(TypeError):
+            ELEVATION_SHADOWS[1] = ""
+        assert SPACING['md'] == SPACING_MD
+
+    def test_theme_loaded_from_qss_resource(self):
+        """Test that the theme is the packaged .qss file rather than a string literal"""
+        qss_path = os.path.join(os.path.dirname(enhanced_stylesheet.__file__),
+                                'resources', enhanced_stylesheet.THEME_RESOURCE)
+        with open(qss_path, 'r', encoding='utf-8') as f:
+            assert f.read() == ENHANCED_DARK_THEME
+
+
+    def test_missing_theme_resource_falls_back(self):
+        """Test that a build without the .qss file starts with the default style instead of failing"""
+        with patch('librarian_assistant.enhanced_stylesheet.resources.files',
+                   side_effect=ModuleNotFoundError("No module named 'librarian_assistant.resources'")):
+            with patch.object(enhanced_stylesheet.logger, 'warning') as mock_warning:
+                assert enhanced_stylesheet._load_theme() == ""
+        mock_warning.assert_called_once()
+
 
 class TestEnhancedStylesheetApplication:
     """Test enhanced stylesheet application on actual widgets"""
@@ -151,4 +181,9 @@ class TestEnhancedStylesheetApplication:
         groupbox = QGroupBox("Test Group")
         
         # The groupbox should exist and be styled
-        assert groupbox is not None
\ No newline at end of file
+        assert groupbox is not None
+
+    def test_apply_theme_sets_application_stylesheet(self, qapp):
+        """Test that apply_theme installs the theme on the application"""
+        apply_theme(qapp)
+        assert qapp.styleSheet() == ENHANCED_DARK_THEME
\ No newline at end of file
@@ -1,10 +1,11 @@
 # ABOUTME: Tests for comprehensive error handling implementation
 # ABOUTME: Verifies all error scenarios from spec.md section 5.2 are properly handled
 
+import logging
 import pytest
 from unittest.mock import Mock, patch
 from PyQt5.QtWidgets import QApplication, QMessageBox
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import Qt, QThreadPool
 from PyQt5.QtTest import QTest
 
 from librarian_assistant.main import MainWindow
@@ -14,6 +15,17 @@ from librarian_assistant.exceptions import (
 )
 
 
+def wait_for_fetch():
+    """Let a background book fetch finish and deliver its result to the window."""
+    QThreadPool.globalInstance().waitForDone()
+    QApplication.processEvents()
+
+
+def logged_levels(mock_logger):
+    """Return the levels passed to logger.log on a patched module logger, in call order."""
+    return [c.args[0] for c in mock_logger.log.call_args_list]
+
+
 class TestErrorHandling:
     """Test comprehensive error handling for all scenarios in spec.md 5.2"""
     
@@ -27,6 +39,7 @@ class TestErrorHandling:
         
         # Try to fetch
         QTest.mouseClick(main_window.fetch_data_button, Qt.LeftButton)
+        wait_for_fetch()
         
         # Check status bar message
         expected_msg = "Please enter a valid numerical Book ID."
@@ -45,6 +58,7 @@ class TestErrorHandling:
             # Set valid book ID and fetch
             main_window.book_id_line_edit.setText("99999")
             QTest.mouseClick(main_window.fetch_data_button, Qt.LeftButton)
+            wait_for_fetch()
             
             # Check status bar message
             expected_msg = "Book ID 99999 not found."
@@ -63,6 +77,7 @@ class TestErrorHandling:
             # Try to fetch without token
             main_window.book_id_line_edit.setText("123")
             QTest.mouseClick(main_window.fetch_data_button, Qt.LeftButton)
+            wait_for_fetch()
             
             # Check status bar message
             expected_msg = "API Bearer Token not set. Please set it via the 'Set/Update Token' button."
@@ -82,6 +97,7 @@ class TestErrorHandling:
                 main_window._update_token_display()
                 main_window.book_id_line_edit.setText("123")
                 QTest.mouseClick(main_window.fetch_data_button, Qt.LeftButton)
+                wait_for_fetch()
                 
                 # Check status bar message
                 expected_msg = "API Authentication Failed. Please check your Bearer Token."
@@ -99,6 +115,7 @@ class TestErrorHandling:
             # Try to fetch
             main_window.book_id_line_edit.setText("123")
             QTest.mouseClick(main_window.fetch_data_button, Qt.LeftButton)
+            wait_for_fetch()
             
             # Check status bar message
             expected_msg = "Network error. Unable to connect to Hardcover.app API. Please check your internet connection."
@@ -124,6 +141,7 @@ class TestErrorHandling:
             # Try to fetch
             main_window.book_id_line_edit.setText("123")
             QTest.mouseClick(main_window.fetch_data_button, Qt.LeftButton)
+            wait_for_fetch()
             
             # Check status bar message
             expected_msg = "API rate limit exceeded. Please try again later."
@@ -143,6 +161,7 @@ class TestErrorHandling:
                 # Try to fetch
                 main_window.book_id_line_edit.setText("123")
                 QTest.mouseClick(main_window.fetch_data_button, Qt.LeftButton)
+                wait_for_fetch()
                 
                 # Check that detailed error dialog was shown
                 mock_msgbox.assert_called_once()
@@ -169,15 +188,13 @@ class TestErrorHandling:
                     
     def test_failed_token_retrieval_error(self, qapp):
         """Test that failed token retrieval shows proper error message"""
-        main_window = MainWindow()
-        
         # Mock config manager load_token to raise exception
-        with patch.object(main_window.config_manager, 'load_token') as mock_load:
+        with patch('librarian_assistant.main.ConfigManager.load_token') as mock_load:
             mock_load.side_effect = Exception("Keyring unavailable")
             
-            # Trigger token display update which tries to load token
+            # The window loads the token for its display while starting up
+            main_window = MainWindow()
             main_window.show()
-            main_window._update_token_display()
             
             # Check status bar message
             expected_msg = "Error loading API token. Please try setting it again."
@@ -190,8 +207,8 @@ class TestErrorHandling:
         
         # Check if history manager exists
         if main_window.history_manager:
-            # Mock history manager add_search to raise exception
-            with patch.object(main_window.history_manager, 'add_search') as mock_add:
+            # Mock history manager add_searches to raise exception
+            with patch.object(main_window.history_manager, 'add_searches') as mock_add:
                 mock_add.side_effect = Exception("Permission denied")
                 
                 # Mock successful API call
@@ -209,6 +226,9 @@ class TestErrorHandling:
                         # Fetch book (which tries to save to history)
                         main_window.book_id_line_edit.setText("123")
                         QTest.mouseClick(main_window.fetch_data_button, Qt.LeftButton)
+                        wait_for_fetch()
+                        # History is recorded once the event loop is idle
+                        QApplication.processEvents()
                         
                         # Check status bar shows error but app continues
                         assert "Error saving search history" in main_window.status_bar.currentMessage()
@@ -228,9 +248,11 @@ class TestErrorHandling:
             # Switch to history tab
             main_window.tab_widget.setCurrentIndex(1)
             
-            # Check that error is logged but app continues
-            # The history manager will be None in this case
-            assert main_window.history_manager is None
+            # History is read lazily, so the manager is still created and the
+            # failure surfaces as a status message once the tab is shown
+            assert main_window.history_manager is not None
+            assert "Error loading search history" in main_window.status_bar.currentMessage()
+            assert main_window.history_list.rowCount() == 0
             
     def test_general_exception_handling(self, qapp):
         """Test that general exceptions are caught and show user-friendly error"""
@@ -246,6 +268,7 @@ class TestErrorHandling:
                 # Try to fetch
                 main_window.book_id_line_edit.setText("123")
                 QTest.mouseClick(main_window.fetch_data_button, Qt.LeftButton)
+                wait_for_fetch()
                 
                 # Check that error dialog was shown
                 mock_msgbox.assert_called_once()
@@ -264,18 +287,29 @@ class TestErrorHandling:
             # Instead, let's test with an empty book ID which will log a warning
             main_window.book_id_line_edit.setText("")
             QTest.mouseClick(main_window.fetch_data_button, Qt.LeftButton)
-            mock_logger.warning.assert_called()
+            wait_for_fetch()
+            assert logged_levels(mock_logger) == [logging.WARNING]
             
             # 2. Book not found - should log as warning
             with patch.object(main_window.api_client, 'get_book_by_id') as mock_get:
                 mock_get.side_effect = ApiNotFoundError(999, "Not found")
                 main_window.book_id_line_edit.setText("999")
                 QTest.mouseClick(main_window.fetch_data_button, Qt.LeftButton)
-                mock_logger.warning.assert_called()
+                wait_for_fetch()
+                assert logged_levels(mock_logger)[-1] == logging.WARNING
                 
             # 3. Network error - should log as error
             with patch.object(main_window.api_client, 'get_book_by_id') as mock_get:
                 mock_get.side_effect = NetworkError("Connection failed")
                 main_window.book_id_line_edit.setText("123")
                 QTest.mouseClick(main_window.fetch_data_button, Qt.LeftButton)
-                assert mock_logger.error.call_count > 0
\ No newline at end of file
+                wait_for_fetch()
+                assert logged_levels(mock_logger)[-1] == logging.ERROR
+    
+    def test_api_not_found_error_message(self):
+        """Test ApiNotFoundError carries the formatted message as its only argument"""
+        error = ApiNotFoundError(resource_id=42, message_prefix="Book not found")
+        assert str(error) == "Book not found: ID 42"
+        assert error.args == ("Book not found: ID 42",)
+        assert error.resource_id == 42
+        assert str(ApiNotFoundError(7)) == "Resource not found: ID 7"
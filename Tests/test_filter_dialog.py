@@ -193,6 +193,18 @@ class TestFilterRule(unittest.TestCase):
         self.assertEqual(data['value']['start'], '2023-01-01')
         self.assertEqual(data['value']['end'], '2023-12-31')
     
+    def test_get_filter_data_no_value_and_reading_format(self):
+        """Test getting filter data for no-value operators and reading format."""
+        rule = FilterRule(self.test_columns)
+        rule.column_combo.setCurrentText('title')
+        rule.operator_combo.setCurrentText('Is empty')
+        self.assertIsNone(rule.get_filter_data()['value'])
+        
+        rule.column_combo.setCurrentText('Reading Format')
+        rule.operator_combo.setCurrentText('Is')
+        rule.value_widget.setCurrentText('Audiobook')
+        self.assertEqual(rule.get_filter_data()['value'], 'Audiobook')
+    
     def test_remove_signal(self):
         """Test remove button emits signal."""
         rule = FilterRule(self.test_columns)
@@ -207,6 +219,54 @@ class TestFilterRule(unittest.TestCase):
         # Check signal emitted with self
         signal_spy.assert_called_once_with(rule)
 
+    def test_value_widgets_reused_across_operator_changes(self):
+        """Test operator changes switch between prebuilt value widgets."""
+        rule = FilterRule(self.test_columns)
+        rule.column_combo.setCurrentText('title')
+        rule.operator_combo.setCurrentText('Contains')
+        line_edit = rule.value_widget
+
+        rule.operator_combo.setCurrentText('Is empty')
+        self.assertIs(rule.value_stack.currentWidget(), rule.value_widget)
+
+        rule.operator_combo.setCurrentText('Contains')
+        self.assertIs(rule.value_widget, line_edit)
+        self.assertIs(rule.value_stack.currentWidget(), line_edit)
+
+    def test_column_change_emits_no_operator_signals(self):
+        """Test repopulating operators on column change is done with signals blocked."""
+        rule = FilterRule(self.test_columns)
+        signal_spy = Mock()
+        rule.operator_combo.currentTextChanged.connect(signal_spy)
+        
+        rule.column_combo.setCurrentText('release_date')
+        
+        signal_spy.assert_not_called()
+        self.assertIsInstance(rule.value_widget, QDateEdit)
+
+    def test_no_value_label_built_once(self):
+        """Test every no-value operator shows the same prebuilt label."""
+        rule = FilterRule(self.test_columns)
+        rule.column_combo.setCurrentText('title')
+        rule.operator_combo.setCurrentText('Is empty')
+        label = rule.value_widget
+        
+        rule.column_combo.setCurrentText('score')
+        rule.operator_combo.setCurrentText('Is N/A')
+        self.assertIs(rule.value_widget, label)
+        self.assertEqual(label.text(), "(no value needed)")
+    
+    def test_operator_signal_connected_once(self):
+        """Test column changes do not stack operator-change connections."""
+        rule = FilterRule(self.test_columns)
+        signal = rule.operator_combo.currentTextChanged
+        initial_receivers = rule.operator_combo.receivers(signal)
+
+        for column in ['score', 'release_date', 'title', 'Reading Format']:
+            rule.column_combo.setCurrentText(column)
+
+        self.assertEqual(rule.operator_combo.receivers(signal), initial_receivers)
+
 
 class TestFilterDialog(unittest.TestCase):
     """Test cases for FilterDialog."""
@@ -222,10 +282,16 @@ class TestFilterDialog(unittest.TestCase):
     def setUp(self):
         """Set up test fixtures."""
         self.test_columns = ['id', 'title', 'score', 'pages', 'author']
+    
+    def _make_dialog(self):
+        """Create a FilterDialog with its UI built, as it is once shown."""
+        dialog = FilterDialog(self.test_columns)
+        dialog._ensure_ui()
+        return dialog
         
     def test_dialog_initialization(self):
         """Test FilterDialog initializes correctly."""
-        dialog = FilterDialog(self.test_columns)
+        dialog = self._make_dialog()
         
         # Check window properties
         self.assertEqual(dialog.windowTitle(), "Advanced Filter")
@@ -242,9 +308,22 @@ class TestFilterDialog(unittest.TestCase):
         self.assertIsNotNone(dialog.add_rule_button)
         self.assertIsNotNone(dialog.clear_all_button)
     
+    def test_ui_built_lazily(self):
+        """Test the dialog UI is built on first show rather than at construction."""
+        dialog = FilterDialog(self.test_columns)
+        self.assertFalse(dialog._ui_ready)
+        self.assertIsNone(dialog.findChild(QLineEdit))
+        # Reading a UI attribute early is an error rather than a hidden build
+        self.assertFalse(hasattr(dialog, 'filter_rules'))
+        
+        dialog.show()
+        self.assertTrue(dialog._ui_ready)
+        self.assertEqual(len(dialog.filter_rules), 1)
+        dialog.close()
+    
     def test_add_rule(self):
         """Test adding filter rules."""
-        dialog = FilterDialog(self.test_columns)
+        dialog = self._make_dialog()
         
         # Should start with 1 rule
         self.assertEqual(len(dialog.filter_rules), 1)
@@ -259,7 +338,7 @@ class TestFilterDialog(unittest.TestCase):
     
     def test_remove_rule(self):
         """Test removing filter rules."""
-        dialog = FilterDialog(self.test_columns)
+        dialog = self._make_dialog()
         
         # Add extra rules
         dialog._add_rule()
@@ -274,7 +353,7 @@ class TestFilterDialog(unittest.TestCase):
     
     def test_minimum_one_rule(self):
         """Test that at least one rule is always present."""
-        dialog = FilterDialog(self.test_columns)
+        dialog = self._make_dialog()
         
         # Try to remove the only rule
         rule = dialog.filter_rules[0]
@@ -286,7 +365,7 @@ class TestFilterDialog(unittest.TestCase):
     
     def test_clear_all_rules(self):
         """Test clearing all rules."""
-        dialog = FilterDialog(self.test_columns)
+        dialog = self._make_dialog()
         
         # Add multiple rules
         dialog._add_rule()
@@ -300,9 +379,47 @@ class TestFilterDialog(unittest.TestCase):
         # Should have one rule (minimum)
         self.assertEqual(len(dialog.filter_rules), 1)
     
+    def test_rules_share_column_model(self):
+        """Test every rule's column combo uses the dialog's shared model."""
+        dialog = self._make_dialog()
+        dialog._add_rule()
+        
+        first, second = dialog.filter_rules
+        self.assertIs(first.column_combo.model(), second.column_combo.model())
+        self.assertEqual(first.column_combo.count(), len(self.test_columns))
+        
+        # Selections stay independent even with a shared model
+        second.column_combo.setCurrentText('score')
+        self.assertEqual(first.column_combo.currentText(), self.test_columns[0])
+    
+    def test_clear_all_rules_updates_ui_once(self):
+        """Test clearing all rules refreshes UI state once and re-enables updates."""
+        dialog = self._make_dialog()
+        dialog._add_rule()
+        dialog._add_rule()
+        
+        with patch.object(dialog, '_update_ui_state') as mock_update:
+            dialog._clear_all_rules()
+        
+        mock_update.assert_called_once()
+        self.assertEqual(len(dialog.filter_rules), 1)
+        self.assertFalse(dialog._bulk)
+    
+    def test_clear_all_rules_adds_replacement_once(self):
+        """Test clearing all rules adds exactly one replacement rule."""
+        dialog = self._make_dialog()
+        dialog._add_rule()
+        
+        with patch.object(dialog, '_add_rule', wraps=dialog._add_rule) as mock_add:
+            dialog._clear_all_rules()
+        
+        mock_add.assert_called_once()
+        self.assertTrue(dialog.rules_container.updatesEnabled())
+        self.assertFalse(dialog.rules_container.signalsBlocked())
+    
     def test_ui_state_updates(self):
         """Test UI state updates based on rule count."""
-        dialog = FilterDialog(self.test_columns)
+        dialog = self._make_dialog()
         
         # With one rule, logic buttons and clear all should be disabled
         self.assertFalse(dialog.and_radio.isEnabled())
@@ -319,7 +436,7 @@ class TestFilterDialog(unittest.TestCase):
     
     def test_apply_filters_signal(self):
         """Test applying filters emits correct signal."""
-        dialog = FilterDialog(self.test_columns)
+        dialog = self._make_dialog()
         
         # Set up signal spy
         signal_spy = Mock()
@@ -346,7 +463,7 @@ class TestFilterDialog(unittest.TestCase):
     
     def test_apply_filters_with_or_logic(self):
         """Test applying filters with OR logic."""
-        dialog = FilterDialog(self.test_columns)
+        dialog = self._make_dialog()
         
         # Add another rule
         dialog._add_rule()
@@ -379,7 +496,7 @@ class TestFilterDialog(unittest.TestCase):
     
     def test_empty_filters_not_applied(self):
         """Test that empty filters are not included."""
-        dialog = FilterDialog(self.test_columns)
+        dialog = self._make_dialog()
         
         # Add rules but don't set values
         dialog._add_rule()
@@ -406,7 +523,7 @@ class TestFilterDialog(unittest.TestCase):
     
     def test_no_value_operators_included(self):
         """Test operators that don't need values are included."""
-        dialog = FilterDialog(self.test_columns)
+        dialog = self._make_dialog()
         
         # Set up signal spy
         signal_spy = Mock()
@@ -4,9 +4,12 @@ import unittest
 import tempfile
 import os
 import json
+import time
 from datetime import datetime
 from unittest.mock import patch
 
+from PyQt5.QtWidgets import QApplication
+
 from librarian_assistant.history_manager import HistoryManager
 
 
@@ -20,6 +23,9 @@ class TestHistoryManager(unittest.TestCase):
     
     def tearDown(self):
         """Clean up temporary files."""
+        # Write out pending changes and stop the I/O thread before removing the directory
+        self.history_manager.close()
+        
         # Clean up temp directory
         import shutil
         shutil.rmtree(self.temp_dir, ignore_errors=True)
@@ -30,7 +36,7 @@ class TestHistoryManager(unittest.TestCase):
         self.assertTrue(os.path.exists(self.temp_dir))
         
         # Check history file path is set correctly
-        expected_path = os.path.join(self.temp_dir, 'search_history.json')
+        expected_path = os.path.join(self.temp_dir, 'search_history.jsonl')
         self.assertEqual(self.history_manager.history_file, expected_path)
         
         # Check initial history is empty
@@ -124,6 +130,34 @@ class TestHistoryManager(unittest.TestCase):
         results = self.history_manager.search_history("Nonexistent")
         self.assertEqual(len(results), 0)
     
+    def test_search_history_after_reload(self):
+        """Test that search keys are rebuilt from disk and never written to it."""
+        self.history_manager.add_search(123, "The Hobbit")
+        self.history_manager.flush()
+        
+        with open(self.history_manager.history_file, 'r', encoding='utf-8') as f:
+            self.assertEqual(set(json.loads(f.readline())), {'book_id', 'book_title', 'search_time'})
+        
+        new_manager = HistoryManager(storage_dir=self.temp_dir)
+        self.assertEqual([e['book_id'] for e in new_manager.search_history("HOBBIT")], [123])
+        self.assertEqual([e['book_id'] for e in new_manager.search_history("12")], [123])
+    
+    def test_search_history_results_cached_until_change(self):
+        """Test repeated queries reuse cached results and changes invalidate them."""
+        self.history_manager.add_search(123, "The Hobbit")
+        
+        first = self.history_manager.search_history("hobbit")
+        second = self.history_manager.search_history("Hobbit")
+        self.assertEqual(first, second)
+        self.assertIsNot(first, second)  # Callers get their own list
+        
+        cache_info = self.history_manager._search_cached.cache_info()
+        self.assertEqual((cache_info.hits, cache_info.misses), (1, 1))
+        
+        self.history_manager.add_search(456, "The Hobbit Companion")
+        results = self.history_manager.search_history("hobbit")
+        self.assertEqual([entry['book_id'] for entry in results], [456, 123])
+    
     def test_sort_history(self):
         """Test sorting history."""
         # Add test data with specific order
@@ -147,6 +181,20 @@ class TestHistoryManager(unittest.TestCase):
         book_ids = [entry['book_id'] for entry in sorted_history]
         self.assertEqual(book_ids, [456, 123, 789])
     
+    def test_get_history_shared_until_change(self):
+        """Test that repeated reads share one snapshot and changes produce a new one."""
+        self.history_manager.add_search(123, "Book 1")
+        
+        first = self.history_manager.get_history()
+        self.assertIs(self.history_manager.get_history(), first)
+        self.assertIs(self.history_manager.sort_history('date'), first)
+        self.assertIsInstance(first, tuple)
+        
+        self.history_manager.add_search(456, "Book 2")
+        second = self.history_manager.get_history()
+        self.assertIsNot(second, first)
+        self.assertEqual([entry['book_id'] for entry in second], [456, 123])
+    
     def test_get_entry_by_book_id(self):
         """Test getting specific entry by book ID."""
         # Add test data
@@ -162,6 +210,61 @@ class TestHistoryManager(unittest.TestCase):
         entry = self.history_manager.get_entry_by_book_id(999)
         self.assertIsNone(entry)
     
+    def test_history_loaded_on_first_access(self):
+        """Test that the history file is not read until history is needed."""
+        self.history_manager.add_search(123, "Lazy Book")
+        self.history_manager.flush()
+        
+        with patch.object(HistoryManager, 'load_history', autospec=True,
+                          side_effect=HistoryManager.load_history) as mock_load:
+            manager = HistoryManager(storage_dir=self.temp_dir)
+            mock_load.assert_not_called()
+            
+            self.assertEqual(manager.get_history_count(), 1)
+            manager.get_history()
+            mock_load.assert_called_once()
+    
+    def test_loaded_duplicates_keep_newest(self):
+        """Test that duplicate book IDs in a saved log collapse to the newest entry."""
+        entries = [
+            {'book_id': 123, 'book_title': "Oldest", 'search_time': "2024-01-01T00:00:00"},
+            {'book_id': 456, 'book_title': "Other", 'search_time': "2024-01-01T12:00:00"},
+            {'book_id': 123, 'book_title': "Newest", 'search_time': "2024-01-02T00:00:00"},
+        ]
+        with open(self.history_manager.history_file, 'w', encoding='utf-8') as f:
+            f.writelines(json.dumps(entry) + "\n" for entry in entries)
+        
+        manager = HistoryManager(storage_dir=self.temp_dir)
+        self.assertEqual([entry['book_id'] for entry in manager.get_history()], [123, 456])
+        self.assertEqual(manager.get_entry_by_book_id(123)['book_title'], "Newest")
+    
+    def test_history_size_capped(self):
+        """Test that the least recently searched entries are evicted past max_entries."""
+        manager = HistoryManager(storage_dir=self.temp_dir, max_entries=3)
+        self.assertEqual(HistoryManager.MAX_ENTRIES, 500)
+        
+        for book_id in (1, 2, 3):
+            manager.add_search(book_id, f"Book {book_id}")
+        manager.add_search(1, "Book 1")  # Refresh 1 so 2 becomes the oldest
+        manager.add_search(4, "Book 4")
+        
+        self.assertEqual([entry['book_id'] for entry in manager.get_history()], [4, 1, 3])
+        self.assertIsNone(manager.get_entry_by_book_id(2))
+        self.assertEqual(manager.search_history("Book 2"), [])
+        manager.close()
+    
+    def test_add_searches_batches_one_write(self):
+        """Test that a batch of searches is applied in order with one scheduled write."""
+        self.history_manager.add_search(456, "Old Title")
+        
+        with patch.object(self.history_manager, '_schedule_flush') as mock_schedule:
+            self.history_manager.add_searches([(123, "Book 1"), (456, "Book 2"), (789, "Book 3")])
+        
+        mock_schedule.assert_called_once()
+        self.assertEqual([entry['book_id'] for entry in self.history_manager.get_history()], [789, 456, 123])
+        self.assertEqual(self.history_manager.get_entry_by_book_id(456)['book_title'], "Book 2")
+        self.assertEqual(self.history_manager.search_history("book 2")[0]['book_id'], 456)
+    
     def test_get_history_count(self):
         """Test getting history count."""
         # Initially empty
@@ -183,6 +286,7 @@ class TestHistoryManager(unittest.TestCase):
         # Add data to first instance
         self.history_manager.add_search(123, "Persistent Book")
         self.history_manager.add_search(456, "Another Persistent Book")
+        self.history_manager.flush()
         
         # Create new instance with same storage directory
         new_manager = HistoryManager(storage_dir=self.temp_dir)
@@ -193,6 +297,185 @@ class TestHistoryManager(unittest.TestCase):
         self.assertEqual(history[0]['book_id'], 456)  # Most recent first
         self.assertEqual(history[1]['book_id'], 123)
     
+    def test_writes_are_batched_until_flush(self):
+        """Test that several searches produce a single deferred write."""
+        with patch.object(self.history_manager, '_write_entries',
+                          wraps=self.history_manager._write_entries) as mock_save:
+            self.history_manager.add_search(123, "Book 1")
+            self.history_manager.add_search(456, "Book 2")
+            self.history_manager.add_search(789, "Book 3")
+            mock_save.assert_not_called()
+            
+            self.history_manager.flush()
+            mock_save.assert_called_once()
+            
+            # Nothing pending, so a second flush does not write again
+            self.history_manager.flush()
+            mock_save.assert_called_once()
+        
+        with open(self.history_manager.history_file, 'r', encoding='utf-8') as f:
+            saved = [json.loads(line) for line in f]
+        self.assertEqual([entry['book_id'] for entry in saved], [123, 456, 789])
+        self.assertFalse(os.path.exists(self.history_manager.history_file + '.tmp'))
+    
+    def test_flush_timer_writes_after_delay(self):
+        """Test that pending changes are written automatically after the quiet period."""
+        self.history_manager.FLUSH_DELAY = 0.01
+        self.history_manager.add_search(123, "Timed Book")
+        
+        # The timer fires on the GUI thread's event loop
+        deadline = time.monotonic() + 2
+        while not os.path.exists(self.history_manager.history_file) and time.monotonic() < deadline:
+            QApplication.processEvents()
+            time.sleep(0.01)
+        
+        self.assertTrue(os.path.exists(self.history_manager.history_file))
+        self.assertFalse(self.history_manager._dirty)
+    
+    def test_writes_run_on_worker_thread(self):
+        """Test that flushed snapshots are written by the background I/O thread."""
+        import threading
+        writer_threads = []
+        original_write = self.history_manager._write_entries
+        
+        def recording_write(entries, append=False):
+            writer_threads.append(threading.current_thread())
+            return original_write(entries, append)
+        
+        self.history_manager._write_entries = recording_write
+        self.history_manager.add_search(123, "Threaded Book")
+        self.history_manager.flush()
+        
+        self.assertEqual(len(writer_threads), 1)
+        self.assertIsNot(writer_threads[0], threading.current_thread())
+        
+        self.history_manager.close()
+        self.assertIsNone(self.history_manager._io_worker)
+    
+    def test_new_searches_appended(self):
+        """Test that searches after the first write are appended rather than rewriting the file."""
+        self.history_manager.add_search(123, "Book 1")
+        self.history_manager.add_search(456, "Book 2")
+        self.history_manager.flush()
+        
+        with open(self.history_manager.history_file, 'rb') as f:
+            before = f.read()
+        inode = os.stat(self.history_manager.history_file).st_ino
+        
+        self.history_manager.add_search(789, "Book 3")
+        self.history_manager.flush()
+        
+        # A rewrite would swap in a new file via os.replace
+        self.assertEqual(os.stat(self.history_manager.history_file).st_ino, inode)
+        with open(self.history_manager.history_file, 'rb') as f:
+            after = f.read()
+        self.assertTrue(after.startswith(before))
+        self.assertEqual(json.loads(after[len(before):])['book_id'], 789)
+    
+    def test_log_compacted_when_mostly_superseded(self):
+        """Test that the file is rewritten once repeated searches double its length."""
+        for _ in range(3):
+            self.history_manager.add_search(123, "Book 1")
+            self.history_manager.add_search(456, "Book 2")
+            self.history_manager.flush()
+        
+        with open(self.history_manager.history_file, 'r', encoding='utf-8') as f:
+            lines = [json.loads(line) for line in f]
+        self.assertLessEqual(len(lines), 4)
+        self.assertEqual(lines[-1]['book_id'], 456)
+        
+        new_manager = HistoryManager(storage_dir=self.temp_dir)
+        self.assertEqual([entry['book_id'] for entry in new_manager.get_history()], [456, 123])
+    
+    def test_clear_history_rewrites_file(self):
+        """Test that clearing truncates the log instead of appending."""
+        self.history_manager.add_search(123, "Book 1")
+        self.history_manager.flush()
+        self.history_manager.clear_history()
+        self.history_manager.flush()
+        
+        self.assertEqual(os.path.getsize(self.history_manager.history_file), 0)
+        self.assertEqual(HistoryManager(storage_dir=self.temp_dir).get_history_count(), 0)
+    
+    def test_legacy_json_history_migrated(self):
+        """Test that a JSON array file from earlier versions is loaded and converted."""
+        entries = [
+            {'book_id': 456, 'book_title': "Newer", 'search_time': "2024-01-02T00:00:00"},
+            {'book_id': 123, 'book_title': "Older", 'search_time': "2024-01-01T00:00:00"},
+        ]
+        with open(self.history_manager.legacy_history_file, 'w', encoding='utf-8') as f:
+            json.dump(entries, f)
+        
+        manager = HistoryManager(storage_dir=self.temp_dir)
+        self.assertEqual([entry['book_id'] for entry in manager.get_history()], [456, 123])
+        manager.close()
+        
+        self.assertFalse(os.path.exists(self.history_manager.legacy_history_file))
+        reloaded = HistoryManager(storage_dir=self.temp_dir)
+        self.assertEqual([entry['book_id'] for entry in reloaded.get_history()], [456, 123])
+    
+    def test_failed_legacy_migration_retried(self):
+        """Test that a search after a failed migration rewrite does not lose the legacy history."""
+        entries = [
+            {'book_id': 456, 'book_title': "Newer", 'search_time': "2024-01-02T00:00:00"},
+            {'book_id': 123, 'book_title': "Older", 'search_time': "2024-01-01T00:00:00"},
+        ]
+        with open(self.history_manager.legacy_history_file, 'w', encoding='utf-8') as f:
+            json.dump(entries, f)
+        
+        manager = HistoryManager(storage_dir=self.temp_dir)
+        manager.get_history()
+        with patch('librarian_assistant.history_manager.os.replace',
+                   side_effect=OSError("Disk full")):
+            manager.flush()
+        self.assertTrue(os.path.exists(self.history_manager.legacy_history_file))
+        manager.add_search(789, "Book 3")
+        manager.close()
+        
+        reloaded = HistoryManager(storage_dir=self.temp_dir)
+        self.assertEqual([entry['book_id'] for entry in reloaded.get_history()], [789, 456, 123])
+    
+    def test_truncated_last_line_skipped(self):
+        """Test that a partially written final line does not discard the rest of the log."""
+        self.history_manager.add_search(123, "Book 1")
+        self.history_manager.flush()
+        with open(self.history_manager.history_file, 'a', encoding='utf-8') as f:
+            f.write('{"book_id": 456, "book_ti')
+        
+        with patch('logging.Logger.error') as mock_logger:
+            manager = HistoryManager(storage_dir=self.temp_dir)
+            self.assertEqual([entry['book_id'] for entry in manager.get_history()], [123])
+            mock_logger.assert_called()
+    
+    def test_search_after_truncated_last_line_kept(self):
+        """Test that a search made after loading a truncated log is not appended onto the broken line."""
+        self.history_manager.add_search(123, "Book 1")
+        self.history_manager.flush()
+        with open(self.history_manager.history_file, 'a', encoding='utf-8') as f:
+            f.write('{"book_id": 456, "book_ti')
+        
+        manager = HistoryManager(storage_dir=self.temp_dir)
+        manager.get_history()
+        manager.add_search(789, "Book 3")
+        manager.close()
+        
+        with open(self.history_manager.history_file, 'rb') as f:
+            self.assertTrue(f.read().endswith(b'\n'))
+        reloaded = HistoryManager(storage_dir=self.temp_dir)
+        self.assertEqual([entry['book_id'] for entry in reloaded.get_history()], [789, 123])
+    
+    def test_persistence_without_orjson(self):
+        """Test the standard-library JSON fallback reads and writes the same format."""
+        with patch('librarian_assistant.history_manager.orjson', None):
+            self.history_manager.add_search(123, "Café Book")
+            self.history_manager.flush()
+            
+            with open(self.history_manager.history_file, 'r', encoding='utf-8') as f:
+                self.assertIn("Café Book", f.read())
+            
+            new_manager = HistoryManager(storage_dir=self.temp_dir)
+            self.assertEqual(new_manager.get_history()[0]['book_title'], "Café Book")
+    
     def test_file_operations_error_handling(self):
         """Test error handling for file operations."""
         # Test with invalid directory
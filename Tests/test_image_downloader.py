@@ -5,7 +5,19 @@ import unittest
 from unittest.mock import patch, MagicMock
 from PyQt5.QtGui import QPixmap
 import requests # For mocking requests.exceptions
-from librarian_assistant.image_downloader import ImageDownloader
+from librarian_assistant.image_downloader import ImageDownloader, REQUEST_TIMEOUT
+
+# Minimal valid PNG (1x1 transparent pixel)
+PNG_BYTES = bytes.fromhex(
+    "89504e470d0a1a0a0000000d49484452000000010000000108060000001f15c489"
+    "0000000a49444154789c63000100000500010d0a2db40000000049454e44ae426082"
+)
+
+def make_response(status_code=200, body=b"", headers=None):
+    """Build a mock streamed response yielding body in one chunk."""
+    response = MagicMock(status_code=status_code, headers=headers or {})
+    response.iter_content.return_value = [body]
+    return response
 
 class TestImageDownloader(unittest.TestCase):
 
@@ -15,22 +27,19 @@ class TestImageDownloader(unittest.TestCase):
         downloader = ImageDownloader()
         self.assertIsNotNone(downloader, "ImageDownloader instance should not be None.")
 
-    @patch('librarian_assistant.image_downloader.requests.get')
+    @patch('librarian_assistant.image_downloader.requests.Session.get')
     def test_download_image_success(self, mock_requests_get):
         """
         Tests that download_image successfully fetches image data and returns a QPixmap.
         """
         downloader = ImageDownloader()
         test_url = "http://example.com/test_image.png"
-        # Minimal valid PNG (1x1 transparent pixel)
-        fake_image_bytes = bytes.fromhex(
-            "89504e470d0a1a0a0000000d49484452000000010000000108060000001f15c489"
-            "0000000a49444154789c63000100000500010d0a2db40000000049454e44ae426082"
-        )
+        fake_image_bytes = PNG_BYTES
 
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.content = fake_image_bytes
+        mock_response.headers = {}
+        mock_response.iter_content.return_value = [fake_image_bytes]
         mock_requests_get.return_value = mock_response
 
         pixmap = downloader.download_image(test_url)
@@ -38,9 +47,9 @@ class TestImageDownloader(unittest.TestCase):
         self.assertIsNotNone(pixmap, "download_image should return a QPixmap on success, not None.")
         self.assertIsInstance(pixmap, QPixmap, "download_image should return an instance of QPixmap.")
         self.assertFalse(pixmap.isNull(), "The returned QPixmap should not be null for valid image data.")
-        mock_requests_get.assert_called_once_with(test_url, stream=True)
+        mock_requests_get.assert_called_once_with(test_url, stream=True, timeout=REQUEST_TIMEOUT)
 
-    @patch('librarian_assistant.image_downloader.requests.get')
+    @patch('librarian_assistant.image_downloader.requests.Session.get')
     def test_download_image_http_error(self, mock_requests_get):
         """
         Tests that download_image returns None if an HTTP error occurs.
@@ -50,6 +59,7 @@ class TestImageDownloader(unittest.TestCase):
 
         mock_response = MagicMock()
         mock_response.status_code = 404
+        mock_response.headers = {}
         # Simulate raise_for_status() behavior for HTTPError
         mock_response.raise_for_status.side_effect = requests.exceptions.HTTPError(
             "404 Client Error: Not Found for url", response=mock_response
@@ -59,9 +69,9 @@ class TestImageDownloader(unittest.TestCase):
         pixmap = downloader.download_image(test_url)
 
         self.assertIsNone(pixmap, "download_image should return None on HTTP error.")
-        mock_requests_get.assert_called_once_with(test_url, stream=True)
+        mock_requests_get.assert_called_once_with(test_url, stream=True, timeout=REQUEST_TIMEOUT)
 
-    @patch('librarian_assistant.image_downloader.requests.get')
+    @patch('librarian_assistant.image_downloader.requests.Session.get')
     def test_download_image_network_error(self, mock_requests_get):
         """
         Tests that download_image returns None if a network error occurs.
@@ -74,9 +84,9 @@ class TestImageDownloader(unittest.TestCase):
         pixmap = downloader.download_image(test_url)
 
         self.assertIsNone(pixmap, "download_image should return None on network error.")
-        mock_requests_get.assert_called_once_with(test_url, stream=True)
+        mock_requests_get.assert_called_once_with(test_url, stream=True, timeout=REQUEST_TIMEOUT)
 
-    @patch('librarian_assistant.image_downloader.requests.get')
+    @patch('librarian_assistant.image_downloader.requests.Session.get')
     def test_download_image_invalid_data(self, mock_requests_get):
         """
         Tests that download_image returns None if the downloaded data is not a valid image.
@@ -88,13 +98,50 @@ class TestImageDownloader(unittest.TestCase):
         fake_non_image_bytes = b"This is not an image."
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.content = fake_non_image_bytes
+        mock_response.headers = {}
+        mock_response.iter_content.return_value = [fake_non_image_bytes]
         mock_requests_get.return_value = mock_response
 
         pixmap = downloader.download_image(test_url)
 
         self.assertIsNone(pixmap, "download_image should return None for invalid image data.")
-        mock_requests_get.assert_called_once_with(test_url, stream=True)
+        mock_requests_get.assert_called_once_with(test_url, stream=True, timeout=REQUEST_TIMEOUT)
+
+    @patch('librarian_assistant.image_downloader.requests.Session.get')
+    def test_downloads_share_one_session(self, mock_session_get):
+        """Tests that repeated downloads reuse the same pooled session."""
+        downloader = ImageDownloader()
+        mock_session_get.side_effect = requests.exceptions.ConnectionError("Failed to connect")
+
+        downloader.download_image("http://example.com/a.png")
+        downloader.download_image("http://example.com/b.png")
+
+        self.assertEqual(mock_session_get.call_count, 2)
+        adapter = downloader._session.get_adapter("https://example.com/")
+        self.assertEqual(adapter.max_retries.total, 3)
+
+    @patch('librarian_assistant.image_downloader.MAX_IMAGE_BYTES', 16)
+    @patch('librarian_assistant.image_downloader.requests.Session.get')
+    def test_oversized_image_rejected(self, mock_session_get):
+        """Tests that bodies past MAX_IMAGE_BYTES are abandoned."""
+        downloader = ImageDownloader()
+        mock_response = make_response(200, b"")
+        mock_response.iter_content.return_value = [PNG_BYTES[:10], PNG_BYTES[10:20], PNG_BYTES[20:]]
+        mock_session_get.return_value = mock_response
+
+        self.assertIsNone(downloader.download_image("http://example.com/huge.png"))
+        mock_response.close.assert_called_once()
+
+    @patch('librarian_assistant.image_downloader.MAX_IMAGE_BYTES', 16)
+    @patch('librarian_assistant.image_downloader.requests.Session.get')
+    def test_oversized_content_length_rejected_before_reading(self, mock_session_get):
+        """Tests that a declared Content-Length past the cap skips reading the body."""
+        downloader = ImageDownloader()
+        mock_response = make_response(200, PNG_BYTES, {'Content-Length': '1000'})
+        mock_session_get.return_value = mock_response
+
+        self.assertIsNone(downloader.download_image("http://example.com/huge.png"))
+        mock_response.iter_content.assert_not_called()
 
     def test_download_image_no_url(self):
         """Tests that download_image returns None if no URL is provided."""
@@ -2,15 +2,16 @@
 # ABOUTME: It tests the main UI window functionality including book fetching and display.
 
 # Standard library imports
+import threading
 import unittest
 from unittest.mock import patch, Mock
 
 # Third-party imports
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import Qt, QThreadPool
 from PyQt5.QtTest import QTest
 from PyQt5.QtWidgets import (
     QApplication, QLabel, QLineEdit, QPushButton, 
-    QGroupBox, QTableWidget, QHeaderView, QTableWidgetItem
+    QGroupBox, QTableWidget, QHeaderView, QTableWidgetItem, QWidget, QCheckBox
 )
 
 # Local imports
@@ -19,7 +20,16 @@ from librarian_assistant.exceptions import (
     ApiNotFoundError, ApiAuthError, NetworkError, ApiProcessingError
 )
 from librarian_assistant.image_downloader import ImageDownloader
-from librarian_assistant.main import MainWindow, ClickableLabel
+from librarian_assistant.main import (
+    MainWindow, ClickableLabel, NumericTableWidgetItem, COLUMN_WIDTHS, DEFAULT_COLUMN_WIDTH, BOOK_CACHE_TTL_SECONDS,
+    STATIC_EDITION_HEADERS, default_edition_parts, format_release_date, _bulk_update, _EDITION_CELLS
+)
+
+def wait_for_fetch():
+    """Let a background book fetch finish and deliver its result to the window."""
+    QThreadPool.globalInstance().waitForDone()
+    QApplication.processEvents()
+
 
 class TestMainWindow(unittest.TestCase):
     def setUp(self):
@@ -47,7 +57,8 @@ class TestMainWindow(unittest.TestCase):
         # Check for the Book ID QLabel
         book_id_label = api_input_area.findChild(QLabel, "bookIdLabel")
         self.assertIsNotNone(book_id_label, "Book ID QLabel not found.")
-        self.assertEqual(book_id_label.text(), "<span style='color:#999999;'>Book ID:</span>")
+        self.assertEqual(book_id_label.text(), "Book ID:")
+        self.assertEqual(book_id_label.textFormat(), Qt.PlainText)
 
         # Check for the Book ID QLineEdit
         book_id_line_edit = api_input_area.findChild(QLineEdit, "bookIdLineEdit")
@@ -58,6 +69,10 @@ class TestMainWindow(unittest.TestCase):
         self.assertIsNotNone(fetch_data_button, "Fetch Data QPushButton not found.")
         self.assertEqual(fetch_data_button.text(), "Fetch Data")
 
+    def _wait_for_book_id_validation(self):
+        """Let the Book ID debounce timer fire."""
+        QTest.qWait(self.window._book_id_validation_timer.interval() + 50)
+
     def test_book_id_line_edit_accepts_only_numbers(self):
         """
         Test that the Book ID QLineEdit only accepts numerical input.
@@ -65,22 +80,138 @@ class TestMainWindow(unittest.TestCase):
         book_id_line_edit = self.window.findChild(QLineEdit, "bookIdLineEdit")
         self.assertIsNotNone(book_id_line_edit, "Book ID QLineEdit not found.")
 
-        # Test with non-numeric input
+        # Test with non-numeric input; validation runs once the debounce timer fires
         book_id_line_edit.setText("abc")
+        self._wait_for_book_id_validation()
         self.assertEqual(book_id_line_edit.text(), "", "QLineEdit should be empty after non-numeric input.")
 
         # Test with numeric input
         book_id_line_edit.setText("123")
+        self._wait_for_book_id_validation()
         self.assertEqual(book_id_line_edit.text(), "123", "QLineEdit should accept numeric input.")
 
         # Test with mixed input (should ideally only take numbers or be empty)
         book_id_line_edit.setText("1a2b3")
+        self._wait_for_book_id_validation()
         # Depending on how QIntValidator works or how we implement it,
         # it might result in "123" or "" or "1".
         # For a strict "only numbers allowed at all" policy, it should be empty or reject.
         # If it's a QIntValidator, it might allow partial valid input or clear on invalid.
         self.assertEqual(book_id_line_edit.text(), "", "QLineEdit should be empty after mixed input if strict.")
 
+    def test_book_id_validation_coalesces_edits(self):
+        """
+        Test that a burst of edits is validated once, after the edits stop.
+        """
+        with patch.object(self.window.book_id_line_edit, 'validator',
+                          wraps=self.window.book_id_line_edit.validator) as mock_validator:
+            for text in ("1", "12", "123", "x"):
+                self.window.book_id_line_edit.setText(text)
+            self.assertEqual(self.window.book_id_line_edit.text(), "x")
+            self._wait_for_book_id_validation()
+
+        mock_validator.assert_called_once()
+        self.assertEqual(self.window.book_id_line_edit.text(), "")
+
+    def test_book_id_plain_integers_skip_validation(self):
+        """
+        Test that empty text and plain integers never reach the validator.
+        """
+        with patch.object(self.window.book_id_line_edit, 'validator',
+                          wraps=self.window.book_id_line_edit.validator) as mock_validator:
+            for text in ("x", "1", "-12", "123456789", ""):
+                self.window.book_id_line_edit.setText(text)
+            self.assertFalse(self.window._book_id_validation_timer.isActive())
+            self._wait_for_book_id_validation()
+
+        mock_validator.assert_not_called()
+
+        # Too many digits for the fast path still goes through QIntValidator
+        self.window.book_id_line_edit.setText("99999999999")
+        self._wait_for_book_id_validation()
+        self.assertEqual(self.window.book_id_line_edit.text(), "")
+
+    def test_default_edition_parts(self):
+        """
+        Test formatting of default edition label parts, including missing data.
+        """
+        self.assertEqual(
+            default_edition_parts({'id': 7, 'edition_format': 'Hardcover'}, "Default Cover Edition"),
+            ("Default Cover Edition: ", "Hardcover (ID: 7)", "https://hardcover.app/editions/7"))
+        self.assertEqual(
+            default_edition_parts({'edition_format': None}, "Default Audio Edition"),
+            ("Default Audio Edition: ", "N/A (ID: N/A)", ""))
+        self.assertEqual(default_edition_parts(None, "Default E-book Edition"),
+                         ("Default E-book Edition: ", "N/A", ""))
+
+    def test_info_labels_built_from_tables_in_order(self):
+        """
+        Test that the declarative label tables produce the book info layout in order.
+        """
+        layout = self.window.info_layout
+        names = [layout.itemAt(i).widget().objectName() for i in range(layout.count())]
+        self.assertEqual(names, [
+            "bookTitleLabel", "bookSlugLabel", "bookAuthorsLabel", "bookIdQueriedLabel",
+            "bookTotalEditionsLabel", "bookDescriptionLabel", "defaultEditionsGroupBox", "bookCoverLabel",
+        ])
+        self.assertIsInstance(self.window.book_slug_label, ClickableLabel)
+        self.assertIsInstance(self.window.default_physical_label, ClickableLabel)
+        self.assertIn("N/A", self.window.default_physical_label.text())
+        self.assertTrue(self.window.book_description_label.wordWrap())
+
+    def test_token_display_does_not_reread_token_store(self):
+        """
+        Test that token display updates reuse the remembered token state.
+        """
+        with patch.object(self.window.config_manager, 'load_token', return_value="secret") as mock_load:
+            self.window._update_token_display()
+            mock_load.assert_not_called()
+
+        with patch('librarian_assistant.main.ConfigManager.load_token', return_value="secret") as mock_load:
+            window = MainWindow()
+            try:
+                window._update_token_display()
+                window._update_token_display()
+                mock_load.assert_called_once()
+                self.assertIn("*******", window.token_display_label.text())
+            finally:
+                window.close()
+
+        with patch.object(self.window.config_manager, 'save_token'), \
+             patch.object(self.window.config_manager, 'load_token') as mock_load:
+            self.window._handle_token_accepted("")
+            mock_load.assert_not_called()
+        self.assertIn("Not Set", self.window.token_display_label.text())
+
+    def test_external_url_lookup(self):
+        """
+        Test that book mapping URLs are built per platform with a search fallback.
+        """
+        self.assertEqual(self.window._get_external_url("Goodreads", "123"),
+                         "https://www.goodreads.com/book/show/123")
+        self.assertEqual(self.window._get_external_url("openlibrary", "/works/OL1W"),
+                         "https://openlibrary.org/works/OL1W")
+        self.assertEqual(self.window._get_external_url("openlibrary", "OL1M"),
+                         "https://openlibrary.org/books/OL1M")
+        self.assertEqual(self.window._get_external_url("unknown", "42"),
+                         "https://www.google.com/search?q=unknown+42")
+
+    def test_token_store_read_once_across_window_and_api_client(self):
+        """
+        Test that the window and its ApiClient share one in-memory token after the first read.
+        """
+        with patch('librarian_assistant.config_manager.keyring.get_password',
+                   return_value="secret") as mock_get_password:
+            window = MainWindow()
+            try:
+                window._update_token_display()
+                self.assertIs(window.api_client.token_manager, window.config_manager)
+                self.assertEqual(window.api_client.token_manager.load_token(), "secret")
+            finally:
+                window.close()
+
+        mock_get_password.assert_called_once()
+
     def test_main_window_instantiates_image_downloader(self):
         """
         Test that MainWindow instantiates an ImageDownloader.
@@ -108,6 +239,7 @@ class TestMainWindow(unittest.TestCase):
         
         # Simulate the button click
         fetch_data_button.click()
+        wait_for_fetch()
         
         # Check status bar message
         expected_status_message = "Book ID cannot be empty. Please enter a valid numerical Book ID."
@@ -148,6 +280,7 @@ class TestMainWindow(unittest.TestCase):
         
         # Simulate the button click
         fetch_data_button.click()
+        wait_for_fetch()
         
         # Assert that self.window.api_client.get_book_by_id was called once with the integer book_id
         self.window.api_client.get_book_by_id.assert_called_once_with(expected_book_id_int)
@@ -169,6 +302,8 @@ class TestMainWindow(unittest.TestCase):
         
         fetch_data_button.click()
         
+        wait_for_fetch()
+        
         expected_status_message = f"Book data fetched successfully for ID {test_book_id_str}."
         self.assertEqual(self.window.status_bar.currentMessage(), expected_status_message)
         mock_api_get_book_by_id.assert_called_once_with(int(test_book_id_str))
@@ -190,6 +325,8 @@ class TestMainWindow(unittest.TestCase):
         
         fetch_data_button.click()
         
+        wait_for_fetch()
+        
         expected_status_message = f"Book ID {test_book_id_str} not found."
         self.assertEqual(self.window.status_bar.currentMessage(), expected_status_message)
         mock_api_get_book_by_id.assert_called_once_with(int(test_book_id_str))
@@ -212,6 +349,8 @@ class TestMainWindow(unittest.TestCase):
         
         fetch_data_button.click()
         
+        wait_for_fetch()
+        
         expected_status_message = "API Authentication Failed. Please check your Bearer Token."
         self.assertEqual(self.window.status_bar.currentMessage(), expected_status_message)
         mock_api_get_book_by_id.assert_called_once_with(int(test_book_id_str))
@@ -234,6 +373,8 @@ class TestMainWindow(unittest.TestCase):
         
         fetch_data_button.click()
         
+        wait_for_fetch()
+        
         expected_status_message = (
             "Network error. Unable to connect to Hardcover.app API. "
             "Please check your internet connection."
@@ -260,6 +401,7 @@ class TestMainWindow(unittest.TestCase):
         # Mock the QMessageBox to prevent the dialog from showing
         with patch('PyQt5.QtWidgets.QMessageBox.critical'):
             fetch_data_button.click()
+            wait_for_fetch()
         
         expected_status_message = "An unexpected API error occurred. See dialog for details."
         self.assertEqual(self.window.status_bar.currentMessage(), expected_status_message)
@@ -308,6 +450,7 @@ class TestMainWindow(unittest.TestCase):
 
         book_id_line_edit.setText("123")
         fetch_data_button.click()
+        wait_for_fetch()
 
         # Check the instance attributes which should point to the new, populated widgets
         # Ensure these objectNames match what's set in your MainWindow's UI setup.
@@ -452,6 +595,7 @@ class TestMainWindow(unittest.TestCase):
 
         book_id_line_edit.setText("123")
         fetch_data_button.click()
+        wait_for_fetch()
 
         # Find the QTableWidget
         editions_table = self.window.editions_table_widget
@@ -624,6 +768,21 @@ class TestMainWindow(unittest.TestCase):
         self.assertIn("<span style='color:#999999;'>Cover URL: </span>", self.window.book_cover_label.text())
         self.assertIn("<span style='color:#e0e0e0;'>Not Fetched</span>", self.window.book_cover_label.text())
 
+    @patch.object(ApiClient, 'get_book_by_id')
+    def test_malformed_cover_edition_shows_na(self, mock_api_get_book_by_id):
+        """Test that a cover edition or image that is not an object yields an N/A cover URL."""
+        for cover_edition in ("cov789", ["cov789"], {"image": "http://example.com/cover.jpg"}):
+            with self.subTest(cover_edition=cover_edition):
+                mock_api_get_book_by_id.return_value = {
+                    "id": "456", "title": "Odd Cover", "default_cover_edition": cover_edition
+                }
+                self.window.book_id_line_edit.setText("456")
+                self.window.fetch_data_button.click()
+                wait_for_fetch()
+
+                self.assertIn("<span style='color:#999999;'>Cover URL: </span>", self.window.book_cover_label.text())
+                self.assertIn("N/A</span>", self.window.book_cover_label.text())
+
     @patch.object(ApiClient, 'get_book_by_id')
     def test_fetch_data_populates_book_info_with_null_defaults(self, mock_api_get_book_by_id):
         """
@@ -648,6 +807,7 @@ class TestMainWindow(unittest.TestCase):
 
         book_id_line_edit.setText("456")
         fetch_data_button.click()
+        wait_for_fetch()
 
         # Check labels for "N/A"
         self.assertIn("<span style='color:#999999;'>Title: </span>", self.window.book_title_label.text())
@@ -754,6 +914,7 @@ class TestMainWindow(unittest.TestCase):
 
         book_id_line_edit.setText("789")
         fetch_data_button.click()
+        wait_for_fetch()
 
         editions_table = self.window.editions_table_widget
         
@@ -835,6 +996,7 @@ class TestMainWindow(unittest.TestCase):
 
         book_id_line_edit.setText("999")
         fetch_data_button.click()
+        wait_for_fetch()
 
         editions_table = self.window.editions_table_widget
         
@@ -1017,6 +1179,7 @@ class TestMainWindow(unittest.TestCase):
         with patch.object(self.window.config_manager, 'load_token', return_value='test_token'):
             self.window.book_id_line_edit.setText("12345")
             self.window.fetch_data_button.click()
+            wait_for_fetch()
             QApplication.processEvents()
         
         # Check that only Author and Narrator columns exist
@@ -1088,6 +1251,7 @@ class TestMainWindow(unittest.TestCase):
         with patch.object(self.window.config_manager, 'load_token', return_value='test_token'):
             self.window.book_id_line_edit.setText("12345")
             self.window.fetch_data_button.click()
+            wait_for_fetch()
             QApplication.processEvents()
         
         editions_table = self.window.editions_table_widget
@@ -1411,6 +1575,7 @@ class TestMainWindow(unittest.TestCase):
 
         book_id_line_edit.setText("789")
         fetch_data_button.click()
+        wait_for_fetch()
 
         # Test clicking the book slug (should open URL)
         expected_slug_url = "https://hardcover.app/books/clickable-test-book"
@@ -1481,6 +1646,7 @@ class TestMainWindow(unittest.TestCase):
         # Fetch data
         self.window.book_id_line_edit.setText("123")
         self.window.fetch_data_button.click()
+        wait_for_fetch()
         
         table = self.window.editions_table_widget
         
@@ -1553,6 +1719,7 @@ class TestMainWindow(unittest.TestCase):
         # Fetch data
         self.window.book_id_line_edit.setText("123")
         self.window.fetch_data_button.click()
+        wait_for_fetch()
         
         table = self.window.editions_table_widget
         
@@ -1628,5 +1795,530 @@ class TestMainWindow(unittest.TestCase):
         self.assertIn("ed4", get_id_text(3))  # pages 50
 
 
+    def test_history_list_populated_when_history_tab_first_shown(self):
+        """Test that search history is not read until the History tab is opened."""
+        self.assertFalse(self.window._history_list_populated)
+        
+        with patch.object(self.window, '_populate_history_list',
+                          wraps=self.window._populate_history_list) as mock_populate:
+            self.window.tab_widget.setCurrentIndex(1)
+            self.window.tab_widget.setCurrentIndex(0)
+            self.window.tab_widget.setCurrentWidget(self.window.history_tab_content)
+        
+        mock_populate.assert_called_once()
+        self.assertTrue(self.window._history_list_populated)
+
+    def test_history_tab_built_on_first_activation(self):
+        """Test that the History tab widgets are only created when the tab is first shown."""
+        self.assertIsNone(self.window.history_tab_content)
+        self.assertEqual(self.window.tab_widget.tabText(1), "History")
+        
+        with patch.object(self.window, '_build_history_tab',
+                          wraps=self.window._build_history_tab) as mock_build:
+            self.window.tab_widget.setCurrentIndex(1)
+            self.window.tab_widget.setCurrentIndex(0)
+            self.window.tab_widget.setCurrentIndex(1)
+        
+        mock_build.assert_called_once()
+        self.assertIs(self.window.tab_widget.widget(1), self.window.history_tab_content)
+        self.assertEqual(self.window.tab_widget.currentIndex(), 1)
+        self.assertEqual(self.window.tab_widget.tabText(1), "History")
+        self.assertEqual(self.window.tab_widget.count(), 3)
+
+    @patch.object(ApiClient, 'get_book_by_id')
+    def test_fetch_updates_book_info_labels_in_place(self, mock_api_get_book_by_id):
+        """Test that fetching reuses the book info labels instead of recreating them."""
+        mock_api_get_book_by_id.return_value = {
+            "title": "First Book", "description": "x" * 600, "editions": []
+        }
+        labels = [self.window.book_title_label, self.window.book_slug_label,
+                  self.window.book_description_label, self.window.default_audio_label]
+        layout_count = self.window.info_layout.count()
+        
+        with patch.object(self.window.config_manager, 'load_token', return_value="test_token"):
+            self.window.book_id_line_edit.setText("1")
+            self.window.fetch_data_button.click()
+            wait_for_fetch()
+            self.assertEqual(self.window.book_description_label.toolTip(), "x" * 600)
+            
+            mock_api_get_book_by_id.return_value = {"title": "Second Book", "editions": []}
+            self.window.book_id_line_edit.setText("2")
+            self.window.fetch_data_button.click()
+            wait_for_fetch()
+        
+        self.assertEqual([self.window.book_title_label, self.window.book_slug_label,
+                          self.window.book_description_label, self.window.default_audio_label], labels)
+        self.assertEqual(self.window.info_layout.count(), layout_count)
+        self.assertIn("Second Book", self.window.book_title_label.text())
+        self.assertEqual(self.window.book_description_label.toolTip(), "")
+    
+    @patch('librarian_assistant.image_downloader.requests.Session.get')
+    def test_cover_loaded_in_background(self, mock_session_get):
+        """Test that covers load off the GUI thread."""
+        png_bytes = bytes.fromhex(
+            "89504e470d0a1a0a0000000d49484452000000010000000108060000001f15c489"
+            "0000000a49444154789c63000100000500010d0a2db40000000049454e44ae426082"
+        )
+        response = Mock(status_code=200, headers={})
+        response.iter_content.return_value = [png_bytes]
+        mock_session_get.return_value = response
+        
+        self.window.image_downloader = ImageDownloader()
+        self.window.actual_cover_display_label = QLabel()
+        
+        self.window._request_cover("http://example.com/cover.png")
+        self.assertEqual(len(self.window._cover_fetchers), 1)
+        for _ in range(200):
+            if not self.window._cover_fetchers:
+                break
+            QTest.qWait(10)
+        
+        self.assertFalse(self.window.actual_cover_display_label.pixmap().isNull())
+        mock_session_get.assert_called_once()
+    
+    def test_cover_ready_keeps_running_fetcher_for_same_url(self):
+        """Test that a finished cover load does not release another still-running load of the URL."""
+        url = "http://example.com/cover.png"
+        self.window.actual_cover_display_label = QLabel()
+        self.window.image_downloader = Mock()
+        
+        with patch.object(QThreadPool.globalInstance(), 'start') as mock_start:
+            self.window._request_cover(url)
+            self.window._request_cover(url)
+        first, second = (call.args[0] for call in mock_start.call_args_list)
+        
+        self.window._on_cover_ready(url, None, first)
+        
+        self.assertEqual(self.window._cover_fetchers, {second})
+    
+    def test_stale_cover_result_ignored(self):
+        """Test that a cover finishing after another was requested is not shown."""
+        self.window.actual_cover_display_label = QLabel("placeholder")
+        self.window._requested_cover_url = "http://example.com/new.png"
+        
+        self.window._on_cover_ready("http://example.com/old.png", None)
+        
+        self.assertEqual(self.window.actual_cover_display_label.text(), "placeholder")
+    
+    @patch.object(ApiClient, 'get_book_by_id')
+    def test_editions_population_restores_updates_on_error(self, mock_api_get_book_by_id):
+        """Test that repaints and signals are re-enabled even if filling the table fails."""
+        mock_api_get_book_by_id.return_value = {
+            "title": "Book", "editions": [{"id": "ed1", "score": 1, "title": "Edition"}]
+        }
+        table = self.window.editions_table_widget
+        
+        with patch.object(self.window.config_manager, 'load_token', return_value="test_token"), \
+             patch.object(self.window, '_create_table_item_with_tooltip', side_effect=RuntimeError("boom")), \
+             patch('librarian_assistant.main.QMessageBox.critical') as mock_critical:
+            self.window.book_id_line_edit.setText("1")
+            self.window.fetch_data_button.click()
+            wait_for_fetch()
+        
+        mock_critical.assert_called_once()
+        self.assertTrue(table.updatesEnabled())
+        self.assertFalse(table.signalsBlocked())
+    
+    @patch.object(ApiClient, 'get_book_by_id')
+    def test_fetch_uses_fixed_column_widths(self, mock_api_get_book_by_id):
+        """Test that fetching sets fixed column widths instead of measuring cell contents."""
+        mock_api_get_book_by_id.return_value = {
+            "title": "Book", "editions": [{"id": "ed1", "score": 1, "title": "x" * 400}]
+        }
+        table = self.window.editions_table_widget
+        
+        with patch.object(self.window.config_manager, 'load_token', return_value="test_token"), \
+             patch.object(table, 'resizeColumnsToContents') as mock_resize:
+            self.window.book_id_line_edit.setText("1")
+            self.window.fetch_data_button.click()
+            wait_for_fetch()
+        
+        mock_resize.assert_not_called()
+        header = table.horizontalHeader()
+        self.assertEqual(header.sectionSize(self.window.all_column_names.index("title")), COLUMN_WIDTHS["title"])
+        self.assertEqual(header.sectionSize(self.window.all_column_names.index("isbn_13")), DEFAULT_COLUMN_WIDTH)
+        self.assertEqual(header.sectionSize(self.window.all_column_names.index("Reading Format")),
+                         COLUMN_WIDTHS["Reading Format"])
+        self.assertEqual(header.sectionResizeMode(self.window.all_column_names.index("Cover Image?")), QHeaderView.Interactive)
+    
+    def test_na_highlight_style_shared_between_cells(self):
+        """Test that highlighted N/A cells reuse one set of brushes and font."""
+        first = self.window._create_table_item_with_na_highlight('N/A', 'isbn_13')
+        second = self.window._create_table_item_with_na_highlight('N/A', 'asin')
+        
+        self.assertIs(self.window._na_highlight_style(), self.window._na_highlight_style())
+        self.assertTrue(first.font().italic())
+        self.assertEqual(first.foreground(), second.foreground())
+        self.assertEqual(first.background(), second.background())
+        self.assertFalse(self.window._create_table_item_with_na_highlight('Hardcover', 'edition_format').font().italic())
+    
+    @patch.object(ApiClient, 'get_book_by_id')
+    def test_fetch_runs_off_the_gui_thread(self, mock_api_get_book_by_id):
+        """Test that the API call runs on a pool thread while the button is disabled."""
+        threads = []
+        def fake_get(book_id):
+            threads.append(threading.current_thread())
+            return {"title": "Background Book", "editions": []}
+        mock_api_get_book_by_id.side_effect = fake_get
+        
+        with patch.object(self.window.config_manager, 'load_token', return_value="test_token"):
+            self.window.book_id_line_edit.setText("7")
+            self.window.fetch_data_button.click()
+            self.assertFalse(self.window.fetch_data_button.isEnabled())
+            self.window.fetch_data_button.click()  # ignored while the first fetch runs
+            wait_for_fetch()
+        
+        self.assertEqual(len(threads), 1)
+        self.assertIsNot(threads[0], threading.main_thread())
+        self.assertTrue(self.window.fetch_data_button.isEnabled())
+        self.assertIn("Background Book", self.window.book_title_label.text())
+    
+    @patch.object(ApiClient, 'get_book_by_id')
+    def test_new_book_id_supersedes_fetch_in_progress(self, mock_api_get_book_by_id):
+        """Test that requesting another book mid-fetch shows that book, not the first one."""
+        mock_api_get_book_by_id.side_effect = lambda book_id: {"title": f"Book {book_id}", "editions": []}
+        
+        with patch.object(self.window.config_manager, 'load_token', return_value="test_token"), \
+                patch.object(QThreadPool.globalInstance(), 'start') as mock_start:
+            self.window.book_id_line_edit.setText("1")
+            self.window._on_fetch_data_clicked()
+            # As the History tab does while the first fetch is still running
+            self.window.book_id_line_edit.setText("2")
+            self.window._on_fetch_data_clicked()
+        
+        self.assertEqual([call.args[0].book_id for call in mock_start.call_args_list], [1, 2])
+        for call in mock_start.call_args_list:
+            call.args[0].run()
+        QApplication.processEvents()
+        
+        self.assertIn("Book 2", self.window.book_title_label.text())
+        self.assertEqual(self.window.book_id_line_edit.text(), "2")
+        self.assertTrue(self.window.fetch_data_button.isEnabled())
+    
+    @patch.object(ApiClient, 'get_book_by_id')
+    def test_refetch_keeps_running_fetcher_for_same_book(self, mock_api_get_book_by_id):
+        """Test that a finished fetch for a book does not release another still-running fetch of it."""
+        mock_api_get_book_by_id.side_effect = lambda book_id: {"title": f"Book {book_id}", "editions": []}
+        
+        with patch.object(self.window.config_manager, 'load_token', return_value="test_token"), \
+                patch.object(QThreadPool.globalInstance(), 'start') as mock_start:
+            for book_id in ("1", "2", "1"):
+                self.window.book_id_line_edit.setText(book_id)
+                self.window._on_fetch_data_clicked()
+        
+        first, second, third = (call.args[0] for call in mock_start.call_args_list)
+        self.assertEqual([first.book_id, second.book_id, third.book_id], [1, 2, 1])
+        first.run()
+        QApplication.processEvents()
+        
+        self.assertEqual(self.window._book_fetchers, {second, third})
+        self.assertIn("Book 1", self.window.book_title_label.text())
+        
+        second.run()
+        third.run()
+        QApplication.processEvents()
+        self.assertEqual(self.window._book_fetchers, set())
+    
+    def test_stale_fetch_result_ignored(self):
+        """Test that a fetch result nobody is waiting for does not touch the window."""
+        self.window._on_book_fetch_done(5, {"title": "Stale Book", "editions": []}, None)
+        
+        self.assertNotIn("Stale Book", self.window.book_title_label.text())
+    
+    @patch.object(ApiClient, 'get_book_by_id')
+    def test_editions_table_shaped_while_suspended(self, mock_api_get_book_by_id):
+        """Test that the editions table is resized and reshaped with repaints turned off."""
+        mock_api_get_book_by_id.return_value = {
+            "title": "Shaped Book",
+            "editions": [{"id": 1, "score": 5, "title": "One"}, {"id": 2, "score": 9, "title": "Two"}],
+        }
+        table = self.window.editions_table_widget
+        updates_enabled = []
+        real_set_row_count = table.setRowCount
+        def record_set_row_count(rows):
+            if rows:
+                updates_enabled.append(table.updatesEnabled())
+            real_set_row_count(rows)
+        
+        with patch.object(table, 'setRowCount', side_effect=record_set_row_count):
+            self._fetch_book(21)
+        
+        self.assertEqual(updates_enabled, [False])
+        self.assertTrue(table.updatesEnabled())
+        self.assertEqual(table.rowCount(), 2)
+    
+    @patch.object(ApiClient, 'get_book_by_id')
+    def test_edition_cells_follow_static_headers(self, mock_api_get_book_by_id):
+        """Test that every cell from the descriptor table lands under its own header."""
+        self.assertEqual(len(_EDITION_CELLS), len(STATIC_EDITION_HEADERS) - 3)
+        mock_api_get_book_by_id.return_value = {
+            "title": "Cells Book",
+            "editions": [{
+                "id": 3, "score": 7, "title": "Cell Edition", "isbn_13": "9780000000000",
+                "reading_format_id": 2, "pages": 320, "audio_seconds": 3725,
+                "release_date": "2021-03-04", "publisher": {"name": "Pub House"},
+                "language": {"language": "English"}, "image": {"url": "http://example.com/c.png"},
+            }],
+        }
+        
+        self._fetch_book(31)
+        
+        table = self.window.editions_table_widget
+        row = {name: table.item(0, table.column_index(name)) for name in STATIC_EDITION_HEADERS[3:]}
+        texts = {name: item.text() for name, item in row.items()}
+        self.assertEqual(texts["title"], "Cell Edition")
+        self.assertEqual(texts["Cover Image?"], "Yes")
+        self.assertEqual(texts["isbn_10"], "N/A")
+        self.assertEqual(texts["isbn_13"], "9780000000000")
+        self.assertEqual(texts["Reading Format"], "Audiobook")
+        self.assertEqual(texts["Duration"], "01:02:05")
+        self.assertEqual(texts["release_date"], "03/04/2021")
+        self.assertEqual(texts["Publisher"], "Pub House")
+        self.assertEqual(texts["Language"], "English")
+        self.assertEqual(texts["Country"], "N/A")
+        self.assertIsInstance(row["pages"], NumericTableWidgetItem)
+        self.assertIsInstance(row["Duration"], NumericTableWidgetItem)
+    
+    def test_format_release_date(self):
+        """Test that release dates become MM/DD/YYYY and anything else is kept as-is."""
+        cases = {
+            "2020-01-05": "01/05/2020",
+            "1999-12-31": "12/31/1999",
+            "2020-1-5": "01/05/2020",
+            "2020-02-30": "2020-02-30",
+            "2020-01-05T10:00": "2020-01-05T10:00",
+            "Spring 2020": "Spring 2020",
+        }
+        for value, expected in cases.items():
+            with self.subTest(value=value):
+                self.assertEqual(format_release_date(value), expected)
+    
+    def test_bulk_update_restores_table_state(self):
+        """Test that _bulk_update suspends a table and restores it even if the block fails."""
+        table = QTableWidget(2, 2)
+        table.setSortingEnabled(True)
+        
+        with self.assertRaises(RuntimeError):
+            with _bulk_update(table):
+                self.assertFalse(table.updatesEnabled())
+                self.assertTrue(table.signalsBlocked())
+                self.assertFalse(table.isSortingEnabled())
+                raise RuntimeError("populate failed")
+        
+        self.assertTrue(table.updatesEnabled())
+        self.assertFalse(table.signalsBlocked())
+        self.assertTrue(table.isSortingEnabled())
+    
+    def test_bulk_update_nested_keeps_outer_state(self):
+        """Test that a nested _bulk_update leaves the outer block's suspension in place."""
+        table = QTableWidget(2, 2)
+        
+        with _bulk_update(table):
+            with _bulk_update(table):
+                pass
+            self.assertFalse(table.updatesEnabled())
+            self.assertTrue(table.signalsBlocked())
+        
+        table.blockSignals(True)
+        with _bulk_update(table):
+            pass
+        self.assertTrue(table.signalsBlocked())
+    
+    def _fetch_book(self, book_id):
+        with patch.object(self.window.config_manager, 'load_token', return_value="test_token"):
+            self.window.book_id_line_edit.setText(str(book_id))
+            self.window.fetch_data_button.click()
+            wait_for_fetch()
+    
+    @patch.object(ApiClient, 'get_book_by_id')
+    def test_repeat_fetch_served_from_cache(self, mock_api_get_book_by_id):
+        """Test that fetching the same Book ID again does not call the API."""
+        mock_api_get_book_by_id.return_value = {"title": "Cached Book", "editions": []}
+        
+        self._fetch_book(11)
+        self.window.book_title_label.setText("")
+        self._fetch_book(11)
+        
+        mock_api_get_book_by_id.assert_called_once_with(11)
+        self.assertIn("Cached Book", self.window.book_title_label.text())
+        self.assertTrue(self.window.fetch_data_button.isEnabled())
+    
+    @patch.object(ApiClient, 'get_book_by_id')
+    def test_book_cache_expires(self, mock_api_get_book_by_id):
+        """Test that cached book data older than the TTL is fetched again."""
+        mock_api_get_book_by_id.return_value = {"title": "Cached Book", "editions": []}
+        
+        with patch('librarian_assistant.main.time.monotonic', return_value=1000.0):
+            self._fetch_book(12)
+        with patch('librarian_assistant.main.time.monotonic', return_value=1001.0 + BOOK_CACHE_TTL_SECONDS):
+            self._fetch_book(12)
+        
+        self.assertEqual(mock_api_get_book_by_id.call_count, 2)
+    
+    @patch.object(ApiClient, 'get_book_by_id')
+    def test_cache_hit_does_not_extend_lifetime(self, mock_api_get_book_by_id):
+        """Test that showing a cached book again does not restart its TTL."""
+        mock_api_get_book_by_id.return_value = {"title": "Cached Book", "editions": []}
+        
+        with patch('librarian_assistant.main.time.monotonic', return_value=1000.0):
+            self._fetch_book(14)
+        with patch('librarian_assistant.main.time.monotonic', return_value=1000.0 + BOOK_CACHE_TTL_SECONDS):
+            self._fetch_book(14)
+        with patch('librarian_assistant.main.time.monotonic', return_value=1001.0 + BOOK_CACHE_TTL_SECONDS):
+            self._fetch_book(14)
+        
+        self.assertEqual(mock_api_get_book_by_id.call_count, 2)
+    
+    @patch.object(ApiClient, 'get_book_by_id')
+    def test_cached_book_reuses_contributor_data(self, mock_api_get_book_by_id):
+        """Test that redisplaying a cached book skips the contributor aggregation."""
+        mock_api_get_book_by_id.return_value = {
+            "title": "Cached Book",
+            "editions": [{"id": 1, "score": 1, "cached_contributors": [{"author": {"name": "Writer"}}]}],
+        }
+        
+        with patch.object(self.window, '_process_contributor_data',
+                          wraps=self.window._process_contributor_data) as mock_process:
+            self._fetch_book(15)
+            self._fetch_book(15)
+        
+        mock_process.assert_called_once()
+        self.assertIn("Author 1", self.window.all_column_names)
+    
+    @patch.object(ApiClient, 'get_book_by_id')
+    def test_book_cache_cleared_on_new_token(self, mock_api_get_book_by_id):
+        """Test that saving a new token discards cached book data."""
+        mock_api_get_book_by_id.return_value = {"title": "Cached Book", "editions": []}
+        
+        self._fetch_book(13)
+        with patch.object(self.window.config_manager, 'save_token'):
+            self.window._handle_token_accepted("new_token")
+        self._fetch_book(13)
+        
+        self.assertEqual(mock_api_get_book_by_id.call_count, 2)
+    
+    @patch.object(ApiClient, 'get_book_by_id')
+    def test_authors_skip_malformed_contributions(self, mock_api_get_book_by_id):
+        """Test that contributions without a usable author name are ignored."""
+        mock_api_get_book_by_id.return_value = {
+            "title": "Book",
+            "contributions": [
+                {"author": {"name": "Author One"}},
+                "not a dict",
+                {"author": None},
+                {"author": {"name": None}},
+                {"author": {}},
+                {"author": {"name": "Author Two"}},
+            ],
+            "editions": [],
+        }
+        
+        with patch.object(self.window.config_manager, 'load_token', return_value="test_token"):
+            self.window.book_id_line_edit.setText("1")
+            self.window.fetch_data_button.click()
+            wait_for_fetch()
+        
+        self.assertIn("Author One, Author Two", self.window.book_authors_label.text())
+    
+    def test_sort_locates_id_column_once(self):
+        """Test that sorting resolves the ID column once, not once per row, and keeps checks."""
+        table = self.window.editions_table_widget
+        table.setColumnCount(3)
+        table.setHorizontalHeaderLabels(["Select", "id", "score"])
+        table.setRowCount(50)
+        for row in range(50):
+            checkbox_widget = QWidget()
+            checkbox = QCheckBox(checkbox_widget)
+            checkbox.setChecked(row == 7)
+            table.setCellWidget(row, 0, checkbox_widget)
+            table.setItem(row, 1, QTableWidgetItem(f"ed{row}"))
+            table.setItem(row, 2, QTableWidgetItem(f"{row:02d}"))
+        
+        with patch.object(table, '_find_id_column', wraps=table._find_id_column) as mock_find:
+            table.sortItems(2, Qt.DescendingOrder)
+        
+        mock_find.assert_called_once()
+        checked = [table._get_edition_id_for_row(row) for row in range(50)
+                   if table.cellWidget(row, 0).findChild(QCheckBox).isChecked()]
+        self.assertEqual(checked, ["ed7"])
+    
+    def test_header_names_ignore_sort_indicators(self):
+        """Test that column lookups use the labels as set, whatever indicator is shown."""
+        table = self.window.editions_table_widget
+        table.setColumnCount(3)
+        table.setHorizontalHeaderLabels(["Select", "id", "score"])
+        table.setRowCount(1)
+        
+        table._on_header_clicked(2)
+        
+        self.assertEqual(table.horizontalHeaderItem(2).text(), "score ▲")
+        self.assertEqual(table.header_name(2), "score")
+        self.assertEqual(table.column_index("score"), 2)
+        self.assertIsNone(table.column_index("pages"))
+        self.assertIsNone(table.header_name(3))
+        
+        table.setColumnCount(0)
+        self.assertIsNone(table.column_index("score"))
+    
+    def test_restore_default_sort_uses_cached_score_column(self):
+        """Test that restoring the default sort finds the score column without reading headers."""
+        table = self.window.editions_table_widget
+        table.setColumnCount(4)
+        table.setHorizontalHeaderLabels(["Select", "score", "id", "score"])
+        
+        with patch.object(table, 'horizontalHeaderItem') as mock_header_item, \
+             patch.object(table, 'sortItems') as mock_sort:
+            table._restore_default_sort()
+        
+        mock_header_item.assert_not_called()
+        mock_sort.assert_called_once_with(1, Qt.DescendingOrder)
+    
+    def test_numeric_items_compare_cached_values(self):
+        """Test that numeric items sort by the value given at construction, with N/A first."""
+        low = NumericTableWidgetItem("9", 9)
+        high = NumericTableWidgetItem("10", "10.5")
+        missing = QTableWidgetItem("N/A")
+        
+        with patch.object(NumericTableWidgetItem, 'data', side_effect=AssertionError("data() read during sort")):
+            self.assertTrue(low < high)
+            self.assertFalse(high < low)
+            self.assertFalse(low < missing)
+            self.assertTrue(NumericTableWidgetItem("N/A") < low)
+    
+    def test_editions_rows_have_fixed_height(self):
+        """Test that editions table rows share one fixed height instead of being measured."""
+        table = self.window.editions_table_widget
+        table.setColumnCount(1)
+        table.setRowCount(3)
+        table.setItem(1, 0, QTableWidgetItem("line one\nline two\nline three"))
+        QApplication.processEvents()
+        
+        header = table.verticalHeader()
+        self.assertEqual(header.sectionResizeMode(1), QHeaderView.Fixed)
+        self.assertEqual([table.rowHeight(row) for row in range(3)], [header.defaultSectionSize()] * 3)
+    
+    def test_fetches_recorded_in_history_as_one_batch(self):
+        """Test that searches queued before the event loop runs are saved together."""
+        self.window._pending_history.extend([(1, "Book 1"), (2, "Book 2")])
+        
+        with patch.object(self.window.history_manager, 'add_searches') as mock_add:
+            self.window._flush_pending_history()
+            self.window._flush_pending_history()
+        
+        mock_add.assert_called_once_with([(1, "Book 1"), (2, "Book 2")])
+        self.assertEqual(len(self.window._pending_history), 0)
+    
+    def test_close_saves_search_history(self):
+        """Test that closing the window records queued searches and closes the history manager."""
+        self.window._pending_history.append((1, "Book 1"))
+        
+        with patch.object(self.window.history_manager, 'add_searches') as mock_add, \
+                patch.object(self.window.history_manager, 'close') as mock_close:
+            self.window.close()
+        
+        mock_add.assert_called_once_with([(1, "Book 1")])
+        mock_close.assert_called_once()
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -79,7 +79,8 @@ class ApiClient:
             response.raise_for_status()  # Raises HTTPError for 4xx/5xx responses
             
             response_data = response.json()
-            logger.info(f"Full raw API JSON response received by ApiClient for Book ID {book_id}: {response_data}")
+            # Lazy %-formatting: the raw response is only rendered if DEBUG is emitted
+            logger.debug("Full raw API JSON response received by ApiClient for Book ID %s: %s", book_id, response_data)
 
             if "data" in response_data:
                 books_list = response_data["data"].get("books") # .get for safety
@@ -10,6 +10,9 @@ logger = logging.getLogger(__name__)
 SERVICE_NAME = "HardcoverApp"
 USERNAME = "BearerToken"
 
+# Marks the token cache as empty, since None is itself a valid cached value
+_UNLOADED = object()
+
 class ConfigManager:
     """
     Manages configuration data for the Librarian-Assistant application,
@@ -18,9 +21,9 @@ class ConfigManager:
     def __init__(self):
         """
         Initializes the ConfigManager.
-        (No in-memory token storage needed anymore)
+        The token is read from keyring on first use and then kept in memory.
         """
-        pass
+        self._cached_token = _UNLOADED
 
     def save_token(self, token: str | None):
         try:
@@ -29,21 +32,27 @@ class ConfigManager:
             actual_token_to_store = token 
             keyring.set_password(SERVICE_NAME, USERNAME, actual_token_to_store)
             logger.info("Token processed by keyring.set_password.")
+            # How backends persist None varies, so re-read it rather than assume
+            self._cached_token = token if token is not None else _UNLOADED
         except Exception as e:
             logger.error(f"Error saving token to keyring: {e}")
+            self._cached_token = _UNLOADED
 
     def load_token(self) -> str | None:
+        if self._cached_token is not _UNLOADED:
+            return self._cached_token
         try:
             stored_value = keyring.get_password(SERVICE_NAME, USERNAME)
             if stored_value is not None:
                 logger.info(f"Value loaded from keyring: '{stored_value}'")
                 # If keyring stored Python None as the string "None"
                 if stored_value == "None":
-                    return None
-                return stored_value
+                    stored_value = None
             else:
                 logger.info("No token found in keyring for the specified service/username.")
-                return None
+            self._cached_token = stored_value
+            return stored_value
         except Exception as e:
+            # Not cached, so the next call retries the keyring
             logger.error(f"Error loading token from keyring: {e}")
             return None
\ No newline at end of file
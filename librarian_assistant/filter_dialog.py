@@ -3,13 +3,30 @@
 from PyQt5.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QComboBox, 
                              QLineEdit, QPushButton, QLabel, QGroupBox,
                              QRadioButton, QButtonGroup, QScrollArea, QWidget,
-                             QDialogButtonBox, QDateEdit, QCheckBox)
-from PyQt5.QtCore import Qt, pyqtSignal, QDate
-from PyQt5.QtGui import QIcon
+                             QDialogButtonBox, QDateEdit, QStackedWidget)
+from PyQt5.QtCore import pyqtSignal, QDate, QSignalBlocker
+from PyQt5.QtGui import QStandardItemModel, QStandardItem
+from contextlib import contextmanager
 import logging
 
 logger = logging.getLogger(__name__)
 
+READING_FORMATS = ['Physical Book', 'Audiobook', 'E-Book']
+
+# Operators that filter without a user-supplied value
+_NO_VALUE_OPERATORS = frozenset({'Is empty', 'Is not empty', 'Is N/A', 'Is not N/A', 'Is "Yes"', 'Is "No"'})
+
+# Placeholder shown by the prebuilt value page of operators that take no value
+_NO_VALUE_LABEL_TEXT = "(no value needed)"
+
+
+def _build_item_model(items, parent=None):
+    """Build a QStandardItemModel holding one row per string in items."""
+    model = QStandardItemModel(parent)
+    for item in items:
+        model.appendRow(QStandardItem(item))
+    return model
+
 
 class FilterRule(QWidget):
     """
@@ -19,9 +36,24 @@ class FilterRule(QWidget):
     # Signal emitted when remove button is clicked
     remove_requested = pyqtSignal(object)  # Passes self
     
-    def __init__(self, columns, parent=None):
+    # Value readers keyed by value widget type; the plain QWidget is the date range page
+    _VALUE_EXTRACTORS = {
+        QLineEdit: lambda rule: rule.value_widget.text(),
+        QComboBox: lambda rule: rule.value_widget.currentText(),
+        QDateEdit: lambda rule: rule.value_widget.date().toString('yyyy-MM-dd'),
+        QWidget: lambda rule: {
+            'start': rule.start_date.date().toString('yyyy-MM-dd'),
+            'end': rule.end_date.date().toString('yyyy-MM-dd')
+        },
+        QLabel: lambda rule: None,  # No value needed
+    }
+    
+    def __init__(self, columns, parent=None, columns_model=None, formats_model=None):
         super().__init__(parent)
         self.columns = columns
+        # Optional item models shared by every rule in a FilterDialog
+        self._columns_model = columns_model
+        self._formats_model = formats_model
         self._setup_ui()
         
     def _setup_ui(self):
@@ -31,19 +63,62 @@ class FilterRule(QWidget):
         
         # Column selector
         self.column_combo = QComboBox()
-        self.column_combo.addItems(self.columns)
+        if self._columns_model is not None:
+            self.column_combo.setModel(self._columns_model)
+        else:
+            self.column_combo.addItems(self.columns)
         self.column_combo.currentTextChanged.connect(self._on_column_changed)
         layout.addWidget(self.column_combo)
         
         # Operator selector
         self.operator_combo = QComboBox()
         self.operator_combo.setMinimumWidth(150)
+        self.operator_combo.currentTextChanged.connect(self._on_operator_changed)
         layout.addWidget(self.operator_combo)
         
-        # Value input (will be replaced based on operator)
-        self.value_widget = QLineEdit()
-        self.value_widget.setPlaceholderText("Enter value...")
-        layout.addWidget(self.value_widget)
+        # Value input pages, built once and switched based on operator
+        self.value_stack = QStackedWidget()
+        
+        self._line_edit = QLineEdit()
+        self._line_edit.setPlaceholderText("Enter value...")
+        self.value_stack.addWidget(self._line_edit)
+        
+        self._combo_format = QComboBox()
+        if self._formats_model is not None:
+            self._combo_format.setModel(self._formats_model)
+        else:
+            self._combo_format.addItems(READING_FORMATS)
+        self.value_stack.addWidget(self._combo_format)
+        
+        self._date_single = QDateEdit()
+        self._date_single.setCalendarPopup(True)
+        self._date_single.setDate(QDate.currentDate())
+        self.value_stack.addWidget(self._date_single)
+        
+        # Two date inputs for 'Is between'
+        self._date_range = QWidget()
+        range_layout = QHBoxLayout(self._date_range)
+        range_layout.setContentsMargins(0, 0, 0, 0)
+        
+        self.start_date = QDateEdit()
+        self.start_date.setCalendarPopup(True)
+        self.start_date.setDate(QDate.currentDate())
+        range_layout.addWidget(self.start_date)
+        
+        range_layout.addWidget(QLabel("and"))
+        
+        self.end_date = QDateEdit()
+        self.end_date.setCalendarPopup(True)
+        self.end_date.setDate(QDate.currentDate())
+        range_layout.addWidget(self.end_date)
+        self.value_stack.addWidget(self._date_range)
+        
+        self._no_value_label = QLabel(_NO_VALUE_LABEL_TEXT)
+        self._no_value_label.setEnabled(False)
+        self.value_stack.addWidget(self._no_value_label)
+        
+        self.value_widget = self._line_edit
+        layout.addWidget(self.value_stack)
         
         # Remove button
         self.remove_button = QPushButton("✖")
@@ -57,14 +132,16 @@ class FilterRule(QWidget):
     
     def _on_column_changed(self, column_name):
         """Update operators based on selected column type."""
-        self.operator_combo.clear()
-        
         # Determine column type and appropriate operators
         column_type = self._get_column_type(column_name)
         operators = self._get_operators_for_type(column_type)
         
+        # Repopulate silently, then update the value widget exactly once
+        blocker = QSignalBlocker(self.operator_combo)
+        self.operator_combo.clear()
         self.operator_combo.addItems(operators)
-        self.operator_combo.currentTextChanged.connect(self._on_operator_changed)
+        blocker.unblock()
+        
         self._on_operator_changed(self.operator_combo.currentText())
     
     def _get_column_type(self, column_name):
@@ -101,73 +178,30 @@ class FilterRule(QWidget):
             return ['Equals']
     
     def _on_operator_changed(self, operator):
-        """Update value widget based on selected operator."""
-        # Remove old value widget
-        if self.value_widget:
-            self.value_widget.setParent(None)
-            self.value_widget.deleteLater()
-        
-        # Create appropriate value widget
-        if operator in ['Is empty', 'Is not empty', 'Is N/A', 'Is not N/A', 'Is "Yes"', 'Is "No"']:
+        """Show the value page matching the selected operator."""
+        if operator in _NO_VALUE_OPERATORS:
             # No value needed
-            self.value_widget = QLabel("(no value needed)")
-            self.value_widget.setEnabled(False)
+            page = self._no_value_label
         elif operator == 'Is between':
-            # Two date inputs
-            self.value_widget = QWidget()
-            layout = QHBoxLayout(self.value_widget)
-            layout.setContentsMargins(0, 0, 0, 0)
-            
-            self.start_date = QDateEdit()
-            self.start_date.setCalendarPopup(True)
-            self.start_date.setDate(QDate.currentDate())
-            layout.addWidget(self.start_date)
-            
-            layout.addWidget(QLabel("and"))
-            
-            self.end_date = QDateEdit()
-            self.end_date.setCalendarPopup(True)
-            self.end_date.setDate(QDate.currentDate())
-            layout.addWidget(self.end_date)
-        elif self._get_column_type(self.column_combo.currentText()) == 'date' and operator != 'Is between':
-            # Single date input
-            self.value_widget = QDateEdit()
-            self.value_widget.setCalendarPopup(True)
-            self.value_widget.setDate(QDate.currentDate())
+            page = self._date_range
+        elif self._get_column_type(self.column_combo.currentText()) == 'date':
+            page = self._date_single
         elif self.column_combo.currentText() == 'Reading Format':
-            # Dropdown for reading formats
-            self.value_widget = QComboBox()
-            self.value_widget.addItems(['Physical Book', 'Audiobook', 'E-Book'])
+            page = self._combo_format
         else:
-            # Default text input
-            self.value_widget = QLineEdit()
-            self.value_widget.setPlaceholderText("Enter value...")
+            page = self._line_edit
         
-        # Add the new value widget
-        self.layout().insertWidget(2, self.value_widget)
+        self.value_widget = page
+        self.value_stack.setCurrentWidget(page)
     
     def get_filter_data(self):
         """Get the filter data as a dictionary."""
         column = self.column_combo.currentText()
         operator = self.operator_combo.currentText()
         
-        # Get value based on widget type
-        value = None
-        if isinstance(self.value_widget, QLineEdit):
-            value = self.value_widget.text()
-        elif isinstance(self.value_widget, QComboBox):
-            value = self.value_widget.currentText()
-        elif isinstance(self.value_widget, QDateEdit):
-            value = self.value_widget.date().toString('yyyy-MM-dd')
-        elif isinstance(self.value_widget, QWidget) and operator == 'Is between':
-            # Handle date range
-            value = {
-                'start': self.start_date.date().toString('yyyy-MM-dd'),
-                'end': self.end_date.date().toString('yyyy-MM-dd')
-            }
-        elif isinstance(self.value_widget, QLabel):
-            # No value needed
-            value = None
+        # Get value based on the exact type of the visible value widget
+        extractor = self._VALUE_EXTRACTORS.get(type(self.value_widget))
+        value = extractor(self) if extractor else None
         
         return {
             'column': column,
@@ -187,16 +221,40 @@ class FilterDialog(QDialog):
     def __init__(self, column_names, parent=None):
         super().__init__(parent)
         self.column_names = column_names
-        self.filter_rules = []
+        # True while a bulk operation defers per-rule UI state updates
+        self._bulk = False
         
         self.setWindowTitle("Advanced Filter")
         self.setModal(True)
         self.resize(800, 400)
         
-        self._setup_ui()
+        # The widgets are built on first show, not here
+        self._ui_ready = False
+    
+    def _ensure_ui(self):
+        """Build the dialog UI if it has not been built yet."""
+        if not self._ui_ready:
+            self._ui_ready = True
+            self._setup_ui()
+    
+    def exec_(self):
+        """Build the UI if needed, then run the dialog modally."""
+        self._ensure_ui()
+        return super().exec_()
+    
+    def showEvent(self, event):
+        """Build the UI the first time the dialog is shown."""
+        self._ensure_ui()
+        super().showEvent(event)
     
     def _setup_ui(self):
         """Set up the dialog UI."""
+        self.filter_rules = []
+        
+        # Item models shared by the combo boxes of every rule
+        self._columns_model = _build_item_model(self.column_names, self)
+        self._formats_model = _build_item_model(READING_FORMATS, self)
+        
         layout = QVBoxLayout(self)
         
         # Instructions
@@ -262,23 +320,49 @@ class FilterDialog(QDialog):
         # Add an initial rule
         self._add_rule()
     
+    @contextmanager
+    def _bulk_update(self):
+        """Suspend repaints and signals on the rules container during bulk changes."""
+        # Nested calls leave the outermost caller in charge of re-enabling
+        already_frozen = not self.rules_container.updatesEnabled()
+        if not already_frozen:
+            self.rules_container.setUpdatesEnabled(False)
+        previously_blocked = self.rules_container.blockSignals(True)
+        try:
+            yield
+        finally:
+            self.rules_container.blockSignals(previously_blocked)
+            if not already_frozen:
+                self.rules_container.setUpdatesEnabled(True)
+    
     def _add_rule(self):
         """Add a new filter rule."""
-        rule = FilterRule(self.column_names)
-        rule.remove_requested.connect(self._remove_rule)
-        
-        self.filter_rules.append(rule)
-        self.rules_layout.addWidget(rule)
+        with self._bulk_update():
+            rule = FilterRule(self.column_names, columns_model=self._columns_model,
+                              formats_model=self._formats_model)
+            rule.remove_requested.connect(self._remove_rule)
+            
+            self.filter_rules.append(rule)
+            self.rules_layout.addWidget(rule)
         
-        # Update UI state
-        self._update_ui_state()
+        # Update UI state (deferred to the end of a bulk operation)
+        if not self._bulk:
+            self._update_ui_state()
     
-    def _remove_rule(self, rule):
-        """Remove a filter rule."""
+    def _detach_rule(self, rule):
+        """Remove a rule widget without touching the rest of the dialog state."""
         if rule in self.filter_rules:
             self.filter_rules.remove(rule)
             rule.setParent(None)
             rule.deleteLater()
+    
+    def _remove_rule(self, rule):
+        """Remove a filter rule."""
+        self._detach_rule(rule)
+        
+        # Bulk operations ensure the minimum rule and refresh state themselves
+        if self._bulk:
+            return
             
         # Ensure at least one rule exists
         if not self.filter_rules:
@@ -289,9 +373,18 @@ class FilterDialog(QDialog):
     
     def _clear_all_rules(self):
         """Clear all filter rules."""
-        # Remove all rules
-        for rule in self.filter_rules[:]:
-            self._remove_rule(rule)
+        self._bulk = True
+        try:
+            with self._bulk_update():
+                for rule in self.filter_rules[:]:
+                    self._remove_rule(rule)
+                
+                # Leave a single empty rule behind
+                self._add_rule()
+        finally:
+            self._bulk = False
+        
+        self._update_ui_state()
     
     def _update_ui_state(self):
         """Update UI elements based on current state."""
@@ -309,9 +402,7 @@ class FilterDialog(QDialog):
         for rule in self.filter_rules:
             filter_data = rule.get_filter_data()
             # Only include rules with values (unless operator doesn't need one)
-            no_value_operators = ['Is empty', 'Is not empty', 'Is N/A', 'Is not N/A', 'Is "Yes"', 'Is "No"']
-            
-            if filter_data['operator'] in no_value_operators:
+            if filter_data['operator'] in _NO_VALUE_OPERATORS:
                 # These operators don't need values
                 filters.append(filter_data)
             elif filter_data['value'] is not None and filter_data['value'] != '':
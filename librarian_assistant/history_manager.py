@@ -1,27 +1,93 @@
 # ABOUTME: This file manages the search history functionality for the Librarian-Assistant.
 # ABOUTME: It handles storing, loading, and managing book search history with local persistence.
+import functools
 import json
 import os
+import queue
+import threading
+from collections import OrderedDict
 from datetime import datetime
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Sequence, Tuple
 import logging
 
+from PyQt5.QtCore import QThread, QTimer
+
+try:
+    import orjson
+except ImportError:  # Optional speedup; fall back to the standard library
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 
+class HistoryIOWorker(QThread):
+    """
+    Background thread that owns history file writes.
+    
+    Jobs of (entries, append) are put on `queue` and written in order;
+    putting None stops the thread.
+    """
+    
+    def __init__(self, write_entries, parent=None):
+        """
+        Initialize the worker.
+        
+        Args:
+            write_entries: Callable taking (entries, append) that writes entries to disk
+            parent: Optional parent QObject
+        """
+        super().__init__(parent)
+        self.queue = queue.Queue()
+        self._write_entries = write_entries
+    
+    def run(self):
+        """Write queued snapshots until a None sentinel arrives."""
+        while True:
+            job = self.queue.get()
+            try:
+                if job is None:
+                    break
+                entries, append = job
+                self._write_entries(entries, append)
+            finally:
+                self.queue.task_done()
+
+
 class HistoryManager:
     """
     Manages search history for the Librarian-Assistant application.
-    Stores book search history locally in JSON format.
+    Stores book search history locally as an append-only JSON Lines log,
+    oldest entry first; a later line for the same book supersedes earlier ones.
+    
+    Mutations are buffered in memory and written to disk once after a short
+    quiet period (FLUSH_DELAY seconds), on flush(), or on close(), which the
+    owner must call before exiting.
+    New searches are appended; the file is only rewritten on clear, when
+    migrating the older JSON array file, or when superseded lines make it more
+    than twice as long as the history. The writes themselves run on a
+    HistoryIOWorker thread, off the UI thread.
     """
     
-    def __init__(self, storage_dir: str = None):
+    # Seconds to wait after the last mutation before writing the history file
+    FLUSH_DELAY = 0.5
+    
+    # Number of distinct search queries whose results are cached
+    SEARCH_CACHE_SIZE = 64
+    
+    # Default cap on stored entries
+    MAX_ENTRIES = 500
+    
+    def __init__(self, storage_dir: str = None, max_entries: int = None):
         """
         Initialize the HistoryManager.
         
         Args:
             storage_dir: Directory to store history file. If None, uses user's app data directory.
+            max_entries: Maximum number of entries kept; the least recently searched are
+                evicted beyond it. If None, uses MAX_ENTRIES.
         """
+        self.max_entries = self.MAX_ENTRIES if max_entries is None else max_entries
+        
         if storage_dir is None:
             # Use platform-appropriate app data directory
             if os.name == 'nt':  # Windows
@@ -32,7 +98,9 @@ class HistoryManager:
                 storage_dir = os.path.join(app_data, 'LibrarianAssistant')
         
         self.storage_dir = storage_dir
-        self.history_file = os.path.join(storage_dir, 'search_history.json')
+        self.history_file = os.path.join(storage_dir, 'search_history.jsonl')
+        # Whole-array format used by earlier versions; migrated on first load
+        self.legacy_history_file = os.path.join(storage_dir, 'search_history.json')
         
         # Ensure storage directory exists
         try:
@@ -41,11 +109,34 @@ class HistoryManager:
             logger.error(f"Failed to create storage directory: {e}")
             # Continue anyway - save/load operations will also fail but won't crash
         
-        # In-memory cache
-        self._history = []
+        # In-memory cache keyed by book_id, ordered newest first
+        self._history = OrderedDict()
+        # Precomputed search keys per book_id: (str(book_id), lowercase title)
+        self._search_keys = {}
+        # Bumped on every change so cached search results keyed by it go stale
+        self._version = 0
+        self._search_cached = functools.lru_cache(maxsize=self.SEARCH_CACHE_SIZE)(self._search_uncached)
+        # (version, tuple of entries newest first) shared by readers until the next change
+        self._snapshot_cache = None
         
-        # Load existing history
-        self.load_history()
+        # Delayed-write state: pending changes and the timer that will save them
+        self._lock = threading.RLock()
+        self._write_lock = threading.Lock()
+        self._dirty = False
+        # Entries to append, oldest first, unless the whole file must be rewritten
+        self._pending_appends = []
+        self._needs_rewrite = False
+        # Lines in the history file, to decide when it is worth compacting
+        self._log_lines = 0
+        # Single-shot timer on the owning (GUI) thread that hands changes to the I/O worker
+        self._flush_timer = QTimer()
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.timeout.connect(self._submit_pending)
+        # Started on the first write so idle instances never spawn a thread
+        self._io_worker = None
+        
+        # Existing history is read on first access rather than here
+        self._loaded = False
     
     def add_search(self, book_id: int, book_title: str) -> None:
         """
@@ -55,69 +146,251 @@ class HistoryManager:
             book_id: The ID of the book that was searched
             book_title: The title of the book
         """
-        search_time = datetime.now().isoformat()
-        
-        # Check if this book is already in history
-        existing_index = None
-        for i, entry in enumerate(self._history):
-            if entry['book_id'] == book_id:
-                existing_index = i
-                break
-        
-        # If exists, update the timestamp and move to front
-        if existing_index is not None:
-            self._history.pop(existing_index)
+        self.add_searches([(book_id, book_title)])
+    
+    def add_searches(self, searches: List[Tuple[int, str]]) -> None:
+        """
+        Add several searches to the history with a single scheduled write.
         
-        # Add new entry at the beginning
-        new_entry = {
-            'book_id': book_id,
-            'book_title': book_title,
-            'search_time': search_time
-        }
-        self._history.insert(0, new_entry)
+        Args:
+            searches: (book_id, book_title) pairs in the order they were searched;
+                the last one ends up newest
+        """
+        if not searches:
+            return
+        search_time = datetime.now().isoformat()
+        self._ensure_loaded()
         
-        # Save to file
-        self.save_history()
+        with self._lock:
+            for book_id, book_title in searches:
+                # Drop any previous entry for this book, then put the new one at the front
+                self._history.pop(book_id, None)
+                entry = {
+                    'book_id': book_id,
+                    'book_title': book_title,
+                    'search_time': search_time
+                }
+                self._history[book_id] = entry
+                self._history.move_to_end(book_id, last=False)
+                self._pending_appends.append(entry)
+                self._search_keys[book_id] = (str(book_id), book_title.lower())
+            self._evict_overflow()
+            self._version += 1
+            
+            # Persist after a short quiet period
+            self._schedule_flush()
         
-        logger.info(f"Added book to search history: ID {book_id}, Title: {book_title}")
+        for book_id, book_title in searches:
+            logger.info(f"Added book to search history: ID {book_id}, Title: {book_title}")
     
-    def get_history(self) -> List[Dict]:
+    def get_history(self) -> Sequence[Dict]:
         """
         Get the current search history.
         
         Returns:
-            List of history entries, each containing book_id, book_title, and search_time
+            Read-only tuple of history entries, newest first, each containing book_id,
+            book_title, and search_time. The same tuple is returned until the history
+            changes, so the entries must not be modified.
         """
-        return self._history.copy()
+        self._ensure_loaded()
+        return self._snapshot()
+    
+    def _snapshot(self) -> tuple:
+        """Return the entries newest first, building the tuple once per history version."""
+        with self._lock:
+            cached = self._snapshot_cache
+            if cached is None or cached[0] != self._version:
+                cached = (self._version, tuple(self._history.values()))
+                self._snapshot_cache = cached
+            return cached[1]
     
     def clear_history(self) -> None:
         """Clear all search history."""
-        self._history = []
-        self.save_history()
+        with self._lock:
+            self._history = OrderedDict()
+            self._search_keys = {}
+            self._version += 1
+            # Nothing on disk is worth reading any more
+            self._loaded = True
+            self._needs_rewrite = True
+            self._schedule_flush()
         logger.info("Search history cleared")
     
+    def _schedule_flush(self) -> None:
+        """Mark history as changed and (re)arm the delayed-write timer."""
+        with self._lock:
+            self._dirty = True
+        self._flush_timer.start(int(self.FLUSH_DELAY * 1000))
+    
+    def _submit_pending(self) -> None:
+        """Hand pending changes to the I/O worker without waiting."""
+        with self._lock:
+            if not self._dirty:
+                return
+            job = self._take_pending()
+            if self._io_worker is None:
+                self._io_worker = HistoryIOWorker(self._write_entries)
+                self._io_worker.start()
+            self._io_worker.queue.put(job)
+    
+    def _take_pending(self):
+        """Return the (entries, append) write job for pending changes and reset them."""
+        appends = self._pending_appends
+        if self._needs_rewrite or self._log_lines + len(appends) > 2 * max(len(self._history), 1):
+            # Compact: one line per live entry, oldest first
+            job = (list(reversed(self._history.values())), False)
+            self._log_lines = len(self._history)
+        else:
+            job = (appends, True)
+            self._log_lines += len(appends)
+        self._pending_appends = []
+        self._needs_rewrite = False
+        self._dirty = False
+        return job
+    
+    def flush(self) -> None:
+        """Write pending history changes to disk now and wait for the write to finish."""
+        self._flush_timer.stop()
+        self._submit_pending()
+        if self._io_worker is not None:
+            self._io_worker.queue.join()
+    
+    def close(self) -> None:
+        """Flush pending changes and stop the I/O worker thread."""
+        self.flush()
+        with self._lock:
+            worker, self._io_worker = self._io_worker, None
+        if worker is not None:
+            worker.queue.put(None)
+            worker.wait()
+    
     def save_history(self) -> None:
-        """Save the current history to file."""
-        try:
-            with open(self.history_file, 'w', encoding='utf-8') as f:
-                json.dump(self._history, f, indent=2, ensure_ascii=False)
-            logger.debug(f"History saved to {self.history_file}")
-        except Exception as e:
-            logger.error(f"Failed to save history: {e}")
+        """Rewrite the whole history file, synchronously."""
+        with self._lock:
+            self._needs_rewrite = True
+            self._dirty = True
+            entries, append = self._take_pending()
+        self._write_entries(entries, append)
+    
+    def _write_entries(self, entries: List[Dict], append: bool = False) -> bool:
+        """
+        Write entries (oldest first) to the history file. Returns True on success.
+        
+        With append, the entries are added to the end of the file; otherwise they
+        replace its contents.
+        """
+        # Serialize up front so the file sees one write rather than one per entry
+        if orjson is not None:
+            data = b''.join(orjson.dumps(entry) + b'\n' for entry in entries)
+        else:
+            data = ''.join(json.dumps(entry, ensure_ascii=False) + '\n'
+                           for entry in entries).encode('utf-8')
+        with self._write_lock:
+            try:
+                if append:
+                    with open(self.history_file, 'ab') as f:
+                        f.write(data)
+                else:
+                    # Write to a temporary file and swap it in so a crash never leaves a truncated history
+                    temp_file = self.history_file + '.tmp'
+                    with open(temp_file, 'wb') as f:
+                        f.write(data)
+                    os.replace(temp_file, self.history_file)
+                    if os.path.exists(self.legacy_history_file):
+                        os.remove(self.legacy_history_file)
+                logger.debug(f"History saved to {self.history_file}")
+                return True
+            except Exception as e:
+                logger.error(f"Failed to save history: {e}")
+                # The file may now lack these entries (or, for a failed legacy
+                # migration, not exist at all), so rewrite it in full next time
+                with self._lock:
+                    self._needs_rewrite = True
+                    self._dirty = True
+                return False
+    
+    def _ensure_loaded(self) -> None:
+        """Load history from file the first time it is needed."""
+        if self._loaded:
+            return
+        with self._lock:
+            if not self._loaded:
+                self.load_history()
     
     def load_history(self) -> None:
         """Load history from file."""
+        self._loaded = True
+        self._version += 1
         try:
             if os.path.exists(self.history_file):
-                with open(self.history_file, 'r', encoding='utf-8') as f:
-                    self._history = json.load(f)
-                logger.debug(f"History loaded from {self.history_file}, {len(self._history)} entries")
+                entries = self._read_log()
+                # The log is oldest first; index it newest first
+                entries.reverse()
+                source = self.history_file
+            elif os.path.exists(self.legacy_history_file):
+                with open(self.legacy_history_file, 'rb') as f:
+                    data = f.read()
+                entries = orjson.loads(data) if orjson is not None else json.loads(data)
+                source = self.legacy_history_file
+                # Convert to the line format on the next write
+                self._needs_rewrite = True
+                self._schedule_flush()
             else:
-                self._history = []
+                self._history = OrderedDict()
+                self._search_keys = {}
                 logger.debug("No existing history file found, starting with empty history")
+                return
+            self._history = self._index_entries(entries)
+            self._evict_overflow()
+            self._search_keys = {
+                book_id: (str(book_id), entry['book_title'].lower())
+                for book_id, entry in self._history.items()
+            }
+            logger.debug(f"History loaded from {source}, {len(self._history)} entries")
         except Exception as e:
             logger.error(f"Failed to load history: {e}")
-            self._history = []
+            self._history = OrderedDict()
+            self._search_keys = {}
+    
+    def _read_log(self) -> List[Dict]:
+        """
+        Read every entry from the history file, oldest first, skipping malformed lines.
+        
+        If any line is skipped or the file does not end with a newline, the next
+        write rewrites the file so new entries are never appended onto a broken tail.
+        """
+        loads = orjson.loads if orjson is not None else json.loads
+        with open(self.history_file, 'rb') as f:
+            data = f.read()
+        lines = data.splitlines()
+        self._log_lines = len(lines)
+        if data and not data.endswith(b'\n'):
+            self._needs_rewrite = True
+        entries = []
+        for line_number, line in enumerate(lines, 1):
+            if not line.strip():
+                continue
+            try:
+                entries.append(loads(line))
+            except ValueError as e:
+                # Most likely a write cut short by a crash; the other lines are still good
+                logger.error(f"Skipping malformed history line {line_number}: {e}")
+                self._needs_rewrite = True
+        return entries
+    
+    def _evict_overflow(self) -> None:
+        """Drop the least recently searched entries beyond max_entries."""
+        while len(self._history) > self.max_entries:
+            evicted_id, _ = self._history.popitem(last=True)
+            self._search_keys.pop(evicted_id, None)
+    
+    @staticmethod
+    def _index_entries(entries: List[Dict]) -> "OrderedDict[int, Dict]":
+        """Key a newest-first list of entries by book_id, keeping the newest of any duplicates."""
+        indexed = OrderedDict()
+        for entry in entries:
+            indexed.setdefault(entry['book_id'], entry)
+        return indexed
     
     def search_history(self, query: str) -> List[Dict]:
         """
@@ -129,21 +402,29 @@ class HistoryManager:
         Returns:
             List of matching history entries
         """
+        self._ensure_loaded()
         if not query:
-            return self._history.copy()
+            return list(self._history.values())
         
-        query_lower = query.lower()
-        matches = []
+        return list(self._search_cached(query.lower(), self._version))
+    
+    def _search_uncached(self, query_lower: str, version: int) -> tuple:
+        """
+        Scan history for a lowercase query.
         
-        for entry in self._history:
+        The version argument only keys the result cache; results cached for an
+        older version are never looked up again.
+        """
+        search_keys = self._search_keys
+        matches = []
+        for book_id, entry in self._history.items():
             # Search in book ID (as string) and title
-            if (query_lower in str(entry['book_id']) or 
-                query_lower in entry['book_title'].lower()):
+            id_str, title_lower = search_keys[book_id]
+            if query_lower in id_str or query_lower in title_lower:
                 matches.append(entry)
-        
-        return matches
+        return tuple(matches)
     
-    def sort_history(self, sort_by: str) -> List[Dict]:
+    def sort_history(self, sort_by: str) -> Sequence[Dict]:
         """
         Sort history entries.
         
@@ -151,20 +432,18 @@ class HistoryManager:
             sort_by: Sort criteria - 'book_id', 'title', or 'date'
             
         Returns:
-            Sorted list of history entries
+            Sorted sequence of history entries
         """
-        history_copy = self._history.copy()
+        self._ensure_loaded()
+        entries = self._snapshot()
         
         if sort_by == 'book_id':
-            history_copy.sort(key=lambda x: x['book_id'])
+            return sorted(entries, key=lambda x: x['book_id'])
         elif sort_by == 'title':
-            history_copy.sort(key=lambda x: x['book_title'].lower())
-        elif sort_by == 'date':
-            # Default order is already newest first, so reverse for oldest first
-            # But spec says "newest first" so we keep default order
-            pass
-        
-        return history_copy
+            search_keys = self._search_keys
+            return sorted(entries, key=lambda x: search_keys[x['book_id']][1])
+        # 'date': stored order is already newest first, as the spec requires
+        return entries
     
     def get_entry_by_book_id(self, book_id: int) -> Optional[Dict]:
         """
@@ -176,11 +455,10 @@ class HistoryManager:
         Returns:
             History entry if found, None otherwise
         """
-        for entry in self._history:
-            if entry['book_id'] == book_id:
-                return entry
-        return None
+        self._ensure_loaded()
+        return self._history.get(book_id)
     
     def get_history_count(self) -> int:
         """Get the number of entries in history."""
+        self._ensure_loaded()
         return len(self._history)
\ No newline at end of file
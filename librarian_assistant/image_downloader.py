@@ -3,13 +3,36 @@
 
 import logging
 import requests # Import the requests library
-from PyQt5.QtGui import QPixmap # Import QPixmap
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from PyQt5.QtCore import QObject, QRunnable, pyqtSignal
+from PyQt5.QtGui import QImage, QPixmap # Import QPixmap
 
 logger = logging.getLogger(__name__)
 
+# (connect, read) timeouts in seconds for image requests
+REQUEST_TIMEOUT = (3, 10)
+
+# Largest image body accepted; bigger responses are abandoned mid-stream
+MAX_IMAGE_BYTES = 10 * 1024 * 1024
+
+# Size of each chunk read from a streamed response
+DOWNLOAD_CHUNK_SIZE = 65536
+
 class ImageDownloader:
     """A utility class for downloading images."""
-    
+
+    def __init__(self):
+        """Set up a pooled, keep-alive HTTP session shared by all downloads."""
+        self._session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=32,
+            max_retries=Retry(total=3, backoff_factor=0.3)
+        )
+        self._session.mount('https://', adapter)
+        self._session.mount('http://', adapter)
+
     def download_image(self, url: str) -> QPixmap | None:
         """
         Downloads an image from the given URL and returns it as a QPixmap.
@@ -18,19 +41,94 @@ class ImageDownloader:
         if not url:
             logger.warning("Image download requested with no URL.")
             return None
-        
+
+        return self._pixmap_from_bytes(url, self._fetch_image_bytes(url))
+
+    def load_image(self, url: str) -> QImage | None:
+        """
+        Fetches an image from the network as a QImage.
+
+        Unlike download_image this is safe to call from worker threads; convert the
+        result with QPixmap.fromImage on the GUI thread.
+        """
+        if not url:
+            return None
+        data = self._fetch_image_bytes(url)
+        if data is None:
+            return None
+        image = QImage()
+        if not image.loadFromData(data):
+            logger.error(f"Failed to load image data into QImage from: {url}. Data might be corrupt or not an image.")
+            return None
+        return image
+
+    def _pixmap_from_bytes(self, url: str, data: bytes | None) -> QPixmap | None:
+        """Build a QPixmap from downloaded bytes, or return None."""
+        if data is None:
+            return None
+
+        pixmap = QPixmap()
+        if pixmap.loadFromData(data):
+            logger.info(f"Successfully loaded image into QPixmap from: {url}")
+            return pixmap
+        else:
+            logger.error(f"Failed to load image data into QPixmap from: {url}. Data might be corrupt or not an image.")
+            return None
+
+    def _fetch_image_bytes(self, url: str) -> bytes | None:
+        """Return image bytes from the network, or None on failure."""
+        response = None
         try:
             logger.info(f"Attempting to download image from: {url}")
-            response = requests.get(url, stream=True) # stream=True is good for binary files
+            response = self._session.get(url, stream=True, timeout=REQUEST_TIMEOUT) # stream=True is good for binary files
             response.raise_for_status() # Raise an exception for bad status codes (4xx or 5xx)
-            
-            pixmap = QPixmap()
-            if pixmap.loadFromData(response.content):
-                logger.info(f"Successfully loaded image into QPixmap from: {url}")
-                return pixmap
-            else:
-                logger.error(f"Failed to load image data into QPixmap from: {url}. Data might be corrupt or not an image.")
-                return None
+            return self._read_limited(response)
         except requests.exceptions.RequestException as e:
             logger.error(f"Error downloading image from {url}: {e}")
-            return None
\ No newline at end of file
+            return None
+        except ValueError as e:
+            logger.error(f"Rejected image from {url}: {e}")
+            return None
+        finally:
+            if response is not None:
+                response.close()
+
+    @staticmethod
+    def _read_limited(response) -> bytes:
+        """Read a streamed response body, raising ValueError past MAX_IMAGE_BYTES."""
+        declared = response.headers.get('Content-Length')
+        if declared and declared.isdigit() and int(declared) > MAX_IMAGE_BYTES:
+            raise ValueError(f"declared size {declared} bytes exceeds {MAX_IMAGE_BYTES}")
+        buf = bytearray()
+        for chunk in response.iter_content(DOWNLOAD_CHUNK_SIZE):
+            buf += chunk
+            if len(buf) > MAX_IMAGE_BYTES:
+                raise ValueError(f"body exceeds {MAX_IMAGE_BYTES} bytes")
+        return bytes(buf)
+
+
+class CoverFetcher(QRunnable):
+    """
+    Loads one image on a QThreadPool thread.
+
+    The result is delivered as a QImage (QPixmap may only be created on the GUI
+    thread) through signals.done(url, image, fetcher), with image None on failure
+    and fetcher this runnable, so the receiver can release exactly that one.
+    """
+
+    class Signals(QObject):
+        done = pyqtSignal(str, object, object)
+
+    def __init__(self, downloader: ImageDownloader, url: str):
+        super().__init__()
+        self.downloader = downloader
+        self.url = url
+        self.signals = CoverFetcher.Signals()
+
+    def run(self):
+        try:
+            image = self.downloader.load_image(self.url)
+        except Exception as e:
+            logger.error(f"Unexpected error loading image from {self.url}: {e}")
+            image = None
+        self.signals.done.emit(self.url, image, self)
\ No newline at end of file
@@ -1,21 +1,28 @@
 # ABOUTME: This file is the main entry point for the Librarian-Assistant application.
 # ABOUTME: It defines the main window and initializes the application.
+from __future__ import annotations
+
+import html
+import re
 import sys
-from datetime import datetime
+import time
+from collections import OrderedDict, deque
+from contextlib import contextmanager
+from types import MappingProxyType
+from datetime import date, datetime
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QTabWidget, QWidget, QLineEdit, QTableWidget, QTableWidgetItem, QScrollArea,
                              QVBoxLayout, QHBoxLayout, QLabel, QGroupBox, QPushButton, QHeaderView, QComboBox, QCheckBox, QMessageBox)
-from PyQt5.QtGui import QIntValidator, QValidator, QColor
-from PyQt5.QtCore import Qt
+from PyQt5.QtGui import QIntValidator, QValidator, QBrush, QColor, QPixmap
+from PyQt5.QtCore import Qt, QTimer, QThreadPool, QObject, QRunnable, pyqtSignal, pyqtSlot
 
 # Import configuration and authentication modules
 from librarian_assistant.config_manager import ConfigManager
-from librarian_assistant.token_dialog import TokenDialog
 # Import API client and exceptions
 from librarian_assistant.api_client import ApiClient
 from librarian_assistant.exceptions import (ApiException, ApiNotFoundError, 
                                            ApiAuthError, NetworkError, ApiProcessingError)
 # Import image handling
-from librarian_assistant.image_downloader import ImageDownloader
+from librarian_assistant.image_downloader import ImageDownloader, CoverFetcher
 # Import ColumnConfigDialog for column configuration
 from librarian_assistant.column_config_dialog import ColumnConfigDialog
 # Import FilterDialog for advanced filtering
@@ -23,7 +30,11 @@ from librarian_assistant.filter_dialog import FilterDialog
 # Import HistoryManager for search history
 from librarian_assistant.history_manager import HistoryManager
 # Import enhanced stylesheet
-from librarian_assistant.enhanced_stylesheet import ENHANCED_DARK_THEME
+from librarian_assistant.enhanced_stylesheet import apply_theme
+# Import N/A highlighting helpers
+from librarian_assistant.styling_constants import (N_A_HIGHLIGHT_TEXT_COLOR_HEX, N_A_HIGHLIGHT_BG_COLOR_HEX,
+                                                   get_na_highlight_html)
+from librarian_assistant.ui_utils import is_na_highlightable, should_highlight_general_info_na
 
 import webbrowser # For opening external links
 import logging
@@ -32,6 +43,104 @@ logger = logging.getLogger(__name__)
 # Constants
 HARDCOVER_API_BASE_URL = "https://api.hardcover.app/v1/graphql"
 MAX_DESC_CHARS = 500 # Define max characters for display
+DESC_ELLIPSIS = "..." # Appended to descriptions cut at MAX_DESC_CHARS
+
+# Stand-in for missing nested objects in edition data, shared so lookups don't allocate
+_EMPTY = MappingProxyType({})
+
+# Visible text of the link in a ClickableLabel's HTML
+_LINK_TEXT_PATTERN = re.compile(r'>([^<]+)</a>')
+
+# Editions table labels for reading_format_id values
+READING_FORMAT_NAMES = {1: "Physical Book", 2: "Audiobook", 4: "E-Book"}
+
+# Editions table columns shown before the per-role contributor columns (spec.md section 2.4.1)
+STATIC_EDITION_HEADERS = (
+    "Select", "id", "score", "title", "subtitle", "Cover Image?",
+    "isbn_10", "isbn_13", "asin", "Reading Format", "pages",
+    "Duration", "edition_format", "edition_information",
+    "release_date", "Publisher", "Language", "Country",
+)
+
+# Fetched books kept in memory so re-fetching an ID skips the network
+BOOK_CACHE_SIZE = 64
+BOOK_CACHE_TTL_SECONDS = 300
+
+# Digit strings this short always fit QIntValidator's default 32-bit range
+MAX_FAST_PATH_DIGITS = 9
+
+# Fixed editions table column widths, applied without measuring any cell text
+DEFAULT_COLUMN_WIDTH = 140
+COLUMN_WIDTHS = {
+    "Select": 60,
+    "id": 80,
+    "score": 80,
+    "title": 260,
+    "subtitle": 200,
+    "Cover Image?": 110,
+    "Reading Format": 130,
+    "pages": 80,
+    "Duration": 100,
+    "edition_information": 220,
+    "release_date": 110,
+    "Publisher": 180,
+}
+
+# Space added to the font height for each editions table row; the theme pads items by 6px top and bottom
+ROW_VERTICAL_PADDING = 14
+
+# Book info label markup: a dimmed prefix, then the value as plain text or pre-rendered HTML
+LABEL_TMPL = "<span style='color:#999999;'>%s</span><span style='color:#e0e0e0;'>%s</span>"
+LABEL_PREFIX_TMPL = "<span style='color:#999999;'>%s</span>%s"
+
+# Per-widget stylesheets shared by every instance instead of re-declared inline
+PLACEHOLDER_STYLE = "color: #888; font-style: italic; margin: 20px;"
+HINT_STYLE = "color: #888; font-style: italic;"
+FIELD_PREFIX_STYLE = "color: #999999;"
+SELECT_CHECKBOX_STYLE = "QCheckBox { margin-left: 8px; }"
+MAPPING_CARD_STYLE = """
+    QGroupBox {
+        background-color: #242424;
+        border: 1px solid #3d3d3d;
+        border-radius: 8px;
+        margin: 10px;
+        padding: 15px;
+    }
+"""
+MAPPING_CARD_TITLE_STYLE = """
+    font-weight: bold;
+    font-size: 14px;
+    color: #ffffff;
+    margin-bottom: 10px;
+"""
+MAPPING_HEADER_STYLE = "font-weight: bold; margin-top: 5px;"
+
+# Builders for external book page URLs keyed by lowercase platform name,
+# so a lookup formats only the URL it returns
+_PLATFORM_URL_BUILDERS = {
+    'goodreads': lambda eid: f'https://www.goodreads.com/book/show/{eid}',
+    'openlibrary': lambda eid: f'https://openlibrary.org{eid}' if eid.startswith('/') else f'https://openlibrary.org/books/{eid}',
+    'googlebooks': lambda eid: f'https://books.google.com/books?id={eid}',
+    'bookshop': lambda eid: f'https://bookshop.org/books/{eid}',
+    'amazon': lambda eid: f'https://www.amazon.com/dp/{eid}',
+    'bookdepository': lambda eid: f'https://www.bookdepository.com/book/{eid}',
+    'indiebound': lambda eid: f'https://www.indiebound.org/book/{eid}',
+    'audible': lambda eid: f'https://www.audible.com/pd/{eid}',
+    'kobo': lambda eid: f'https://www.kobo.com/ebook/{eid}',
+    'scribd': lambda eid: f'https://www.scribd.com/book/{eid}',
+    'librarything': lambda eid: f'https://www.librarything.com/work/{eid}',
+    'storygraph': lambda eid: f'https://app.thestorygraph.com/books/{eid}',
+    'bookwyrm': lambda eid: f'https://bookwyrm.social/book/{eid}',
+    'wikidata': lambda eid: f'https://www.wikidata.org/wiki/{eid}',
+    'wikipedia': lambda eid: f'https://en.wikipedia.org/wiki/{eid}',
+    'isfdb': lambda eid: f'https://www.isfdb.org/cgi-bin/title.cgi?{eid}',
+    'lccn': lambda eid: f'https://lccn.loc.gov/{eid}',
+    'oclc': lambda eid: f'https://www.worldcat.org/oclc/{eid}',
+    'dnb': lambda eid: f'https://portal.dnb.de/opac/showFullRecord?currentResultId={eid}',
+    'trove': lambda eid: f'https://trove.nla.gov.au/work/{eid}',
+    'jisc': lambda eid: f'https://discover.jisc.ac.uk/search?q={eid}',
+    'k10plus': lambda eid: f'https://k10plus.de/DB=2.1/PPNSET?PPN={eid}',
+}
 
 class ClickableLabel(QLabel):
     """
@@ -39,15 +148,20 @@ class ClickableLabel(QLabel):
     """
     # No custom signal needed; QLabel.linkActivated will be used.
 
+    # Markup for the dimmed prefix followed by a link or by plain (or pre-rendered) value HTML.
+    # Colors: medium gray prefix, purple accent links and default text matching the stylesheet.
+    _LINK_TMPL = ("<span style='color:#999999;'>%s</span>"
+                  "<a href='%s' style='color:#9f7aea; text-decoration:underline;'>%s</a>")
+    _PLAIN_TMPL = LABEL_TMPL
+    _PREFIX_TMPL = LABEL_PREFIX_TMPL
+
     def __init__(self, parent=None): # Text will be set via setContent
         super().__init__(parent)
         self._url_for_link_part = "" # Store the URL associated with the link part
+        self._is_link = False # Whether the cursor and tooltip are currently set up for a link
         self.setTextFormat(Qt.RichText)
         self.setOpenExternalLinks(False) # Important: emit linkActivated instead of QLabel opening it
         self.setCursor(Qt.ArrowCursor) # Default cursor
-        # Default style for the non-link part (taken from main stylesheet)
-        self._default_text_color = "#e0e0e0" # Matches QWidget color in stylesheet
-        self._link_text_color = "#9f7aea"    # Purple accent color to match theme
 
     def setContent(self, prefix: str, value_part: str, url_for_value_part: str = "", field_name: str = ""):
         """
@@ -57,47 +171,32 @@ class ClickableLabel(QLabel):
         - url_for_value_part: The URL to associate with the value_part if it's linkable.
         - field_name: Optional field identifier for N/A highlighting logic.
         """
-        from librarian_assistant.ui_utils import should_highlight_general_info_na
-        from librarian_assistant.styling_constants import get_na_highlight_html
-        
+        previous_url = self._url_for_link_part
         self._url_for_link_part = url_for_value_part
         current_value_part = value_part if value_part is not None else "N/A"
-        
-        # Use a dimmer color for the prefix to make values stand out
-        prefix_color = "#999999"  # Medium gray for labels
+        prefix_html = html.escape(prefix, quote=False)
 
         is_value_linkable = bool(self._url_for_link_part) and current_value_part != "N/A"
-        
-        # Check if N/A should be highlighted
-        should_highlight_na = (current_value_part == "N/A" and 
-                             field_name and 
-                             should_highlight_general_info_na(field_name))
 
         if is_value_linkable:
-            # Construct HTML with styled prefix and link
-            # Ensure HTML special characters in prefix and value_part are escaped if necessary,
-            # but for simple text like "Slug: " and typical slugs/IDs, it's often fine.
-            # For robustness, one might use Qt.escape().
-            html_text = (
-                f"<span style='color:{prefix_color};'>{prefix}</span>"
-                f"<a href='{self._url_for_link_part}' style='color:{self._link_text_color}; text-decoration:underline;'>{current_value_part}</a>"
-            )
-            self.setText(html_text)
-            self.setCursor(Qt.PointingHandCursor)
-            self.setToolTip(f"Open: {self._url_for_link_part}")
+            self.setText(self._LINK_TMPL % (prefix_html, html.escape(self._url_for_link_part),
+                                            html.escape(str(current_value_part), quote=False)))
+            # Cursor and tooltip changes cost Qt work even when nothing changes, so skip repeats
+            if not self._is_link:
+                self.setCursor(Qt.PointingHandCursor)
+            if not self._is_link or previous_url != self._url_for_link_part:
+                self.setToolTip(f"Open: {self._url_for_link_part}")
         else:
             # Use HTML for consistent styling even for non-links
-            if should_highlight_na:
+            if current_value_part == "N/A" and field_name and should_highlight_general_info_na(field_name):
                 # Use highlighted N/A styling
-                value_html = get_na_highlight_html(current_value_part)
+                self.setText(self._PREFIX_TMPL % (prefix_html, get_na_highlight_html(current_value_part)))
             else:
-                # Use default styling
-                value_html = f"<span style='color:{self._default_text_color};'>{current_value_part}</span>"
-            
-            html_text = f"<span style='color:{prefix_color};'>{prefix}</span>{value_html}"
-            self.setText(html_text)
-            self.setCursor(Qt.ArrowCursor)
-            self.setToolTip("")
+                self.setText(self._PLAIN_TMPL % (prefix_html, html.escape(str(current_value_part), quote=False)))
+            if self._is_link:
+                self.setCursor(Qt.ArrowCursor)
+                self.setToolTip("")
+        self._is_link = is_value_linkable
 
 
 class NumericTableWidgetItem(QTableWidgetItem):
@@ -108,24 +207,23 @@ class NumericTableWidgetItem(QTableWidgetItem):
         # Store the numeric value for sorting
         if numeric_value is not None:
             self.setData(Qt.UserRole, numeric_value)
+        # The float used by __lt__, converted once here rather than on every comparison
+        try:
+            self._num = float(numeric_value) if numeric_value is not None else None
+        except (ValueError, TypeError):
+            self._num = None
     
     def __lt__(self, other):
         """Override less-than operator for proper numeric sorting."""
-        my_value = self.data(Qt.UserRole)
-        other_value = other.data(Qt.UserRole) if hasattr(other, 'data') else None
+        my_value = self._num
+        other_value = getattr(other, '_num', None)
         
         # Handle None/N/A values
         if my_value is None:
             return True  # None values sort to beginning
         if other_value is None:
             return False
-            
-        # Compare numeric values
-        try:
-            return float(my_value) < float(other_value)
-        except (ValueError, TypeError):
-            # Fall back to string comparison
-            return self.text() < other.text()
+        return my_value < other_value
 
 
 class SortableTableWidget(QTableWidget):
@@ -142,6 +240,10 @@ class SortableTableWidget(QTableWidget):
         # Track sort state for each column
         self.column_sort_order = {}  # column_index: Qt.SortOrder or None
         self.last_sorted_column = None
+        # Header labels as given to setHorizontalHeaderLabels, without sort indicators,
+        # and each label's (first) column index
+        self._original_headers = []
+        self._header_to_col = {}
         
         # Connect header click to custom sort handler
         self.horizontalHeader().sectionClicked.connect(self._on_header_clicked)
@@ -153,6 +255,11 @@ class SortableTableWidget(QTableWidget):
         self.horizontalHeader().setSectionResizeMode(QHeaderView.Interactive)
         self.horizontalHeader().setStretchLastSection(True)  # Make last column fill remaining space
         self.horizontalHeader().setMinimumSectionSize(50)  # Minimum column width
+        self.horizontalHeader().setDefaultSectionSize(DEFAULT_COLUMN_WIDTH)
+        # Every row holds one line of text, so give them all the same fixed height
+        # rather than having the view work out each row's height while scrolling
+        self.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.verticalHeader().setDefaultSectionSize(self.fontMetrics().height() + ROW_VERTICAL_PADDING)
         
         # Set selection behavior
         self.setSelectionBehavior(QTableWidget.SelectRows)
@@ -193,8 +300,7 @@ class SortableTableWidget(QTableWidget):
     def _on_header_clicked(self, logical_index):
         """Handle header click to cycle through sort states."""
         # Check if this is the Select column (index 0)
-        header_item = self.horizontalHeaderItem(logical_index)
-        if header_item and header_item.text().replace(" ▲", "").replace(" ▼", "") == "Select":
+        if self.header_name(logical_index) == "Select":
             # Toggle all checkboxes
             self._toggle_all_checkboxes()
             return
@@ -236,11 +342,8 @@ class SortableTableWidget(QTableWidget):
     def _update_header_text(self, column_index):
         """Update header text with sort indicator."""
         header_item = self.horizontalHeaderItem(column_index)
-        if header_item:
-            base_text = header_item.text()
-            # Remove any existing indicators
-            base_text = base_text.replace(" ▲", "").replace(" ▼", "")
-            
+        base_text = self.header_name(column_index)
+        if header_item and base_text is not None:
             # Add new indicator if sorted
             sort_order = self.column_sort_order.get(column_index)
             if sort_order == Qt.AscendingOrder:
@@ -252,22 +355,43 @@ class SortableTableWidget(QTableWidget):
     
     def _restore_default_sort(self):
         """Restore default sort (by score descending)."""
-        # Find score column
-        for col in range(self.columnCount()):
-            header = self.horizontalHeaderItem(col)
-            if header and header.text().replace(" ▲", "").replace(" ▼", "") == "score":
-                self.sortItems(col, Qt.DescendingOrder)
-                break
+        score_col = self.column_index("score")
+        if score_col is not None:
+            self.sortItems(score_col, Qt.DescendingOrder)
+    
+    def apply_column_widths(self, column_names):
+        """Give each column its fixed width from COLUMN_WIDTHS (or DEFAULT_COLUMN_WIDTH)."""
+        header = self.horizontalHeader()
+        for col, name in enumerate(column_names):
+            header.resizeSection(col, COLUMN_WIDTHS.get(name, DEFAULT_COLUMN_WIDTH))
+    
+    def header_name(self, column):
+        """Return a column's header label without its sort indicator, or None."""
+        if 0 <= column < min(len(self._original_headers), self.columnCount()):
+            return self._original_headers[column]
+        return None
+    
+    def column_index(self, name):
+        """Return the index of the column labelled name, or None."""
+        col = self._header_to_col.get(name)
+        return col if col is not None and col < self.columnCount() else None
     
     def setHorizontalHeaderLabels(self, labels):
         """Override to track original header labels."""
         super().setHorizontalHeaderLabels(labels)
+        self._original_headers = list(labels)
+        self._header_to_col = {}
+        for col, label in enumerate(self._original_headers):
+            self._header_to_col.setdefault(label, col)
         # Clear any existing sort states when headers are set
         self.column_sort_order.clear()
         self.last_sorted_column = None
     
     def sortItems(self, column, order):
         """Override sortItems to preserve checkbox states."""
+        # The ID column is located once for the whole sort rather than once per row
+        id_col_index = self._find_id_column()
+        
         # Store checkbox states before sorting
         checkbox_states = {}  # edition_id -> checked state
         
@@ -278,7 +402,7 @@ class SortableTableWidget(QTableWidget):
                 checkbox = widget.findChild(QCheckBox)
                 if checkbox:
                     # Get edition ID for this row
-                    edition_id = self._get_edition_id_for_row(row)
+                    edition_id = self._edition_id_at(row, id_col_index)
                     if edition_id:
                         checkbox_states[edition_id] = checkbox.isChecked()
         
@@ -286,8 +410,10 @@ class SortableTableWidget(QTableWidget):
         super().sortItems(column, order)
         
         # Restore checkbox states after sorting
+        if not checkbox_states:
+            return
         for row in range(self.rowCount()):
-            edition_id = self._get_edition_id_for_row(row)
+            edition_id = self._edition_id_at(row, id_col_index)
             if edition_id in checkbox_states:
                 widget = self.cellWidget(row, 0)
                 if widget:
@@ -296,65 +422,49 @@ class SortableTableWidget(QTableWidget):
                         checkbox.setChecked(checkbox_states[edition_id])
     
     
+    def _find_id_column(self):
+        """Return the index of the "id" column, which may have been moved, or None."""
+        return self.column_index("id")
+    
     def _get_edition_id_for_row(self, visual_row):
         """Get the edition ID for a visual row."""
-        logger.info(f"_get_edition_id_for_row: visual_row={visual_row}, columnCount={self.columnCount()}")
-        
         # Check if we have columns
         if self.columnCount() == 0:
             logger.error("No columns in table!")
             return None
         
-        # First, try to find the ID column - it might not be at index 0 if columns were reordered
-        id_col_index = None
-        for col in range(self.columnCount()):
-            header_item = self.horizontalHeaderItem(col)
-            if header_item:
-                header_text = header_item.text().replace(" ▲", "").replace(" ▼", "")
-                if header_text == "id":
-                    id_col_index = col
-                    logger.info(f"Found ID column at index {col}")
-                    break
-        
+        id_col_index = self._find_id_column()
         if id_col_index is None:
             logger.warning("ID column not found in table headers!")
-            # Fallback: use row number as a string ID
-            fallback_id = f"row_{visual_row}"
-            logger.info(f"Using fallback ID: {fallback_id}")
-            return fallback_id
+        return self._edition_id_at(visual_row, id_col_index)
+    
+    def _edition_id_at(self, visual_row, id_col_index):
+        """
+        Read the edition ID shown in a row's ID column (a ClickableLabel or a plain item).
+        
+        Falls back to "row_<n>" when the column or the ID cannot be found.
+        """
+        if id_col_index is not None:
+            widget = self.cellWidget(visual_row, id_col_index)
+            if widget:
+                # For ClickableLabel, we need to extract the ID from the link text
+                if hasattr(widget, 'text'):
+                    text = widget.text()
+                    # Extract ID from the HTML if it's a ClickableLabel
+                    if '<a href=' in text:
+                        match = _LINK_TEXT_PATTERN.search(text)
+                        if match:
+                            return match.group(1)
+                    return text
             
-        # Check the ID column for the edition ID
-        widget = self.cellWidget(visual_row, id_col_index)
-        logger.info(f"Widget at row {visual_row}, col {id_col_index}: {widget}")
-        
-        if widget:
-            # For ClickableLabel, we need to extract the ID from the link text
-            if hasattr(widget, 'text'):
-                text = widget.text()
-                logger.info(f"Widget text: {text}")
-                # Extract ID from the HTML if it's a ClickableLabel
-                if '<a href=' in text:
-                    # Parse the ID from the link
-                    import re
-                    match = re.search(r'>([^<]+)</a>', text)
-                    if match:
-                        edition_id = match.group(1)
-                        logger.info(f"Extracted edition ID from link: {edition_id}")
-                        return edition_id
-                return text
-        
-        # Try regular item
-        item = self.item(visual_row, id_col_index)
-        if item:
-            edition_id = item.text()
-            logger.info(f"Got edition ID from item: {edition_id}")
-            return edition_id
+            # Try regular item
+            item = self.item(visual_row, id_col_index)
+            if item:
+                return item.text()
             
-        logger.warning(f"Could not find edition ID for row {visual_row}")
+            logger.debug("Could not find edition ID for row %s", visual_row)
         # Fallback: use row number as ID
-        fallback_id = f"row_{visual_row}"
-        logger.info(f"Using fallback ID: {fallback_id}")
-        return fallback_id
+        return f"row_{visual_row}"
     
 
 
@@ -391,12 +501,7 @@ class EditionsTableWidget(SortableTableWidget):
                 # First try to get the stored data index from the score column
                 
                 # Find the score column
-                score_col = None
-                for col in range(self.columnCount()):
-                    header = self.horizontalHeaderItem(col)
-                    if header and header.text().replace(" ▲", "").replace(" ▼", "") == "score":
-                        score_col = col
-                        break
+                score_col = self.column_index("score")
                 
                 if score_col is not None:
                     score_item = self.item(row_index, score_col)
@@ -436,10 +541,157 @@ class EditionsTableWidget(SortableTableWidget):
         return []
 
 
+class BookFetcher(QRunnable):
+    """
+    Fetches one book through the ApiClient on a QThreadPool thread.
+
+    The outcome is delivered through signals.done(book_id, book_data, error, fetcher):
+    book_data is the API result and error None on success, or book_data None
+    and error the raised exception. fetcher is this runnable, so the receiver
+    can release exactly the one that finished.
+    """
+
+    class Signals(QObject):
+        done = pyqtSignal(int, object, object, object)
+
+    def __init__(self, api_client: ApiClient, book_id: int):
+        super().__init__()
+        self.api_client = api_client
+        self.book_id = book_id
+        self.signals = BookFetcher.Signals()
+
+    def run(self):
+        try:
+            book_data, error = self.api_client.get_book_by_id(self.book_id), None
+        except Exception as e:
+            book_data, error = None, e
+        self.signals.done.emit(self.book_id, book_data, error, self)
+
+
+def default_edition_parts(edition_data, edition_name_prefix_str):
+    """
+    Format a default edition for a ClickableLabel.
+    
+    Returns:
+        (prefix, value text, edition URL) with "N/A" and an empty URL when
+        edition_data is not a dict
+    """
+    prefix = f"{edition_name_prefix_str}: "
+    if isinstance(edition_data, dict):
+        fmt = edition_data.get('edition_format')
+        ed_id = edition_data.get('id')
+        value_part_text = f"{fmt if fmt else 'N/A'} (ID: {ed_id if ed_id else 'N/A'})"
+        url = f"https://hardcover.app/editions/{ed_id}" if ed_id else ""
+        return prefix, value_part_text, url
+    return prefix, "N/A", ""
+
+
+def format_release_date(release_date):
+    """
+    Format an API release date (YYYY-MM-DD) as MM/DD/YYYY.
+    
+    Values that are not such a date are returned unchanged.
+    """
+    # The API sends zero-padded dates, which are rearranged by slicing; anything
+    # else goes through strptime, which also accepts unpadded months and days
+    if (isinstance(release_date, str) and len(release_date) == 10
+            and release_date[4] == '-' and release_date[7] == '-' and release_date.isascii()):
+        year, month, day = release_date[:4], release_date[5:7], release_date[8:]
+        if year.isdigit() and month.isdigit() and day.isdigit():
+            try:
+                date(int(year), int(month), int(day))  # Reject impossible dates like strptime does
+            except ValueError:
+                return release_date
+            return f"{month}/{day}/{year}"
+    try:
+        return datetime.strptime(release_date, '%Y-%m-%d').strftime('%m/%d/%Y')
+    except (ValueError, TypeError):
+        return release_date  # Use as-is if parsing fails
+
+
+def _duration_cell(edition_data):
+    """Return an edition's audio length as ("HH:MM:SS", seconds), or None without one."""
+    audio_seconds = edition_data.get('audio_seconds')
+    if audio_seconds is None or audio_seconds <= 0:
+        return None
+    hours, remainder = divmod(audio_seconds, 3600)
+    minutes, seconds = divmod(remainder, 60)
+    return f"{hours:02d}:{minutes:02d}:{seconds:02d}", audio_seconds
+
+
+def _name_or_none(record, key):
+    """Return record[key] from a nested API object, or None when it is missing."""
+    name = (record or _EMPTY).get(key, 'N/A')
+    return None if name == 'N/A' else name
+
+
+# Editions table cells after score, in STATIC_EDITION_HEADERS order, as
+# (N/A highlight field, cell kind, value extractor). An extractor returns the cell text,
+# (text, sort value) for 'numeric' cells, or None to show a highlighted N/A; columns whose
+# extractor always returns a value have no highlight field. 'tooltip' cells are truncated
+# with the full text in a tooltip.
+_EDITION_CELLS = (
+    (None, 'tooltip', lambda e: 'N/A' if (title := e.get('title', 'N/A')) is None else title),
+    ('subtitle', 'tooltip', lambda e: e.get('subtitle') or None),
+    (None, 'text', lambda e: "Yes" if (e.get('image') or _EMPTY).get('url') else "No"),
+    ('isbn_10', 'text', lambda e: e.get('isbn_10') or None),
+    ('isbn_13', 'text', lambda e: e.get('isbn_13') or None),
+    ('asin', 'text', lambda e: e.get('asin') or None),
+    (None, 'text', lambda e: READING_FORMAT_NAMES.get(
+        format_id := e.get('reading_format_id'), "N/A" if format_id is None else str(format_id))),
+    ('pages', 'numeric', lambda e: None if (pages := e.get('pages')) is None else (str(pages), pages)),
+    ('duration', 'numeric', _duration_cell),
+    ('edition_format', 'text', lambda e: e.get('edition_format') or None),
+    ('edition_information', 'tooltip', lambda e: e.get('edition_information') or None),
+    ('release_date', 'text', lambda e: format_release_date(e['release_date']) if e.get('release_date') else None),
+    ('publisher', 'text', lambda e: _name_or_none(e.get('publisher'), 'name')),
+    ('language', 'text', lambda e: _name_or_none(e.get('language'), 'language')),
+    ('country', 'text', lambda e: _name_or_none(e.get('country'), 'name')),
+)
+
+
+@contextmanager
+def _bulk_update(table):
+    """
+    Suspend repaints, signals and sorting on a table while it is filled or cleared,
+    so it lays out and paints once when the block ends instead of once per change.
+    """
+    # Restore the previous states rather than assuming them, so nested uses and
+    # callers that already blocked signals keep what they had
+    sorting = table.isSortingEnabled()
+    updates = table.updatesEnabled()
+    table.setUpdatesEnabled(False)
+    signals_blocked = table.blockSignals(True)
+    table.setSortingEnabled(False)
+    try:
+        yield table
+    finally:
+        table.setSortingEnabled(sorting)
+        table.blockSignals(signals_blocked)
+        table.setUpdatesEnabled(updates)
+
+
 class MainWindow(QMainWindow):
     """
     Main application window for Librarian-Assistant.
     """
+    # Book info labels as (attribute, object name, prefix, link field name).
+    # Labels with a link field are ClickableLabels; the rest are rich-text QLabels.
+    _INFO_LABELS = (
+        ("book_title_label", "bookTitleLabel", "Title: ", None),
+        ("book_slug_label", "bookSlugLabel", "Slug: ", 'slug'),
+        ("book_authors_label", "bookAuthorsLabel", "Authors: ", None),
+        ("book_id_queried_label", "bookIdQueriedLabel", "Book ID (Queried): ", None),
+        ("book_total_editions_label", "bookTotalEditionsLabel", "Total Editions: ", None),
+        ("book_description_label", "bookDescriptionLabel", "Description: ", None),
+    )
+    _DEFAULT_EDITION_LABELS = (
+        ("default_audio_label", "defaultAudioLabel", "Default Audio Edition: ", 'default_audio_edition'),
+        ("default_cover_label_info", "defaultCoverLabelInfo", "Default Cover Edition: ", 'default_cover_edition'),
+        ("default_ebook_label", "defaultEbookLabel", "Default E-book Edition: ", 'default_ebook_edition'),
+        ("default_physical_label", "defaultPhysicalLabel", "Default Physical Edition: ", 'default_physical_edition'),
+    )
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setWindowTitle("Librarian-Assistant - Hardcover.app Edition Viewer")
@@ -480,6 +732,9 @@ class MainWindow(QMainWindow):
         ) if self.config_manager else None
         
         self.image_downloader = ImageDownloader()
+        # Cover loads run on the global thread pool; only the latest requested URL is shown
+        self._cover_fetchers = set()
+        self._requested_cover_url = None
         
         try:
             self.history_manager = HistoryManager()
@@ -487,6 +742,17 @@ class MainWindow(QMainWindow):
             logger.error(f"Failed to initialize HistoryManager: {e}")
             self.status_bar.showMessage("Error loading search history. History features may be unavailable.")
             self.history_manager = None
+        # Searches waiting to be recorded together once the event loop is idle
+        self._pending_history = deque()
+        # (book ID, Book ID text) of the fetch in progress, and its running fetchers
+        self._requested_book = None
+        self._book_fetchers = set()
+        # Book ID -> (monotonic fetch time, book data), least recently used first
+        self._book_cache = OrderedDict()
+        # Book ID -> (editions list, _process_contributor_data result) for books in _book_cache
+        self._contributor_cache = {}
+        # Brushes and font for highlighted N/A cells, created on first use
+        self._na_highlight_style_cache = None
 
         self.tab_widget = QTabWidget()
         self.setCentralWidget(self.tab_widget)
@@ -513,9 +779,10 @@ class MainWindow(QMainWindow):
         api_layout.addWidget(self.set_token_button)
 
         # Add Book ID input elements as per Prompt 3.1
-        self.book_id_label = QLabel()
-        self.book_id_label.setTextFormat(Qt.RichText)
-        self.book_id_label.setText("<span style='color:#999999;'>Book ID:</span>")
+        # A fixed single-color caption, so plain text colored by stylesheet needs no rich-text parse
+        self.book_id_label = QLabel("Book ID:")
+        self.book_id_label.setTextFormat(Qt.PlainText)
+        self.book_id_label.setStyleSheet(FIELD_PREFIX_STYLE)
         self.book_id_label.setObjectName("bookIdLabel")
         api_layout.addWidget(self.book_id_label)
 
@@ -524,6 +791,11 @@ class MainWindow(QMainWindow):
         # Placeholder text can be useful for users
         # Add QIntValidator to allow only numbers
         self.book_id_line_edit.setValidator(QIntValidator())
+        # Coalesce bursts of edits into one validation pass
+        self._book_id_validation_timer = QTimer(self)
+        self._book_id_validation_timer.setSingleShot(True)
+        self._book_id_validation_timer.setInterval(120)
+        self._book_id_validation_timer.timeout.connect(self._validate_book_id_text)
         self.book_id_line_edit.textChanged.connect(self._on_book_id_text_changed)
         self.book_id_line_edit.setPlaceholderText("Enter numerical Book ID")
         api_layout.addWidget(self.book_id_line_edit)
@@ -542,79 +814,20 @@ class MainWindow(QMainWindow):
         self.info_layout = QVBoxLayout(self.book_info_area) # Store layout for easy access
 
         # Add specific widgets for book information - these will be populated later
-        self.book_title_label = QLabel()
-        self.book_title_label.setTextFormat(Qt.RichText)
-        self.book_title_label.setText(self._format_label_text("Title: ", "Not Fetched"))
-        self.book_title_label.setObjectName("bookTitleLabel")
-        self.info_layout.addWidget(self.book_title_label)
-
-        self.book_slug_label = ClickableLabel(self) # Pass parent
-        self.book_slug_label.setObjectName("bookSlugLabel")
-        self.book_slug_label.setContent("Slug: ", "Not Fetched", "", field_name='slug')
-        self.info_layout.addWidget(self.book_slug_label)
-        self.book_slug_label.linkActivated.connect(self._open_web_link)
-
-        self.book_authors_label = QLabel()
-        self.book_authors_label.setTextFormat(Qt.RichText)
-        self.book_authors_label.setText(self._format_label_text("Authors: ", "Not Fetched"))
-        self.book_authors_label.setObjectName("bookAuthorsLabel")
-        self.info_layout.addWidget(self.book_authors_label)
-
-        self.book_id_queried_label = QLabel()
-        self.book_id_queried_label.setTextFormat(Qt.RichText)
-        self.book_id_queried_label.setText(self._format_label_text("Book ID (Queried): ", "Not Fetched"))
-        self.book_id_queried_label.setObjectName("bookIdQueriedLabel")
-        self.info_layout.addWidget(self.book_id_queried_label)
-
-        self.book_total_editions_label = QLabel()
-        self.book_total_editions_label.setTextFormat(Qt.RichText)
-        self.book_total_editions_label.setText(self._format_label_text("Total Editions: ", "Not Fetched"))
-        self.book_total_editions_label.setObjectName("bookTotalEditionsLabel")
-        self.info_layout.addWidget(self.book_total_editions_label)
-
-        self.book_description_label = QLabel()
-        self.book_description_label.setTextFormat(Qt.RichText)
-        self.book_description_label.setText(self._format_label_text("Description: ", "Not Fetched"))
-        self.book_description_label.setObjectName("bookDescriptionLabel")
+        for spec in self._INFO_LABELS:
+            self._add_info_label(self.info_layout, *spec)
         self.book_description_label.setWordWrap(True) # Allow text to wrap
         # Tooltip will be set dynamically if text is truncated
-        self.info_layout.addWidget(self.book_description_label)
 
         # Default Editions GroupBox and Labels (as per Prompt 4.1)
         self.default_editions_group_box = QGroupBox("Default Editions")
         self.default_editions_group_box.setObjectName("defaultEditionsGroupBox")
         default_editions_layout_init = QVBoxLayout(self.default_editions_group_box) # Layout for init
-
-        self.default_audio_label = ClickableLabel(self)
-        self.default_audio_label.setObjectName("defaultAudioLabel")
-        self.default_audio_label.setContent("Default Audio Edition: ", "N/A", "", field_name='default_audio_edition')
-        default_editions_layout_init.addWidget(self.default_audio_label)
-        self.default_audio_label.linkActivated.connect(self._open_web_link)
-
-        self.default_cover_label_info = ClickableLabel(self)
-        self.default_cover_label_info.setObjectName("defaultCoverLabelInfo")
-        self.default_cover_label_info.setContent("Default Cover Edition: ", "N/A", "", field_name='default_cover_edition')
-        default_editions_layout_init.addWidget(self.default_cover_label_info)
-        self.default_cover_label_info.linkActivated.connect(self._open_web_link)
-
-        self.default_ebook_label = ClickableLabel(self)
-        self.default_ebook_label.setObjectName("defaultEbookLabel")
-        self.default_ebook_label.setContent("Default E-book Edition: ", "N/A", "", field_name='default_ebook_edition')
-        default_editions_layout_init.addWidget(self.default_ebook_label)
-        self.default_ebook_label.linkActivated.connect(self._open_web_link)
-
-        self.default_physical_label = ClickableLabel(self)
-        self.default_physical_label.setObjectName("defaultPhysicalLabel")
-        self.default_physical_label.setContent("Default Physical Edition: ", "N/A", "", field_name='default_physical_edition')
-        default_editions_layout_init.addWidget(self.default_physical_label)
-        self.default_physical_label.linkActivated.connect(self._open_web_link)
+        for spec in self._DEFAULT_EDITION_LABELS:
+            self._add_info_label(default_editions_layout_init, *spec, initial_value="N/A")
         self.info_layout.addWidget(self.default_editions_group_box)
 
-        self.book_cover_label = QLabel()
-        self.book_cover_label.setTextFormat(Qt.RichText)
-        self.book_cover_label.setText(self._format_label_text("Cover URL: ", "Not Fetched"))
-        self.book_cover_label.setObjectName("bookCoverLabel")
-        self.info_layout.addWidget(self.book_cover_label)
+        self._add_info_label(self.info_layout, "book_cover_label", "bookCoverLabel", "Cover URL: ")
 
         main_view_layout.addWidget(self.book_info_area)
 
@@ -653,48 +866,12 @@ class MainWindow(QMainWindow):
 
         self.tab_widget.addTab(self.main_view_scroll_area, "Main View") # Add the scroll area to the tab
 
-        self.history_tab_content = QWidget()
-        history_layout = QVBoxLayout(self.history_tab_content)
-        
-        # History controls
-        history_controls_layout = QHBoxLayout()
-        
-        # Search/filter box
-        self.history_search_box = QLineEdit()
-        self.history_search_box.setPlaceholderText("Search history...")
-        self.history_search_box.textChanged.connect(self._filter_history)
-        history_controls_layout.addWidget(QLabel("Search:"))
-        history_controls_layout.addWidget(self.history_search_box)
-        
-        # Sort dropdown
-        self.history_sort_combo = QComboBox()
-        self.history_sort_combo.addItems(["Sort by Book ID", "Sort by Title", "Sort by Date (Newest First)"])
-        self.history_sort_combo.currentTextChanged.connect(self._sort_history)
-        history_controls_layout.addWidget(self.history_sort_combo)
-        
-        # Clear history button
-        self.clear_history_button = QPushButton("Clear History")
-        self.clear_history_button.clicked.connect(self._clear_history)
-        history_controls_layout.addWidget(self.clear_history_button)
-        
-        history_controls_layout.addStretch()
-        history_layout.addLayout(history_controls_layout)
-        
-        # History list
-        self.history_list = QTableWidget()
-        self.history_list.setColumnCount(3)
-        self.history_list.setHorizontalHeaderLabels(["Book ID", "Title", "Date Searched"])
-        self.history_list.setSelectionBehavior(QTableWidget.SelectRows)
-        self.history_list.horizontalHeader().setStretchLastSection(True)
-        self.history_list.itemDoubleClicked.connect(self._on_history_item_double_clicked)
-        history_layout.addWidget(self.history_list)
-        
-        # Instructions
-        history_instructions = QLabel("Double-click a book to search it again.")
-        history_instructions.setStyleSheet("color: #888; font-style: italic;")
-        history_layout.addWidget(history_instructions)
-        
-        self.tab_widget.addTab(self.history_tab_content, "History")
+        # The History tab starts as an empty placeholder; its real widgets are
+        # built the first time the tab is shown (see _maybe_build_history_tab)
+        self.history_tab_content = None
+        self._history_built = False
+        self._history_placeholder = QWidget()
+        self.tab_widget.addTab(self._history_placeholder, "History")
         
         # Book Mappings Tab
         self.book_mappings_scroll = QScrollArea()
@@ -706,7 +883,7 @@ class MainWindow(QMainWindow):
         
         # Add placeholder text
         self.book_mappings_placeholder = QLabel("Select editions from the Main View tab to display their book mappings here.")
-        self.book_mappings_placeholder.setStyleSheet("color: #888; font-style: italic; margin: 20px;")
+        self.book_mappings_placeholder.setStyleSheet(PLACEHOLDER_STYLE)
         self.book_mappings_placeholder.setAlignment(Qt.AlignCenter)
         self.book_mappings_layout.addWidget(self.book_mappings_placeholder)
         
@@ -715,10 +892,13 @@ class MainWindow(QMainWindow):
         # Status bar already created at the beginning of __init__
         self.status_bar.showMessage("Ready")
 
+        # Whether a token is stored; None until read by _update_token_display
+        self._token_present = None
         self._update_token_display()
         
-        # Load and display history
-        self._populate_history_list()
+        # History is read from disk the first time the History tab is shown
+        self._history_list_populated = False
+        self.tab_widget.currentChanged.connect(self._maybe_build_history_tab)
         
         # Connect toggled signals for collapsible behavior
         self.api_input_area.toggled.connect(self._on_api_input_toggled)
@@ -730,6 +910,8 @@ class MainWindow(QMainWindow):
         Opens the dialog for setting or updating the API token.
         If the dialog is accepted, the token is processed.
         """
+        # Imported on first use so startup doesn't pay for a dialog most sessions never open
+        from librarian_assistant.token_dialog import TokenDialog
         dialog = TokenDialog(self)
         # Connect the dialog's signal to the handler method
         dialog.token_accepted.connect(self._handle_token_accepted)
@@ -743,6 +925,10 @@ class MainWindow(QMainWindow):
         if self.config_manager:
             try:
                 self.config_manager.save_token(token)
+                self._token_present = bool(token)
+                # A different token may see different data, so refetch everything
+                self._book_cache.clear()
+                self._contributor_cache.clear()
                 self._update_token_display()
                 self.status_bar.showMessage("Token saved successfully.", 3000)
             except Exception as e:
@@ -754,33 +940,50 @@ class MainWindow(QMainWindow):
     def _update_token_display(self):
         """
         Updates the token display label based on the token in ConfigManager.
+        Whether a token is set is read from the token store once and then
+        remembered; saving a new token updates it.
         """
         if self.config_manager:
-            try:
-                current_token = self.config_manager.load_token()
-                if current_token: # Checks if token is not None and not an empty string
-                    self.token_display_label.setText(self._format_label_text("Token: ", "*******"))
-                else:
-                    self.token_display_label.setText(self._format_label_text("Token: ", "Not Set"))
-            except Exception as e:
-                logger.error(f"Failed to load token: {e}")
-                self.token_display_label.setText(self._format_label_text("Token: ", "Error Loading"))
-                self.status_bar.showMessage("Error loading API token. Please try setting it again.", 3000)
+            if self._token_present is None:
+                try:
+                    current_token = self.config_manager.load_token()
+                except Exception as e:
+                    logger.error(f"Failed to load token: {e}")
+                    self.token_display_label.setText(self._format_label_text("Token: ", "Error Loading"))
+                    self.status_bar.showMessage("Error loading API token. Please try setting it again.", 3000)
+                    return
+                self._token_present = bool(current_token) # Checks if token is not None and not an empty string
+            if self._token_present:
+                self.token_display_label.setText(self._format_label_text("Token: ", "*******"))
+            else:
+                self.token_display_label.setText(self._format_label_text("Token: ", "Not Set"))
         else:
             self.token_display_label.setText(self._format_label_text("Token: ", "Config Error"))
 
     def _on_book_id_text_changed(self, text: str):
         """
-        If the text in book_id_line_edit changes to something
-        that QIntValidator deems Invalid, clear the line edit.
-        This ensures programmatic setText("abc") results in an empty field,
-        aligning with test expectations. QIntValidator itself handles direct 
-        user input prevention by not allowing invalid characters to be typed.
+        Schedule validation of the Book ID text once edits pause.
+        QIntValidator itself prevents invalid characters from being typed, so
+        only programmatic setText calls can leave invalid text behind.
+        Empty text and short plain integers are always acceptable, so they
+        skip validation entirely.
         """
+        digits = text[1:] if text[:1] == '-' else text
+        if not text or (digits.isascii() and digits.isdigit() and len(digits) <= MAX_FAST_PATH_DIGITS):
+            self._book_id_validation_timer.stop()
+            return
+        self._book_id_validation_timer.start()
+
+    def _validate_book_id_text(self):
+        """
+        If the text in book_id_line_edit is something QIntValidator deems
+        Invalid, clear the line edit. This ensures programmatic setText("abc")
+        results in an empty field.
+        """
+        self._book_id_validation_timer.stop()
         validator = self.book_id_line_edit.validator()
         if validator is not None:
-            # 'text' is the new content of the QLineEdit after the change.
-            state, _, _ = validator.validate(text, 0) 
+            state, _, _ = validator.validate(self.book_id_line_edit.text(), 0)
             if state == QValidator.Invalid:
                 self.book_id_line_edit.blockSignals(True) # Prevent recursion
                 self.book_id_line_edit.setText("")
@@ -790,11 +993,15 @@ class MainWindow(QMainWindow):
         """
         Handles the "Fetch Data" button click.
         Logs the current Book ID and token status.
+        A request for a different Book ID, e.g. from the History tab, replaces
+        a fetch still in progress; the older result is ignored when it arrives.
         """
+        if self._book_id_validation_timer.isActive():
+            self._validate_book_id_text()
         book_id_str = self.book_id_line_edit.text()
         if not book_id_str:
-            self.status_bar.showMessage("Book ID cannot be empty. Please enter a valid numerical Book ID.")
-            logger.warning("Fetch Data clicked with empty Book ID.")
+            self._report(logging.WARNING, "Book ID cannot be empty. Please enter a valid numerical Book ID.",
+                         "Fetch Data clicked with empty Book ID.")
             return
             
         # Check if token is set
@@ -802,12 +1009,12 @@ class MainWindow(QMainWindow):
             try:
                 token = self.config_manager.load_token()
                 if not token:
-                    self.status_bar.showMessage("API Bearer Token not set. Please set it via the 'Set/Update Token' button.")
-                    logger.warning("Fetch Data clicked without API token set.")
+                    self._report(logging.WARNING, "API Bearer Token not set. Please set it via the 'Set/Update Token' button.",
+                                 "Fetch Data clicked without API token set.")
                     return
             except Exception as e:
-                logger.error(f"Failed to check token status: {e}")
-                self.status_bar.showMessage("Error checking API token. Please try setting it again.")
+                self._report(logging.ERROR, "Error checking API token. Please try setting it again.",
+                             f"Failed to check token status: {e}")
                 return
         else:
             self.status_bar.showMessage("Configuration error. Cannot proceed with fetch.")
@@ -820,191 +1027,179 @@ class MainWindow(QMainWindow):
         except ValueError:
             # This case should ideally not be reached if QIntValidator and _on_book_id_text_changed work perfectly,
             # but as a safeguard:
-            self.status_bar.showMessage("Please enter a valid numerical Book ID.")
-            logger.error(f"Fetch Data clicked with non-integer Book ID that bypassed validation: {book_id_str}")
+            self._report(logging.ERROR, "Please enter a valid numerical Book ID.",
+                         f"Fetch Data clicked with non-integer Book ID that bypassed validation: {book_id_str}")
             return
 
-        # For now, we'll just clear. The population step will add new widgets.
-        # If we want placeholders when no data is present, that logic would go elsewhere or be part of error handling.
+        if self._requested_book is not None:
+            if self._requested_book[0] == book_id_int:
+                return  # Already fetching this book
+            logger.info(f"Superseding the fetch for Book ID {self._requested_book[0]} with Book ID {book_id_int}")
+
+        cached_book = self._cached_book(book_id_int)
+        if cached_book is not None:
+            logger.info(f"Serving Book ID {book_id_int} from the in-memory cache")
+            self._requested_book = (book_id_int, book_id_str)
+            self._on_book_fetch_done(book_id_int, cached_book, None)
+            return
 
         logger.info(f"Attempting to fetch data for Book ID: {book_id_int}")
-        # Call the ApiClient (actual API call will happen here)
+        # The API call runs on the thread pool so the window keeps painting meanwhile;
+        # the result comes back to _on_book_fetch_done on the GUI thread
+        self._requested_book = (book_id_int, book_id_str)
+        self.fetch_data_button.setEnabled(False)
+        self.status_bar.showMessage(f"Fetching data for Book ID {book_id_int}...")
+        fetcher = BookFetcher(self.api_client, book_id_int)
+        # Keep our own reference so the signals object outlives the pool's run
+        fetcher.setAutoDelete(False)
+        fetcher.signals.done.connect(self._on_book_fetch_done)
+        self._book_fetchers.add(fetcher)
+        QThreadPool.globalInstance().start(fetcher)
+
+    def _cached_book(self, book_id: int) -> dict | None:
+        """Return the cached data for a book fetched within BOOK_CACHE_TTL_SECONDS, or None."""
+        entry = self._book_cache.get(book_id)
+        if entry is None:
+            return None
+        fetched_at, book_data = entry
+        if time.monotonic() - fetched_at > BOOK_CACHE_TTL_SECONDS:
+            del self._book_cache[book_id]
+            self._contributor_cache.pop(book_id, None)
+            return None
+        self._book_cache.move_to_end(book_id)
+        return book_data
+
+    def _cache_book(self, book_id: int, book_data: dict) -> None:
+        """Remember fetched book data, evicting the least recently used entry past BOOK_CACHE_SIZE."""
+        entry = self._book_cache.get(book_id)
+        if entry is not None and entry[1] is book_data:
+            return  # Redisplaying a cached book must not extend its lifetime
+        self._book_cache[book_id] = (time.monotonic(), book_data)
+        self._book_cache.move_to_end(book_id)
+        if len(self._book_cache) > BOOK_CACHE_SIZE:
+            evicted_id, _ = self._book_cache.popitem(last=False)
+            self._contributor_cache.pop(evicted_id, None)
+
+    def _contributor_data_for(self, book_id: int, editions: list) -> dict:
+        """
+        Return _process_contributor_data(editions), reusing the result computed
+        for the same editions list when a cached book is shown again.
+        """
+        cached = self._contributor_cache.get(book_id)
+        if cached is not None and cached[0] is editions:
+            return cached[1]
+        contributor_data = self._process_contributor_data(editions)
+        if book_id in self._book_cache:
+            self._contributor_cache[book_id] = (editions, contributor_data)
+        return contributor_data
+
+    def _on_book_fetch_done(self, book_id_int: int, book_data, error, fetcher=None):
+        """
+        Display the result of a background book fetch.
+        error is the exception raised by the ApiClient, or None on success.
+        fetcher is the BookFetcher that finished; other fetchers for the same
+        Book ID may still be running and must stay referenced.
+        """
+        self._book_fetchers.discard(fetcher)
+        if self._requested_book is None or self._requested_book[0] != book_id_int:
+            logger.debug("Ignoring stale fetch result for Book ID %s", book_id_int)
+            return
+        book_id_str = self._requested_book[1]
+        self._requested_book = None
+        self.fetch_data_button.setEnabled(True)
+
         try:
-            book_data = self.api_client.get_book_by_id(book_id_int)
+            if error is not None:
+                raise error
 
             if book_data:
-                # Clear previous data from info_layout before fetching new data
-                # This ensures old data is removed even if the new fetch fails or returns no data.
-                # We will re-add widgets as needed.
-                self._clear_layout(self.info_layout) # Clear general info area
+                self._cache_book(book_id_int, book_data)
+                # Book info labels are updated in place below.
                 # Don't clear editions_layout - just clear the table data
-                self.editions_table_widget.setRowCount(0)  # Clear existing rows
-                self.editions_table_widget.setColumnCount(0)  # Clear existing columns
+                with _bulk_update(self.editions_table_widget):
+                    self.editions_table_widget.setRowCount(0)  # Clear existing rows
+                    self.editions_table_widget.setColumnCount(0)  # Clear existing columns
                 self.editions_data = []  # Clear edition data
                 self._clear_filters()  # Clear any active filters
-                self.status_bar.showMessage(f"Book data fetched successfully for ID {book_id_str}.")
-                logger.info(f"Successfully fetched data for Book ID {book_id_int}: {book_data.get('title', 'N/A')}")
-                logger.info(f"Complete book_data received by main.py for Book ID {book_id_int}: {book_data}")
+                self._report(logging.INFO, f"Book data fetched successfully for ID {book_id_str}.",
+                             f"Successfully fetched data for Book ID {book_id_int}: {book_data.get('title', 'N/A')}")
+                # Lazy %-formatting: the whole response is only rendered if DEBUG is emitted
+                logger.debug("Complete book_data received by main.py for Book ID %s: %s", book_id_int, book_data)
                 
-                # Add to search history with error handling
+                # Queue for search history; fetches in quick succession are recorded together
                 book_title = book_data.get('title', 'Unknown Title')
                 if self.history_manager:
-                    try:
-                        self.history_manager.add_search(book_id_int, book_title)
-                        self._populate_history_list()  # Refresh history display
-                    except Exception as e:
-                        logger.error(f"Failed to save search history: {e}")
-                        # Non-critical error - continue with displaying the book data
-                        self.status_bar.showMessage("Error saving search history.", 3000)  # Show for 3 seconds
-
-                # Re-create and populate the General Book Information Area widgets
+                    if not self._pending_history:
+                        QTimer.singleShot(0, self._flush_pending_history)
+                    self._pending_history.append((book_id_int, book_title))
+
+                # Update the General Book Information Area labels in place
                 # Title
-                self.book_title_label = QLabel()
-                self.book_title_label.setTextFormat(Qt.RichText)
                 title_value = book_data.get('title', 'N/A')
                 self.book_title_label.setText(self._format_label_text_with_na_highlight("Title: ", title_value, 'title'))
-                self.book_title_label.setObjectName("bookTitleLabel")
-                self.info_layout.addWidget(self.book_title_label)
 
                 # Populate Slug
                 slug_text = book_data.get('slug')
                 slug_url_val = f"https://hardcover.app/books/{slug_text}" if slug_text else ""
-                self.book_slug_label = ClickableLabel(self) # Re-create after clear
-                self.book_slug_label.setObjectName("bookSlugLabel")
                 self.book_slug_label.setContent("Slug: ", slug_text if slug_text else "N/A", slug_url_val, field_name='slug')
-                self.book_slug_label.linkActivated.connect(self._open_web_link)
-                self.info_layout.addWidget(self.book_slug_label)
 
                 # Book ID
-                self.book_id_queried_label = QLabel()
-                self.book_id_queried_label.setTextFormat(Qt.RichText)
                 self.book_id_queried_label.setText(self._format_label_text_with_na_highlight("Book ID (Queried): ", str(book_id_int), 'book_id'))
-                self.book_id_queried_label.setObjectName("bookIdQueriedLabel")
-                self.info_layout.addWidget(self.book_id_queried_label)
 
                 # Authors
-                authors_list = []
                 # Get the contributions data once to log it and use it
                 book_contributions_data = book_data.get('contributions')
-                logger.info(f"Book ID {book_id_int} - Raw contributions data from API: {book_contributions_data}")
-
-                if isinstance(book_contributions_data, list):
-                    for contribution in book_contributions_data:
-                        if isinstance(contribution, dict) and 'author' in contribution and \
-                            isinstance(contribution['author'], dict) and 'name' in contribution['author']:
-                                authors_list.append(contribution['author']['name'])
+                logger.debug("Book ID %s - Raw contributions data from API: %s", book_id_int, book_contributions_data)
+
+                contributions = book_contributions_data if isinstance(book_contributions_data, list) else ()
+                authors_list = [
+                    c['author']['name']
+                    for c in contributions
+                    if isinstance(c, dict)
+                    and isinstance(c.get('author'), dict)
+                    and isinstance(c['author'].get('name'), str)
+                ]
+                authors_display_text = ", ".join(authors_list) if authors_list else "N/A"
 
-                authors_display_text = "N/A"
-                if authors_list:
-                    authors_display_text = ", ".join(authors_list)
-
-                self.book_authors_label = QLabel()
-                self.book_authors_label.setTextFormat(Qt.RichText)
                 self.book_authors_label.setText(self._format_label_text_with_na_highlight("Authors: ", authors_display_text, 'authors'))
-                self.book_authors_label.setObjectName("bookAuthorsLabel") # Keep object name for consistency/testing
-                self.info_layout.addWidget(self.book_authors_label)
                 
                 # Total Editions Count
                 editions_count_raw = book_data.get('editions_count')
                 editions_count_val = str(editions_count_raw) if editions_count_raw is not None else 'N/A'
-                self.book_total_editions_label = QLabel()
-                self.book_total_editions_label.setTextFormat(Qt.RichText)
                 self.book_total_editions_label.setText(self._format_label_text_with_na_highlight("Total Editions: ", editions_count_val, 'total_editions'))
-                self.book_total_editions_label.setObjectName("bookTotalEditionsLabel")
-                self.info_layout.addWidget(self.book_total_editions_label)
 
                 # Description with truncation and tooltip
                 # Ensure full_description is a string, defaulting to "N/A" if None or missing.
                 full_description_raw = book_data.get('description')
                 full_description = full_description_raw if full_description_raw is not None else "N/A"
-                MAX_DESC_CHARS = 500 # Define max characters for display
                 
-                if full_description != "N/A" and len(full_description) > MAX_DESC_CHARS:
-                    display_desc_text = full_description[:MAX_DESC_CHARS] + "..."
+                # len() is O(1) on str, so only a description that is actually cut gets sliced
+                if len(full_description) > MAX_DESC_CHARS:
+                    display_desc_text = full_description[:MAX_DESC_CHARS] + DESC_ELLIPSIS
                     tooltip_desc_text = full_description
                 else:
                     display_desc_text = full_description
-                    tooltip_desc_text = "" # No tooltip needed if not truncated, or set full_description
+                    tooltip_desc_text = "" # No tooltip needed if not truncated
                 
-                self.book_description_label = QLabel()
-                self.book_description_label.setTextFormat(Qt.RichText)
                 self.book_description_label.setText(self._format_label_text_with_na_highlight("Description: ", display_desc_text, 'description'))
-                self.book_description_label.setObjectName("bookDescriptionLabel")
-                self.book_description_label.setWordWrap(True)
-                if tooltip_desc_text: # Only set tooltip if it was truncated
-                    self.book_description_label.setToolTip(tooltip_desc_text)
-                self.info_layout.addWidget(self.book_description_label)
-
-                # Default Editions GroupBox and Labels (re-create or update)
-                self.default_editions_group_box = QGroupBox("Default Editions")
-                self.default_editions_group_box.setObjectName("defaultEditionsGroupBox")
-                default_editions_layout_dyn = QVBoxLayout(self.default_editions_group_box)
-
-                # Helper to format default edition info
-                def get_default_edition_parts(edition_data, edition_name_prefix_str):
-                    prefix = f"{edition_name_prefix_str}: "
-                    if isinstance(edition_data, dict):
-                        fmt = edition_data.get('edition_format')
-                        ed_id = edition_data.get('id')
-                        value_part_text = f"{fmt if fmt else 'N/A'} (ID: {ed_id if ed_id else 'N/A'})"
-                        url = f"https://hardcover.app/editions/{ed_id}" if ed_id else ""
-                        return prefix, value_part_text, url
-                    return prefix, "N/A", ""
-
-                audio_prefix, audio_value_part, audio_url = get_default_edition_parts(book_data.get('default_audio_edition'), "Default Audio Edition")
-                self.default_audio_label = ClickableLabel(self)
-                self.default_audio_label.setObjectName("defaultAudioLabel")
-                self.default_audio_label.setContent(audio_prefix, audio_value_part, audio_url, field_name='default_audio_edition')
-                self.default_audio_label.linkActivated.connect(self._open_web_link)
-                default_editions_layout_dyn.addWidget(self.default_audio_label)
-
-                cover_prefix, cover_value_part, cover_url_link = get_default_edition_parts(book_data.get('default_cover_edition'), "Default Cover Edition")
-                self.default_cover_label_info = ClickableLabel(self)
-                self.default_cover_label_info.setObjectName("defaultCoverLabelInfo")
-                self.default_cover_label_info.setContent(cover_prefix, cover_value_part, cover_url_link, field_name='default_cover_edition')
-                self.default_cover_label_info.linkActivated.connect(self._open_web_link)
-                default_editions_layout_dyn.addWidget(self.default_cover_label_info)
-
-                ebook_prefix, ebook_value_part, ebook_url = get_default_edition_parts(book_data.get('default_ebook_edition'), "Default E-book Edition")
-                self.default_ebook_label = ClickableLabel(self)
-                self.default_ebook_label.setObjectName("defaultEbookLabel")
-                self.default_ebook_label.setContent(ebook_prefix, ebook_value_part, ebook_url, field_name='default_ebook_edition')
-                self.default_ebook_label.linkActivated.connect(self._open_web_link)
-                default_editions_layout_dyn.addWidget(self.default_ebook_label)
-
-                physical_prefix, physical_value_part, physical_url = get_default_edition_parts(book_data.get('default_physical_edition'), "Default Physical Edition")
-                self.default_physical_label = ClickableLabel(self)
-                self.default_physical_label.setObjectName("defaultPhysicalLabel")
-                self.default_physical_label.setContent(physical_prefix, physical_value_part, physical_url, field_name='default_physical_edition')
-                self.default_physical_label.linkActivated.connect(self._open_web_link)
-                default_editions_layout_dyn.addWidget(self.default_physical_label)
-
-                self.info_layout.addWidget(self.default_editions_group_box)
+                self.book_description_label.setToolTip(tooltip_desc_text)
+
+                # Default Editions labels, one per _DEFAULT_EDITION_LABELS entry
+                for attr, _, prefix, field in self._DEFAULT_EDITION_LABELS:
+                    edition_prefix, value_part, edition_url = default_edition_parts(
+                        book_data.get(field), prefix.rstrip(": "))
+                    getattr(self, attr).setContent(edition_prefix, value_part, edition_url, field_name=field)
 
                 # Cover URL (this is for the main image display, not clickable itself,
                 # the clickable part is default_cover_label_info)
-                cover_url = "N/A"
-                if isinstance(book_data.get('default_cover_edition'), dict) and \
-                    isinstance(book_data['default_cover_edition'].get('image'), dict) and \
-                    book_data['default_cover_edition']['image'].get('url'):
-                        cover_url = book_data['default_cover_edition']['image']['url']
-
-                self.book_cover_label = QLabel()
-                self.book_cover_label.setTextFormat(Qt.RichText)
+                cover_edition = book_data.get('default_cover_edition')
+                cover_image = cover_edition.get('image') if isinstance(cover_edition, dict) else None
+                cover_url = (cover_image.get('url') if isinstance(cover_image, dict) else None) or "N/A"
+
                 self.book_cover_label.setText(self._format_label_text_with_na_highlight("Cover URL: ", cover_url, 'cover_url'))
-                self.book_cover_label.setObjectName("bookCoverLabel") # Keep object name
-                self.info_layout.addWidget(self.book_cover_label)
 
                 if cover_url != "N/A" and hasattr(self, 'image_downloader') and hasattr(self, 'actual_cover_display_label'):
-                    pixmap = self.image_downloader.download_image(cover_url)
-                    if pixmap and not pixmap.isNull():
-                        self.actual_cover_display_label.setPixmap(pixmap.scaled( # Optional scaling
-                            self.actual_cover_display_label.size(), 
-                            Qt.KeepAspectRatio, 
-                            Qt.SmoothTransformation
-                        ))
-                    else:
-                        self.actual_cover_display_label.setText("Cover not available") # Or clear it
+                    self._request_cover(cover_url)
                 else:
                     if hasattr(self, 'actual_cover_display_label'):
                         self.actual_cover_display_label.setText("Cover URL not found") # Or clear it
@@ -1013,19 +1208,11 @@ class MainWindow(QMainWindow):
                 editions = book_data.get('editions', [])
                 if editions:
                     # Process contributor data to determine which columns to show
-                    contributor_data = self._process_contributor_data(editions)
+                    contributor_data = self._contributor_data_for(book_id_int, editions)
                     active_roles = contributor_data['active_roles']
                     contributors_by_edition = contributor_data['contributors_by_edition']
                     max_contributors_per_role = contributor_data['max_contributors_per_role']
                     
-                    # Define static headers according to spec.md section 2.4.1
-                    static_headers = [
-                        "Select", "id", "score", "title", "subtitle", "Cover Image?", 
-                        "isbn_10", "isbn_13", "asin", "Reading Format", "pages", 
-                        "Duration", "edition_format", "edition_information", 
-                        "release_date", "Publisher", "Language", "Country"
-                    ]
-                    
                     # Build dynamic contributor headers (only for actual number needed)
                     contributor_headers = []
                     contributor_role_map = {}  # Maps column index to (role, number)
@@ -1034,229 +1221,114 @@ class MainWindow(QMainWindow):
                         max_for_role = max_contributors_per_role.get(role, 0)
                         for i in range(1, max_for_role + 1):  # Only create columns for actual contributors
                             header = f"{role} {i}"
-                            col_index = len(static_headers) + len(contributor_headers)
+                            col_index = len(STATIC_EDITION_HEADERS) + len(contributor_headers)
                             contributor_role_map[col_index] = (role, i - 1)  # 0-based index
                             contributor_headers.append(header)
                     
                     # Combine all headers
-                    all_headers = static_headers + contributor_headers
+                    all_headers = [*STATIC_EDITION_HEADERS, *contributor_headers]
                     
                     # Store column configuration
                     self.all_column_names = all_headers.copy()
                     self.visible_column_names = all_headers.copy()  # Initially all visible
                     
-                    self.editions_table_widget.setColumnCount(len(all_headers))
-                    self.editions_table_widget.setHorizontalHeaderLabels(all_headers)
-                    self.editions_table_widget.setRowCount(len(editions))
-                    
                     # Store edition data for accordion
                     self.editions_data = editions
 
-                    for row, edition_data in enumerate(editions):
-                        col = 0
-                        
-                        # Select checkbox
-                        checkbox = QCheckBox()
-                        checkbox.setStyleSheet("QCheckBox { margin-left: 8px; }")
-                        checkbox_widget = QWidget()
-                        checkbox_layout = QHBoxLayout(checkbox_widget)
-                        checkbox_layout.addWidget(checkbox)
-                        checkbox_layout.setContentsMargins(0, 0, 0, 0)
-                        checkbox_layout.setAlignment(Qt.AlignCenter)
-                        
-                        # Connect checkbox to handler
-                        checkbox.stateChanged.connect(lambda state, ed_id=edition_data.get('id', f'row_{row}'): 
-                                                     self._on_edition_checkbox_changed(ed_id, state))
-                        
-                        self.editions_table_widget.setCellWidget(row, col, checkbox_widget)
-                        col += 1
-                        
-                        # id (make clickable to edition edit page)
-                        edition_id = edition_data.get('id', 'N/A')
-                        if edition_id != 'N/A':
-                            edition_url = f"https://hardcover.app/editions/{edition_id}/edit"
-                            id_label = ClickableLabel()
-                            id_label.setContent("", str(edition_id), edition_url)
-                            id_label.linkActivated.connect(self._open_web_link)
-                            self.editions_table_widget.setCellWidget(row, col, id_label)
-                        else:
-                            self.editions_table_widget.setItem(row, col, QTableWidgetItem(str(edition_id)))
-                        
-                        col += 1
+                    # Shape, size, fill and sort with repaints and item signals suspended,
+                    # so the table lays out and paints once instead of once per cell
+                    table = self.editions_table_widget
+                    # Contributor cells as (column, role, index), worked out once for all rows
+                    contributor_columns = [(col_idx, role, contributor_index)
+                                           for col_idx, (role, contributor_index) in sorted(contributor_role_map.items())]
+                    set_item = table.setItem
+                    # Per-cell callables bound to locals once rather than looked up for every cell
+                    new_item = QTableWidgetItem
+                    na_item = self._create_table_item_with_na_highlight
+                    tooltip_item = self._create_table_item_with_tooltip
+                    set_cell_widget = table.setCellWidget
+                    with _bulk_update(table):
+                        table.setColumnCount(len(all_headers))
+                        table.setHorizontalHeaderLabels(all_headers)
+                        table.setRowCount(len(editions))
+                        # Fixed widths; measuring cell text on every fetch is too slow for large books
+                        table.apply_column_widths(all_headers)
                         
-                        # score
-                        score_value = edition_data.get('score')
-                        if score_value is not None:
-                            score_item = NumericTableWidgetItem(str(score_value), score_value)
-                        else:
-                            score_item = self._create_table_item_with_na_highlight('N/A', 'score', edition_data)
-                        # Store the original data index AND the book_mappings with this item
-                        score_item.setData(Qt.UserRole + 1, row)  # row is the index in editions_data
-                        score_item.setData(Qt.UserRole + 2, edition_data.get('book_mappings', []))  # Store mappings directly
-                        self.editions_table_widget.setItem(row, col, score_item)
-                        col += 1
-                        
-                        # title (may be long, use truncation)
-                        title_item = self._create_table_item_with_tooltip(edition_data.get('title', 'N/A'))
-                        self.editions_table_widget.setItem(row, col, title_item)
-                        col += 1
+                        for row, edition_data in enumerate(editions):
+                            col = 0
                         
-                        # subtitle (may be long, use truncation)
-                        subtitle = edition_data.get('subtitle')
-                        if subtitle:
-                            subtitle_item = self._create_table_item_with_tooltip(subtitle)
-                        else:
-                            subtitle_item = self._create_table_item_with_na_highlight('N/A', 'subtitle', edition_data)
-                            # For long fields, preserve tooltip functionality
-                            if len('N/A') > 50:  # Won't happen but keep pattern
-                                subtitle_item.setToolTip('N/A')
-                        self.editions_table_widget.setItem(row, col, subtitle_item)
-                        col += 1
+                            # Select checkbox
+                            checkbox = QCheckBox()
+                            checkbox.setStyleSheet(SELECT_CHECKBOX_STYLE)
+                            checkbox_widget = QWidget()
+                            checkbox_layout = QHBoxLayout(checkbox_widget)
+                            checkbox_layout.addWidget(checkbox)
+                            checkbox_layout.setContentsMargins(0, 0, 0, 0)
+                            checkbox_layout.setAlignment(Qt.AlignCenter)
                         
-                        # Cover Image?
-                        image_data = edition_data.get('image')
-                        has_cover = bool(image_data and image_data.get('url'))
-                        self.editions_table_widget.setItem(row, col, QTableWidgetItem("Yes" if has_cover else "No"))
-                        col += 1
-                        
-                        # isbn_10
-                        isbn_10 = edition_data.get('isbn_10')
-                        if isbn_10:
-                            isbn_10_item = QTableWidgetItem(isbn_10)
-                        else:
-                            isbn_10_item = self._create_table_item_with_na_highlight('N/A', 'isbn_10', edition_data)
-                        self.editions_table_widget.setItem(row, col, isbn_10_item)
-                        col += 1
-                        
-                        # isbn_13
-                        isbn_13 = edition_data.get('isbn_13')
-                        if isbn_13:
-                            isbn_13_item = QTableWidgetItem(isbn_13)
-                        else:
-                            isbn_13_item = self._create_table_item_with_na_highlight('N/A', 'isbn_13', edition_data)
-                        self.editions_table_widget.setItem(row, col, isbn_13_item)
-                        col += 1
-                        
-                        # asin
-                        asin = edition_data.get('asin')
-                        if asin:
-                            asin_item = QTableWidgetItem(asin)
-                        else:
-                            asin_item = self._create_table_item_with_na_highlight('N/A', 'asin', edition_data)
-                        self.editions_table_widget.setItem(row, col, asin_item)
-                        col += 1
+                            # Connect checkbox to handler
+                            checkbox.stateChanged.connect(lambda state, ed_id=edition_data.get('id', f'row_{row}'): 
+                                                         self._on_edition_checkbox_changed(ed_id, state))
                         
-                        # Reading Format (transform reading_format_id)
-                        reading_format_id = edition_data.get('reading_format_id')
-                        reading_format_map = {1: "Physical Book", 2: "Audiobook", 4: "E-Book"}
-                        reading_format = reading_format_map.get(reading_format_id, "N/A" if reading_format_id is None else str(reading_format_id))
-                        self.editions_table_widget.setItem(row, col, QTableWidgetItem(reading_format))
-                        col += 1
+                            set_cell_widget(row, col, checkbox_widget)
+                            col += 1
                         
-                        # pages
-                        pages_value = edition_data.get('pages')
-                        if pages_value is not None:
-                            pages_item = NumericTableWidgetItem(str(pages_value), pages_value)
-                        else:
-                            pages_item = self._create_table_item_with_na_highlight('N/A', 'pages', edition_data)
-                        self.editions_table_widget.setItem(row, col, pages_item)
-                        col += 1
-                        
-                        # Duration (audio_seconds converted to HH:MM:SS)
-                        audio_seconds = edition_data.get('audio_seconds')
-                        if audio_seconds is not None and audio_seconds > 0:
-                            hours = audio_seconds // 3600
-                            minutes = (audio_seconds % 3600) // 60
-                            seconds = audio_seconds % 60
-                            duration_str = f"{hours:02d}:{minutes:02d}:{seconds:02d}"
-                            duration_item = NumericTableWidgetItem(duration_str, audio_seconds)
-                        else:
-                            duration_item = self._create_table_item_with_na_highlight("N/A", 'duration', edition_data)
-                        self.editions_table_widget.setItem(row, col, duration_item)
-                        col += 1
-                        
-                        # edition_format
-                        edition_format = edition_data.get('edition_format')
-                        if edition_format:
-                            edition_format_item = QTableWidgetItem(edition_format)
-                        else:
-                            edition_format_item = self._create_table_item_with_na_highlight('N/A', 'edition_format', edition_data)
-                        self.editions_table_widget.setItem(row, col, edition_format_item)
-                        col += 1
-                        
-                        # edition_information (may be long, use truncation)
-                        edition_info = edition_data.get('edition_information')
-                        if edition_info:
-                            edition_info_item = self._create_table_item_with_tooltip(edition_info)
-                        else:
-                            edition_info_item = self._create_table_item_with_na_highlight('N/A', 'edition_information', edition_data)
-                            # For long fields, preserve tooltip functionality
-                            if len('N/A') > 50:  # Won't happen but keep pattern
-                                edition_info_item.setToolTip('N/A')
-                        self.editions_table_widget.setItem(row, col, edition_info_item)
-                        col += 1
-                        
-                        # release_date (format as MM/DD/YYYY)
-                        release_date = edition_data.get('release_date')
-                        if release_date:
-                            try:
-                                # Assuming format is YYYY-MM-DD from API
-                                date_obj = datetime.strptime(release_date, '%Y-%m-%d')
-                                formatted_date = date_obj.strftime('%m/%d/%Y')
-                            except (ValueError, TypeError):
-                                formatted_date = release_date  # Use as-is if parsing fails
-                            release_date_item = QTableWidgetItem(formatted_date)
-                        else:
-                            release_date_item = self._create_table_item_with_na_highlight("N/A", 'release_date', edition_data)
-                        self.editions_table_widget.setItem(row, col, release_date_item)
-                        col += 1
+                            # id (make clickable to edition edit page)
+                            edition_id = edition_data.get('id', 'N/A')
+                            if edition_id != 'N/A':
+                                edition_url = f"https://hardcover.app/editions/{edition_id}/edit"
+                                id_label = ClickableLabel()
+                                id_label.setContent("", str(edition_id), edition_url)
+                                id_label.linkActivated.connect(self._open_web_link)
+                                set_cell_widget(row, col, id_label)
+                            else:
+                                set_item(row, col, new_item(str(edition_id)))
                         
-                        # Publisher
-                        publisher_name = edition_data.get('publisher', {}).get('name', 'N/A') if edition_data.get('publisher') else 'N/A'
-                        if publisher_name != 'N/A':
-                            publisher_item = QTableWidgetItem(publisher_name)
-                        else:
-                            publisher_item = self._create_table_item_with_na_highlight('N/A', 'publisher', edition_data)
-                        self.editions_table_widget.setItem(row, col, publisher_item)
-                        col += 1
+                            col += 1
                         
-                        # Language
-                        language_name = edition_data.get('language', {}).get('language', 'N/A') if edition_data.get('language') else 'N/A'
-                        if language_name != 'N/A':
-                            language_item = QTableWidgetItem(language_name)
-                        else:
-                            language_item = self._create_table_item_with_na_highlight('N/A', 'language', edition_data)
-                        self.editions_table_widget.setItem(row, col, language_item)
-                        col += 1
+                            # score
+                            score_value = edition_data.get('score')
+                            if score_value is not None:
+                                score_item = NumericTableWidgetItem(str(score_value), score_value)
+                            else:
+                                score_item = na_item('N/A', 'score', edition_data)
+                            # Store the original data index AND the book_mappings with this item
+                            score_item.setData(Qt.UserRole + 1, row)  # row is the index in editions_data
+                            score_item.setData(Qt.UserRole + 2, edition_data.get('book_mappings', []))  # Store mappings directly
+                            set_item(row, col, score_item)
+                            col += 1
                         
-                        # Country
-                        country_name = edition_data.get('country', {}).get('name', 'N/A') if edition_data.get('country') else 'N/A'
-                        if country_name != 'N/A':
-                            country_item = QTableWidgetItem(country_name)
-                        else:
-                            country_item = self._create_table_item_with_na_highlight('N/A', 'country', edition_data)
-                        self.editions_table_widget.setItem(row, col, country_item)
-                        col += 1
+                            # title through Country, one cell per _EDITION_CELLS entry
+                            for col, (na_field, kind, value_of) in enumerate(_EDITION_CELLS, col):
+                                value = value_of(edition_data)
+                                if value is None:
+                                    item = na_item('N/A', na_field, edition_data)
+                                elif kind == 'numeric':
+                                    item = NumericTableWidgetItem(*value)
+                                elif kind == 'tooltip':
+                                    item = tooltip_item(value)
+                                else:
+                                    item = new_item(value)
+                                set_item(row, col, item)
                         
-                        # Populate contributor columns
-                        edition_id = edition_data.get('id')
-                        edition_contributors = contributors_by_edition.get(edition_id, {})
+                            # Populate contributor columns
+                            edition_id = edition_data.get('id')
+                            edition_contributors = contributors_by_edition.get(edition_id, {})
                         
-                        # For each contributor column
-                        for col_idx in range(len(static_headers), len(all_headers)):
-                            if col_idx in contributor_role_map:
-                                role, contributor_index = contributor_role_map[col_idx]
-                                contributors_for_role = edition_contributors.get(role, [])
-                                
+                            # For each contributor column
+                            for col_idx, role, contributor_index in contributor_columns:
+                                contributors_for_role = edition_contributors.get(role, ())
+                            
                                 if contributor_index < len(contributors_for_role):
                                     contributor_name = contributors_for_role[contributor_index]
-                                    self.editions_table_widget.setItem(row, col_idx, QTableWidgetItem(contributor_name))
+                                    set_item(row, col_idx, new_item(contributor_name))
                                 else:
-                                    self.editions_table_widget.setItem(row, col_idx, QTableWidgetItem("N/A"))
+                                    set_item(row, col_idx, new_item("N/A"))
                     
-                    # Default sort by score column (descending)
-                    score_column = all_headers.index("score")
-                    self.editions_table_widget.sortItems(score_column, Qt.DescendingOrder)
+                        # Default sort by score column (descending)
+                        score_column = all_headers.index("score")
+                        self.editions_table_widget.sortItems(score_column, Qt.DescendingOrder)
+
                     # Set initial sort indicator
                     self.editions_table_widget.column_sort_order[score_column] = Qt.DescendingOrder
                     self.editions_table_widget._update_header_text(score_column)
@@ -1264,43 +1336,41 @@ class MainWindow(QMainWindow):
                     # Enable scrolling (should be enabled by default, but let's be explicit)
                     self.editions_table_widget.setHorizontalScrollBarPolicy(Qt.ScrollBarAsNeeded)
                     self.editions_table_widget.setVerticalScrollBarPolicy(Qt.ScrollBarAsNeeded)
-                    
-                    # Adjust column widths
-                    self.editions_table_widget.resizeColumnsToContents()
                 else:
                     # Clear table if no editions data
-                    self.editions_table_widget.setRowCount(0)
-                    self.editions_table_widget.setColumnCount(0)
+                    with _bulk_update(self.editions_table_widget):
+                        self.editions_table_widget.setRowCount(0)
+                        self.editions_table_widget.setColumnCount(0)
             else:
                 # This case might occur if ApiClient returns None for reasons other than exceptions
                 # (e.g., no token, which is handled inside ApiClient for now)
-                self.status_bar.showMessage(f"No data returned for Book ID {book_id_str}.")
-                logger.warning(f"No data returned by ApiClient for Book ID {book_id_int}, but no exception was raised.")
+                self._report(logging.WARNING, f"No data returned for Book ID {book_id_str}.",
+                             f"No data returned by ApiClient for Book ID {book_id_int}, but no exception was raised.")
         except ApiNotFoundError as e:
-            self.status_bar.showMessage(f"Book ID {book_id_int} not found.")
-            logger.warning(f"API_CLIENT_ERROR - ApiNotFoundError for Book ID {book_id_int}: {e}")
+            self._report(logging.WARNING, f"Book ID {book_id_int} not found.",
+                         f"API_CLIENT_ERROR - ApiNotFoundError for Book ID {book_id_int}: {e}")
         except ApiAuthError as e:
-            self.status_bar.showMessage("API Authentication Failed. Please check your Bearer Token.")
-            logger.error(f"API_CLIENT_ERROR - Authentication error for Book ID {book_id_int}: {e}")
+            self._report(logging.ERROR, "API Authentication Failed. Please check your Bearer Token.",
+                         f"API_CLIENT_ERROR - Authentication error for Book ID {book_id_int}: {e}")
         except NetworkError as e:
             # Check if it's a rate limit error
             if hasattr(e, 'response') and e.response and e.response.status_code == 429:
-                self.status_bar.showMessage("API rate limit exceeded. Please try again later.")
-                logger.warning(f"API_CLIENT_ERROR - Rate limit exceeded for Book ID {book_id_int}")
+                self._report(logging.WARNING, "API rate limit exceeded. Please try again later.",
+                             f"API_CLIENT_ERROR - Rate limit exceeded for Book ID {book_id_int}")
             else:
-                self.status_bar.showMessage("Network error. Unable to connect to Hardcover.app API. Please check your internet connection.")
-                logger.error(f"API_CLIENT_ERROR - Network error for Book ID {book_id_int}: {e}")
+                self._report(logging.ERROR, "Network error. Unable to connect to Hardcover.app API. Please check your internet connection.",
+                             f"API_CLIENT_ERROR - Network error for Book ID {book_id_int}: {e}")
         except ApiProcessingError as e:
             # Show detailed error dialog for unexpected API responses
             error_details = f"ApiProcessingError: {str(e)}\n\nBook ID: {book_id_int}"
             QMessageBox.critical(self, "API Error", 
                                f"An unexpected error occurred. Please copy the details below and report this issue:\n\n{error_details}")
-            self.status_bar.showMessage("An unexpected API error occurred. See dialog for details.")
-            logger.error(f"API_CLIENT_ERROR - Processing error for Book ID {book_id_int}: {e}")
+            self._report(logging.ERROR, "An unexpected API error occurred. See dialog for details.",
+                         f"API_CLIENT_ERROR - Processing error for Book ID {book_id_int}: {e}")
         except ApiException as e:
             # Generic API exception
-            self.status_bar.showMessage(f"API error: {e}")
-            logger.error(f"API_CLIENT_ERROR - Generic API exception for Book ID {book_id_int}: {e}")
+            self._report(logging.ERROR, f"API error: {e}",
+                         f"API_CLIENT_ERROR - Generic API exception for Book ID {book_id_int}: {e}")
         except Exception as e:
             # Catch any other unexpected errors
             error_details = f"{type(e).__name__}: {str(e)}\n\nBook ID: {book_id_int}"
@@ -1309,6 +1379,55 @@ class MainWindow(QMainWindow):
             self.status_bar.showMessage("An unexpected error occurred. See dialog for details.")
             logger.exception(f"Unexpected error while fetching Book ID {book_id_int}: {e}")
 
+    def _report(self, level: int, user_msg: str, log_msg: str = None):
+        """Show user_msg in the status bar and log log_msg (or user_msg) at the given level."""
+        self.status_bar.showMessage(user_msg)
+        logger.log(level, log_msg if log_msg else user_msg)
+
+    def _request_cover(self, url: str):
+        """
+        Show the cover for a URL, loading it on a background thread.
+        """
+        self._requested_cover_url = url
+        fetcher = CoverFetcher(self.image_downloader, url)
+        # Keep our own reference so the signals object outlives the pool's run
+        fetcher.setAutoDelete(False)
+        fetcher.signals.done.connect(self._on_cover_ready)
+        self._cover_fetchers.add(fetcher)
+        QThreadPool.globalInstance().start(fetcher)
+
+    def _on_cover_ready(self, url: str, image, fetcher=None):
+        """
+        Convert a loaded cover to a QPixmap on the GUI thread and show it if still wanted.
+        Only the CoverFetcher that finished is released; another one for the same
+        URL may still be running.
+        """
+        self._cover_fetchers.discard(fetcher)
+        if image is None or image.isNull():
+            if url == self._requested_cover_url:
+                self._show_cover(None)
+            return
+        pixmap = QPixmap.fromImage(image)
+        if url == self._requested_cover_url:
+            self._show_cover(pixmap)
+
+    def _show_cover(self, pixmap):
+        """
+        Display a cover pixmap, or a placeholder message when it is None.
+        Does nothing while the window has no actual_cover_display_label.
+        """
+        if not hasattr(self, 'actual_cover_display_label'):
+            return
+        if pixmap is not None and not pixmap.isNull():
+            self.actual_cover_display_label.setPixmap(pixmap.scaled( # Optional scaling
+                self.actual_cover_display_label.size(),
+                Qt.KeepAspectRatio,
+                Qt.SmoothTransformation
+            ))
+        else:
+            self.actual_cover_display_label.setText("Cover not available") # Or clear it
+
+    @pyqtSlot(str)
     def _open_web_link(self, url: str):
         """Opens the given URL in the default web browser."""
         if url:
@@ -1390,20 +1509,17 @@ class MainWindow(QMainWindow):
             "Narrator", "Foreword", "Cover Artist", "Other"
         ]
         
-        # Dictionary to track all unique roles found across all editions
-        all_roles = set()
-        
         # Dictionary to store contributors by edition and role
         contributors_by_edition = {}
         
-        # Track maximum contributors per role
+        # Track maximum contributors per role; its keys are every role found in any edition
         max_contributors_per_role = {}
         
         for edition in editions:
             edition_id = edition.get('id')
-            contributors_by_edition[edition_id] = {}
+            edition_roles = contributors_by_edition[edition_id] = {}
             
-            cached_contributors = edition.get('cached_contributors', [])
+            cached_contributors = edition.get('cached_contributors', ())
             
             # Process each contributor
             for contributor in cached_contributors:
@@ -1423,26 +1539,18 @@ class MainWindow(QMainWindow):
                 else:
                     role = contribution
                     
-                # Add role to all_roles set
-                all_roles.add(role)
-                
                 # Initialize role list if needed
-                if role not in contributors_by_edition[edition_id]:
-                    contributors_by_edition[edition_id][role] = []
+                role_contributors = edition_roles.get(role)
+                if role_contributors is None:
+                    role_contributors = edition_roles[role] = []
                 
-                contributors_by_edition[edition_id][role].append(name)
-        
-        # Calculate max contributors per role
-        for edition_id, roles_dict in contributors_by_edition.items():
-            for role, contributors in roles_dict.items():
-                current_count = len(contributors)
-                if role not in max_contributors_per_role:
-                    max_contributors_per_role[role] = current_count
-                else:
-                    max_contributors_per_role[role] = max(max_contributors_per_role[role], current_count)
+                role_contributors.append(name)
+                # Keep the per-role maximum up to date here instead of in a second pass
+                if len(role_contributors) > max_contributors_per_role.get(role, 0):
+                    max_contributors_per_role[role] = len(role_contributors)
         
         # Filter to only include predefined roles that actually exist
-        active_roles = [role for role in predefined_roles if role in all_roles]
+        active_roles = [role for role in predefined_roles if role in max_contributors_per_role]
         
         return {
             'active_roles': active_roles,
@@ -1475,9 +1583,25 @@ class MainWindow(QMainWindow):
         
         return item
 
+    def _add_info_label(self, layout, attr: str, object_name: str, prefix: str,
+                        link_field: str = None, initial_value: str = "Not Fetched"):
+        """Create one book info label, store it as self.<attr> and add it to layout."""
+        if link_field:
+            label = ClickableLabel(self)
+            label.setContent(prefix, initial_value, "", field_name=link_field)
+            label.linkActivated.connect(self._open_web_link)
+        else:
+            label = QLabel()
+            label.setTextFormat(Qt.RichText)
+            label.setText(self._format_label_text(prefix, initial_value))
+        label.setObjectName(object_name)
+        setattr(self, attr, label)
+        layout.addWidget(label)
+        return label
+
     def _format_label_text(self, label: str, value: str) -> str:
         """Format label text with dimmed label and prominent value."""
-        return f"<span style='color:#999999;'>{label}</span><span style='color:#e0e0e0;'>{value}</span>"
+        return LABEL_TMPL % (label, value)
     
     def _format_label_text_with_na_highlight(self, label: str, value: str, field_name: str) -> str:
         """
@@ -1491,18 +1615,12 @@ class MainWindow(QMainWindow):
         Returns:
             HTML-formatted string with appropriate styling
         """
-        from librarian_assistant.ui_utils import should_highlight_general_info_na
-        from librarian_assistant.styling_constants import get_na_highlight_html
-        
         # Check if this is an N/A value that should be highlighted
         if value == "N/A" and should_highlight_general_info_na(field_name):
             # Use highlighted N/A
-            value_html = get_na_highlight_html(value)
-        else:
-            # Use normal styling
-            value_html = f"<span style='color:#e0e0e0;'>{value}</span>"
-        
-        return f"<span style='color:#999999;'>{label}</span>{value_html}"
+            return LABEL_PREFIX_TMPL % (label, get_na_highlight_html(value))
+        # Use normal styling
+        return LABEL_TMPL % (label, value)
     
     def _create_table_item_with_na_highlight(self, text: str, field_name: str, edition_context: dict = None) -> QTableWidgetItem:
         """
@@ -1516,34 +1634,29 @@ class MainWindow(QMainWindow):
         Returns:
             QTableWidgetItem with appropriate styling
         """
-        from librarian_assistant.ui_utils import is_na_highlightable
-        from librarian_assistant.styling_constants import N_A_HIGHLIGHT_TEXT_COLOR_HEX, N_A_HIGHLIGHT_BG_COLOR_HEX
-        
         item = QTableWidgetItem(text)
         
         # Apply N/A highlighting if appropriate
         if text == "N/A" and is_na_highlightable(field_name, edition_context):
-            # Set text color and background color for highlighting
-            item.setForeground(QColor(N_A_HIGHLIGHT_TEXT_COLOR_HEX))
-            item.setBackground(QColor(N_A_HIGHLIGHT_BG_COLOR_HEX))
-            
-            # Set italic font
-            font = item.font()
-            font.setItalic(True)
+            # Shared brushes and font; Qt's implicit sharing means items don't copy them
+            foreground, background, font = self._na_highlight_style()
+            item.setForeground(foreground)
+            item.setBackground(background)
             item.setFont(font)
         
         return item
     
-    def _clear_layout(self, layout: QVBoxLayout | None):
-        """
-        Removes all widgets from the given layout.
-        """
-        if layout is not None:
-            while layout.count():
-                item = layout.takeAt(0)
-                widget = item.widget()
-                if widget is not None:
-                    widget.deleteLater()
+    def _na_highlight_style(self):
+        """Return the (foreground, background, font) used for highlighted N/A cells, built once."""
+        style = self._na_highlight_style_cache
+        if style is None:
+            font = QTableWidgetItem().font()
+            font.setItalic(True)
+            style = (QBrush(QColor(N_A_HIGHLIGHT_TEXT_COLOR_HEX)),
+                     QBrush(QColor(N_A_HIGHLIGHT_BG_COLOR_HEX)),
+                     font)
+            self._na_highlight_style_cache = style
+        return style
     
     def _on_configure_columns(self):
         """
@@ -1586,9 +1699,8 @@ class MainWindow(QMainWindow):
         # Store column widths
         column_widths = {}
         for col in range(col_count):
-            header = self.editions_table_widget.horizontalHeaderItem(col)
-            if header:
-                col_name = header.text().replace(" ▲", "").replace(" ▼", "")
+            col_name = self.editions_table_widget.header_name(col)
+            if col_name is not None:
                 column_widths[col_name] = self.editions_table_widget.columnWidth(col)
         
         # Store all current data including checkbox states
@@ -1605,71 +1717,71 @@ class MainWindow(QMainWindow):
                     checkbox_states[row] = checkbox.isChecked()
             
             for col in range(col_count):
-                header = self.editions_table_widget.horizontalHeaderItem(col)
-                if header:
-                    col_name = header.text().replace(" ▲", "").replace(" ▼", "")
+                col_name = self.editions_table_widget.header_name(col)
+                if col_name is not None:
                     item = self.editions_table_widget.item(row, col)
                     if item:
                         row_data[col_name] = item.text()
             table_data.append(row_data)
         
         # Clear and reconfigure table
-        self.editions_table_widget.setColumnCount(len(new_visible_columns))
-        self.editions_table_widget.setHorizontalHeaderLabels(new_visible_columns)
-        
-        # Repopulate with reordered data
-        for row, row_data in enumerate(table_data):
-            for col, col_name in enumerate(new_visible_columns):
-                if col_name == "Select":
-                    # Recreate checkbox widget
-                    checkbox = QCheckBox()
-                    checkbox.setStyleSheet("QCheckBox { margin-left: 8px; }")
-                    checkbox_widget = QWidget()
-                    checkbox_layout = QHBoxLayout(checkbox_widget)
-                    checkbox_layout.addWidget(checkbox)
-                    checkbox_layout.setContentsMargins(0, 0, 0, 0)
-                    checkbox_layout.setAlignment(Qt.AlignCenter)
-                    
-                    # Restore checkbox state
-                    if row in checkbox_states:
-                        checkbox.setChecked(checkbox_states[row])
-                    
-                    # Get edition ID for this row
-                    edition_id = None
-                    if row < len(self.editions_data):
-                        edition_id = self.editions_data[row].get('id', f'row_{row}')
-                    
-                    # Connect checkbox to handler
-                    if edition_id:
-                        checkbox.stateChanged.connect(lambda state, ed_id=edition_id: 
-                                                     self._on_edition_checkbox_changed(ed_id, state))
-                    
-                    self.editions_table_widget.setCellWidget(row, col, checkbox_widget)
-                else:
-                    value = row_data.get(col_name, "N/A")
-                    # Check if this was a numeric column
-                    if col_name == "score" or col_name == "pages":
-                        try:
-                            numeric_value = float(value) if value != "N/A" else None
-                            item = NumericTableWidgetItem(value, numeric_value)
-                        except (ValueError, TypeError):
-                            item = QTableWidgetItem(value)
-                    elif col_name == "Duration" and value != "N/A":
-                        # Preserve numeric sorting for duration
-                        # Extract seconds from HH:MM:SS format
-                        try:
-                            parts = value.split(":")
-                            if len(parts) == 3:
-                                seconds = int(parts[0]) * 3600 + int(parts[1]) * 60 + int(parts[2])
-                                item = NumericTableWidgetItem(value, seconds)
-                            else:
+        with _bulk_update(self.editions_table_widget):
+            self.editions_table_widget.setColumnCount(len(new_visible_columns))
+            self.editions_table_widget.setHorizontalHeaderLabels(new_visible_columns)
+            
+            # Repopulate with reordered data
+            for row, row_data in enumerate(table_data):
+                for col, col_name in enumerate(new_visible_columns):
+                    if col_name == "Select":
+                        # Recreate checkbox widget
+                        checkbox = QCheckBox()
+                        checkbox.setStyleSheet(SELECT_CHECKBOX_STYLE)
+                        checkbox_widget = QWidget()
+                        checkbox_layout = QHBoxLayout(checkbox_widget)
+                        checkbox_layout.addWidget(checkbox)
+                        checkbox_layout.setContentsMargins(0, 0, 0, 0)
+                        checkbox_layout.setAlignment(Qt.AlignCenter)
+                        
+                        # Restore checkbox state
+                        if row in checkbox_states:
+                            checkbox.setChecked(checkbox_states[row])
+                        
+                        # Get edition ID for this row
+                        edition_id = None
+                        if row < len(self.editions_data):
+                            edition_id = self.editions_data[row].get('id', f'row_{row}')
+                        
+                        # Connect checkbox to handler
+                        if edition_id:
+                            checkbox.stateChanged.connect(lambda state, ed_id=edition_id: 
+                                                         self._on_edition_checkbox_changed(ed_id, state))
+                        
+                        self.editions_table_widget.setCellWidget(row, col, checkbox_widget)
+                    else:
+                        value = row_data.get(col_name, "N/A")
+                        # Check if this was a numeric column
+                        if col_name == "score" or col_name == "pages":
+                            try:
+                                numeric_value = float(value) if value != "N/A" else None
+                                item = NumericTableWidgetItem(value, numeric_value)
+                            except (ValueError, TypeError):
+                                item = QTableWidgetItem(value)
+                        elif col_name == "Duration" and value != "N/A":
+                            # Preserve numeric sorting for duration
+                            # Extract seconds from HH:MM:SS format
+                            try:
+                                parts = value.split(":")
+                                if len(parts) == 3:
+                                    seconds = int(parts[0]) * 3600 + int(parts[1]) * 60 + int(parts[2])
+                                    item = NumericTableWidgetItem(value, seconds)
+                                else:
+                                    item = QTableWidgetItem(value)
+                            except (ValueError, IndexError, TypeError):
                                 item = QTableWidgetItem(value)
-                        except (ValueError, IndexError, TypeError):
+                        else:
                             item = QTableWidgetItem(value)
-                    else:
-                        item = QTableWidgetItem(value)
-                    
-                    self.editions_table_widget.setItem(row, col, item)
+                        
+                        self.editions_table_widget.setItem(row, col, item)
         
         # Restore column widths where possible
         for col, col_name in enumerate(new_visible_columns):
@@ -1715,15 +1827,16 @@ class MainWindow(QMainWindow):
         hidden_count = 0
         total_rows = self.editions_table_widget.rowCount()
         
-        for row in range(total_rows):
-            # Check if row matches filters
-            row_visible = self._row_matches_filters(row, filters, logic_mode)
-            
-            # Show/hide row
-            self.editions_table_widget.setRowHidden(row, not row_visible)
-            
-            if not row_visible:
-                hidden_count += 1
+        with _bulk_update(self.editions_table_widget):
+            for row in range(total_rows):
+                # Check if row matches filters
+                row_visible = self._row_matches_filters(row, filters, logic_mode)
+                
+                # Show/hide row
+                self.editions_table_widget.setRowHidden(row, not row_visible)
+                
+                if not row_visible:
+                    hidden_count += 1
         
         # Update status
         visible_count = total_rows - hidden_count
@@ -1758,12 +1871,7 @@ class MainWindow(QMainWindow):
             filter_value = filter_data['value']
             
             # Find column index
-            col_index = None
-            for col in range(self.editions_table_widget.columnCount()):
-                header = self.editions_table_widget.horizontalHeaderItem(col)
-                if header and header.text().replace(" ▲", "").replace(" ▼", "") == column_name:
-                    col_index = col
-                    break
+            col_index = self.editions_table_widget.column_index(column_name)
             
             if col_index is None:
                 continue
@@ -1883,8 +1991,9 @@ class MainWindow(QMainWindow):
         self.filter_logic_mode = 'AND'
         
         # Show all rows
-        for row in range(self.editions_table_widget.rowCount()):
-            self.editions_table_widget.setRowHidden(row, False)
+        with _bulk_update(self.editions_table_widget):
+            for row in range(self.editions_table_widget.rowCount()):
+                self.editions_table_widget.setRowHidden(row, False)
         
         self.status_bar.showMessage("Filters cleared.", 3000)
     
@@ -1911,14 +2020,100 @@ class MainWindow(QMainWindow):
         # Apply current search filter if any
         search_text = self.history_search_box.text()
         if search_text:
-            sorted_entries = [entry for entry in sorted_entries 
-                            if search_text.lower() in str(entry['book_id']) or 
-                               search_text.lower() in entry['book_title'].lower()]
+            matching_ids = {entry['book_id'] for entry in self.history_manager.search_history(search_text)}
+            sorted_entries = [entry for entry in sorted_entries if entry['book_id'] in matching_ids]
         
         self._display_history_entries(sorted_entries)
     
+    def _build_history_tab(self) -> QWidget:
+        """Create the History tab widgets (search, sort, clear and the history list)."""
+        self.history_tab_content = QWidget()
+        history_layout = QVBoxLayout(self.history_tab_content)
+        
+        # History controls
+        history_controls_layout = QHBoxLayout()
+        
+        # Search/filter box
+        self.history_search_box = QLineEdit()
+        self.history_search_box.setPlaceholderText("Search history...")
+        self.history_search_box.textChanged.connect(self._filter_history)
+        history_controls_layout.addWidget(QLabel("Search:"))
+        history_controls_layout.addWidget(self.history_search_box)
+        
+        # Sort dropdown
+        self.history_sort_combo = QComboBox()
+        self.history_sort_combo.addItems(["Sort by Book ID", "Sort by Title", "Sort by Date (Newest First)"])
+        self.history_sort_combo.currentTextChanged.connect(self._sort_history)
+        history_controls_layout.addWidget(self.history_sort_combo)
+        
+        # Clear history button
+        self.clear_history_button = QPushButton("Clear History")
+        self.clear_history_button.clicked.connect(self._clear_history)
+        history_controls_layout.addWidget(self.clear_history_button)
+        
+        history_controls_layout.addStretch()
+        history_layout.addLayout(history_controls_layout)
+        
+        # History list
+        self.history_list = QTableWidget()
+        self.history_list.setColumnCount(3)
+        self.history_list.setHorizontalHeaderLabels(["Book ID", "Title", "Date Searched"])
+        self.history_list.setSelectionBehavior(QTableWidget.SelectRows)
+        self.history_list.horizontalHeader().setStretchLastSection(True)
+        self.history_list.itemDoubleClicked.connect(self._on_history_item_double_clicked)
+        history_layout.addWidget(self.history_list)
+        
+        # Instructions
+        history_instructions = QLabel("Double-click a book to search it again.")
+        history_instructions.setStyleSheet(HINT_STYLE)
+        history_layout.addWidget(history_instructions)
+        
+        return self.history_tab_content
+    
+    def _maybe_build_history_tab(self, index):
+        """Build the History tab on first activation and populate it when first shown."""
+        widget = self.tab_widget.widget(index)
+        if widget is self._history_placeholder and not self._history_built:
+            self._history_built = True
+            self._build_history_tab()
+            # Swapping tabs emits currentChanged again; the flag keeps this from re-entering
+            self.tab_widget.removeTab(index)
+            self.tab_widget.insertTab(index, self.history_tab_content, "History")
+            self.tab_widget.setCurrentIndex(index)
+            self._history_placeholder.deleteLater()
+            return
+        if not self._history_list_populated and widget is not None and widget is self.history_tab_content:
+            self._populate_history_list()
+    
+    def _flush_pending_history(self):
+        """Record all queued searches in the history with one batched update."""
+        searches = list(self._pending_history)
+        self._pending_history.clear()
+        if not searches or not self.history_manager:
+            return
+        try:
+            self.history_manager.add_searches(searches)
+        except Exception as e:
+            logger.error(f"Failed to save search history: {e}")
+            # Non-critical error - the book data is already displayed
+            self.status_bar.showMessage("Error saving search history.", 3000)  # Show for 3 seconds
+            return
+        if self._history_list_populated:
+            self._populate_history_list()  # Refresh history display
+    
+    def closeEvent(self, event):
+        """Write out queued and pending search history before the window closes."""
+        self._flush_pending_history()
+        if self.history_manager:
+            try:
+                self.history_manager.close()
+            except Exception as e:
+                logger.error(f"Failed to save search history: {e}")
+        super().closeEvent(event)
+    
     def _populate_history_list(self):
         """Populate the history list widget with saved searches."""
+        self._history_list_populated = True
         if self.history_manager:
             try:
                 history_entries = self.history_manager.get_history()
@@ -1960,28 +2155,29 @@ class MainWindow(QMainWindow):
     
     def _display_history_entries(self, entries: list):
         """Display the given history entries in the history table."""
-        self.history_list.setRowCount(len(entries))
-        
-        for row, entry in enumerate(entries):
-            # Book ID
-            book_id_item = QTableWidgetItem(str(entry['book_id']))
-            book_id_item.setTextAlignment(Qt.AlignCenter)
-            self.history_list.setItem(row, 0, book_id_item)
+        with _bulk_update(self.history_list):
+            self.history_list.setRowCount(len(entries))
             
-            # Title
-            title_item = QTableWidgetItem(entry['book_title'])
-            self.history_list.setItem(row, 1, title_item)
-            
-            # Date
-            try:
-                # Parse ISO format and display in readable format
-                search_time = datetime.fromisoformat(entry['search_time'])
-                date_str = search_time.strftime("%Y-%m-%d %H:%M:%S")
-            except (ValueError, KeyError):
-                date_str = "Unknown"
-            date_item = QTableWidgetItem(date_str)
-            date_item.setTextAlignment(Qt.AlignCenter)
-            self.history_list.setItem(row, 2, date_item)
+            for row, entry in enumerate(entries):
+                # Book ID
+                book_id_item = QTableWidgetItem(str(entry['book_id']))
+                book_id_item.setTextAlignment(Qt.AlignCenter)
+                self.history_list.setItem(row, 0, book_id_item)
+                
+                # Title
+                title_item = QTableWidgetItem(entry['book_title'])
+                self.history_list.setItem(row, 1, title_item)
+                
+                # Date
+                try:
+                    # Parse ISO format and display in readable format
+                    search_time = datetime.fromisoformat(entry['search_time'])
+                    date_str = search_time.strftime("%Y-%m-%d %H:%M:%S")
+                except (ValueError, KeyError):
+                    date_str = "Unknown"
+                date_item = QTableWidgetItem(date_str)
+                date_item.setTextAlignment(Qt.AlignCenter)
+                self.history_list.setItem(row, 2, date_item)
     
     def _on_edition_checkbox_changed(self, edition_id, state):
         """Handle checkbox state change for an edition."""
@@ -2007,7 +2203,7 @@ class MainWindow(QMainWindow):
         if not checked_ids:
             # Show placeholder
             self.book_mappings_placeholder = QLabel("Select editions from the Main View tab to display their book mappings here.")
-            self.book_mappings_placeholder.setStyleSheet("color: #888; font-style: italic; margin: 20px;")
+            self.book_mappings_placeholder.setStyleSheet(PLACEHOLDER_STYLE)
             self.book_mappings_placeholder.setAlignment(Qt.AlignCenter)
             self.book_mappings_layout.addWidget(self.book_mappings_placeholder)
             return
@@ -2026,15 +2222,7 @@ class MainWindow(QMainWindow):
             
             # Create card widget
             card = QGroupBox()
-            card.setStyleSheet("""
-                QGroupBox {
-                    background-color: #242424;
-                    border: 1px solid #3d3d3d;
-                    border-radius: 8px;
-                    margin: 10px;
-                    padding: 15px;
-                }
-            """)
+            card.setStyleSheet(MAPPING_CARD_STYLE)
             card_layout = QVBoxLayout(card)
             
             # Create title with edition info
@@ -2050,12 +2238,7 @@ class MainWindow(QMainWindow):
             
             title_text = f"Book ID: {book_id} | ISBN-10: {isbn_10} | ISBN-13: {isbn_13} | ASIN: {asin} | Format: {reading_format}"
             title_label = QLabel(title_text)
-            title_label.setStyleSheet("""
-                font-weight: bold;
-                font-size: 14px;
-                color: #ffffff;
-                margin-bottom: 10px;
-            """)
+            title_label.setStyleSheet(MAPPING_CARD_TITLE_STYLE)
             title_label.setWordWrap(True)
             card_layout.addWidget(title_label)
             
@@ -2063,7 +2246,7 @@ class MainWindow(QMainWindow):
             book_mappings = edition_data.get('book_mappings', [])
             if book_mappings:
                 mappings_label = QLabel("Book Mappings:")
-                mappings_label.setStyleSheet("font-weight: bold; margin-top: 5px;")
+                mappings_label.setStyleSheet(MAPPING_HEADER_STYLE)
                 card_layout.addWidget(mappings_label)
                 
                 for mapping in book_mappings:
@@ -2082,7 +2265,7 @@ class MainWindow(QMainWindow):
                         card_layout.addWidget(link_label)
             else:
                 no_mappings_label = QLabel("No book mappings available")
-                no_mappings_label.setStyleSheet("color: #888; font-style: italic;")
+                no_mappings_label.setStyleSheet(HINT_STYLE)
                 card_layout.addWidget(no_mappings_label)
             
             self.book_mappings_layout.addWidget(card)
@@ -2092,38 +2275,11 @@ class MainWindow(QMainWindow):
     
     def _get_external_url(self, platform, external_id):
         """Get the external URL for a given platform and ID."""
-        # Platform URL mappings from the accordion implementation
-        platform_urls = {
-            'goodreads': f'https://www.goodreads.com/book/show/{external_id}',
-            'openlibrary': f'https://openlibrary.org{external_id}' if external_id.startswith('/') else f'https://openlibrary.org/books/{external_id}',
-            'googlebooks': f'https://books.google.com/books?id={external_id}',
-            'bookshop': f'https://bookshop.org/books/{external_id}',
-            'amazon': f'https://www.amazon.com/dp/{external_id}',
-            'bookdepository': f'https://www.bookdepository.com/book/{external_id}',
-            'indiebound': f'https://www.indiebound.org/book/{external_id}',
-            'audible': f'https://www.audible.com/pd/{external_id}',
-            'kobo': f'https://www.kobo.com/ebook/{external_id}',
-            'scribd': f'https://www.scribd.com/book/{external_id}',
-            'librarything': f'https://www.librarything.com/work/{external_id}',
-            'storygraph': f'https://app.thestorygraph.com/books/{external_id}',
-            'bookwyrm': f'https://bookwyrm.social/book/{external_id}',
-            'wikidata': f'https://www.wikidata.org/wiki/{external_id}',
-            'wikipedia': f'https://en.wikipedia.org/wiki/{external_id}',
-            'isfdb': f'https://www.isfdb.org/cgi-bin/title.cgi?{external_id}',
-            'lccn': f'https://lccn.loc.gov/{external_id}',
-            'oclc': f'https://www.worldcat.org/oclc/{external_id}',
-            'dnb': f'https://portal.dnb.de/opac/showFullRecord?currentResultId={external_id}',
-            'trove': f'https://trove.nla.gov.au/work/{external_id}',
-            'jisc': f'https://discover.jisc.ac.uk/search?q={external_id}',
-            'k10plus': f'https://k10plus.de/DB=2.1/PPNSET?PPN={external_id}',
-        }
-        
-        platform_lower = platform.lower()
-        if platform_lower in platform_urls:
-            return platform_urls[platform_lower]
-        else:
-            # Default fallback - just search for the ID
-            return f'https://www.google.com/search?q={platform}+{external_id}'
+        builder = _PLATFORM_URL_BUILDERS.get(platform.lower())
+        if builder is not None:
+            return builder(external_id)
+        # Default fallback - just search for the ID
+        return f'https://www.google.com/search?q={platform}+{external_id}'
 
 def main():
     """
@@ -2158,7 +2314,7 @@ def main():
     logger.info(f"Log file: {log_file}")
     app = QApplication(sys.argv)
 
-    app.setStyleSheet(ENHANCED_DARK_THEME)
+    apply_theme(app)
     
     window = MainWindow()
     window.show()
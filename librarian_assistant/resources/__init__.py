@@ -0,0 +1,2 @@
+# ABOUTME: This file marks the resources directory as a package of bundled data files.
+# ABOUTME: It lets importlib.resources locate the .qss theme shipped with the application.
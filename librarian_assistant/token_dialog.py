@@ -2,8 +2,8 @@
 # ABOUTME: It provides a simple dialog with input field, OK, and Cancel buttons.
 
 from PyQt5.QtWidgets import (QDialog, QLabel, QLineEdit, QPushButton, 
-                             QVBoxLayout, QHBoxLayout, QDialogButtonBox)
-from PyQt5.QtCore import pyqtSignal, Qt
+                             QVBoxLayout, QDialogButtonBox)
+from PyQt5.QtCore import pyqtSignal
 
 class TokenDialog(QDialog):
     """